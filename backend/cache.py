@@ -1,25 +1,44 @@
-"""Valkey (Redis-compatible) cache wrapper for job data management."""
+"""Valkey (Redis-compatible) async cache wrapper for job data management."""
 import redis
+import redis.asyncio as aioredis
+import asyncio
 import json
+import time
+import uuid
 from typing import Any, Optional
 from datetime import datetime
 from config import settings
+from codec import encode_value, decode_value
+from local_cache import LocalCache
+from status_events import StatusBroadcaster
+from tracing import trace_methods
 
 
+JOB_QUEUE_KEY = "queue:jobs"
+JOB_PROCESSING_KEY = "queue:jobs:processing"
+JOB_LEASES_KEY = "queue:jobs:leases"
+RESULT_INDEX_KEY = "results:lru"
+JOB_INDEX_KEY = "jobs:index"
+JOB_UPLOADS_KEY = "jobs:uploads"
+UPLOAD_REFS_PREFIX = "uploadrefs:"
+LOCK_PREFIX = "lock:"
+EVENT_PREFIX = "events:"
+
+
+@trace_methods("cache")
 class ValkeyCache:
     """Valkey cache client for storing and retrieving job data."""
     
+    # Every API and worker process sees the same data (job queue, locks, events)
+    shared = True
+    
     def __init__(self):
-        """Initialize Redis connection pool."""
+        """Initialize the async Redis connection pool."""
         try:
-            self.client = redis.from_url(
-                settings.VALKEY_URL,
-                decode_responses=True,
-                encoding="utf-8",
-                socket_connect_timeout=1
-            )
-            # Test connection
-            self.client.ping()
+            # One blocking ping at startup decides between Valkey and the mock cache
+            probe = redis.from_url(settings.VALKEY_URL, socket_connect_timeout=1)
+            probe.ping()
+            probe.close()
         except (redis.ConnectionError, redis.TimeoutError):
             print("⚠️  Redis/Valkey not available, using mock cache")
             # Import and use mock cache instead
@@ -28,115 +47,547 @@ class ValkeyCache:
             # Replace all methods with mock methods
             self.__dict__.update(mock.__dict__)
             self.__class__ = mock.__class__
+            return
+        
+        # Bounded pool: bursts wait briefly for a free connection instead of failing
+        self.pool = aioredis.BlockingConnectionPool.from_url(
+            settings.VALKEY_URL,
+            decode_responses=True,
+            encoding="utf-8",
+            max_connections=settings.VALKEY_MAX_CONNECTIONS,
+            timeout=settings.VALKEY_POOL_TIMEOUT,
+            socket_connect_timeout=settings.VALKEY_CONNECT_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=30,
+            retry_on_timeout=True,
+        )
+        self.client = aioredis.Redis(connection_pool=self.pool)
+        self.hash_layout = settings.VALKEY_JOB_LAYOUT == "hash"
+        self.local = LocalCache(settings.LOCAL_CACHE_MAX_JOBS) if settings.LOCAL_CACHE_ENABLED else None
+        self.status_events = StatusBroadcaster()
+        self.status_listener = None
+        self.channel_events = StatusBroadcaster()
+        self.event_listener = None
+    
+    # ========================================================================
+    # Job Field Storage
+    # ========================================================================
+    #
+    # VALKEY_JOB_LAYOUT="keys" stores every field as job:{id}:{field}.
+    # VALKEY_JOB_LAYOUT="hash" stores them all in one hash job:{id}, so a job
+    # costs one key, one TTL and a single command to read or delete. Reads in
+    # hash mode fall back to the per-field keys so jobs written before a layout
+    # switch stay readable until they expire. In "keys" mode every field name
+    # is also recorded in the jobkeys:{id} set so delete_job never has to
+    # search the keyspace.
+    
+    async def _set_fields(self, job_id: str, fields: dict, event: Optional[dict] = None) -> None:
+        """Write already-encoded job fields (and publish `event`) in one round trip."""
+        if self.local:
+            self.local.invalidate(job_id)
+        pipeline = self.client.pipeline(transaction=False)
+        if self.hash_layout:
+            pipeline.hset(f"job:{job_id}", mapping=fields)
+            pipeline.expire(f"job:{job_id}", settings.VALKEY_TTL)
+        else:
+            for field, value in fields.items():
+                pipeline.set(f"job:{job_id}:{field}", value, ex=settings.VALKEY_TTL)
+            pipeline.sadd(f"jobkeys:{job_id}", *fields)
+            pipeline.expire(f"jobkeys:{job_id}", settings.VALKEY_TTL)
+        if event is not None:
+            pipeline.publish(f"status:{job_id}", json.dumps(event))
+        await pipeline.execute()
+    
+    async def _get_fields(self, job_id: str, fields: list[str]) -> list[Optional[str]]:
+        """Read raw job fields in one round trip (None for missing fields)."""
+        if not fields:
+            return []
+        legacy_keys = [f"job:{job_id}:{field}" for field in fields]
+        if not self.hash_layout:
+            return await self.client.mget(legacy_keys)
+        
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.hmget(f"job:{job_id}", fields)
+        pipeline.mget(legacy_keys)
+        hashed, legacy = await pipeline.execute()
+        return [value if value is not None else fallback for value, fallback in zip(hashed, legacy)]
     
     # ========================================================================
     # Job Status Management
     # ========================================================================
     
-    def set_job_status(self, job_id: str, status: str, message: str = "") -> None:
-        """Set job status and optional message."""
-        pipeline = self.client.pipeline()
-        pipeline.set(f"job:{job_id}:status", status, ex=settings.VALKEY_TTL)
+    async def set_job_status(self, job_id: str, status: str, message: str = "",
+                             progress: Optional[dict] = None) -> None:
+        """
+        Set job status, optional message and progress counters, and publish the
+        transition on status:{job_id}.
+        
+        Progress is stored as the job's `progress` field, so get_job_data() sees it too.
+        """
+        fields = {"status": status}
+        event = {"status": status, "message": message}
         if message:
-            pipeline.set(f"job:{job_id}:message", message, ex=settings.VALKEY_TTL)
-        pipeline.execute()
-    
-    def get_job_status(self, job_id: str) -> dict:
-        """Get job status and message."""
-        pipeline = self.client.pipeline()
-        pipeline.get(f"job:{job_id}:status")
-        pipeline.get(f"job:{job_id}:message")
-        status, message = pipeline.execute()
+            fields["message"] = message
+        if progress is not None:
+            fields["progress"] = encode_value(progress)
+            event["progress"] = progress
+        await self._set_fields(job_id, fields, event=event)
+    
+    async def get_job_status(self, job_id: str) -> dict:
+        """Get job status, message and progress."""
+        cached = self.get_local(job_id, "status")
+        if cached is not None:
+            return dict(cached)
         
-        return {
+        status, message, progress = await self._get_fields(job_id, ["status", "message", "progress"])
+        result = {
             "status": status,
-            "message": message or ""
+            "message": message or "",
+            "progress": decode_value(progress)
         }
+        if status is not None:
+            self.set_local(job_id, "status", dict(result), settings.LOCAL_CACHE_STATUS_TTL)
+        return result
+    
+    def subscribe_status(self, job_id: str):
+        """
+        Async context manager yielding a queue of the job's status events.
+        
+        One pattern subscription per process receives every job's transitions
+        and fans them out to local subscribers, so viewers do not each hold a
+        Valkey connection.
+        """
+        if self.status_listener is None or self.status_listener.done():
+            self.status_listener = asyncio.get_running_loop().create_task(self._listen_status_events())
+        return self.status_events.subscribe(job_id)
+    
+    async def _listen_status_events(self) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.psubscribe("status:*")
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        job_id = message["channel"][len("status:"):]
+                        self.status_events.publish(job_id, json.loads(message["data"]))
+            except redis.RedisError as e:
+                print(f"⚠️  Status event listener disconnected: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
     
     # ========================================================================
     # Job Data Management
     # ========================================================================
     
-    def set_job_data(self, job_id: str, key: str, value: Any) -> None:
+    async def set_job_data(self, job_id: str, key: str, value: Any) -> None:
         """Store job data as JSON."""
-        data = json.dumps(value) if not isinstance(value, str) else value
-        self.client.set(f"job:{job_id}:{key}", data, ex=settings.VALKEY_TTL)
+        await self._set_fields(job_id, {key: encode_value(value)})
     
-    def get_job_data(self, job_id: str, key: str) -> Optional[Any]:
+    async def get_job_data(self, job_id: str, key: str) -> Optional[Any]:
         """Retrieve job data and parse JSON if applicable."""
-        data = self.client.get(f"job:{job_id}:{key}")
-        if data is None:
-            return None
-        
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return data
+        data, = await self._get_fields(job_id, [key])
+        return decode_value(data)
     
-    def cache_exists(self, job_id: str, key: str) -> bool:
+    async def cache_exists(self, job_id: str, key: str) -> bool:
         """Check if a cache key exists."""
-        return self.client.exists(f"job:{job_id}:{key}") > 0
+        if not self.hash_layout:
+            return await self.client.exists(f"job:{job_id}:{key}") > 0
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.hexists(f"job:{job_id}", key)
+        pipeline.exists(f"job:{job_id}:{key}")
+        in_hash, legacy = await pipeline.execute()
+        return bool(in_hash) or legacy > 0
     
     # ========================================================================
     # Bulk Operations
     # ========================================================================
     
-    def set_multiple(self, job_id: str, data: dict) -> None:
+    async def set_multiple(self, job_id: str, data: dict) -> None:
         """Set multiple job data fields at once."""
-        pipeline = self.client.pipeline()
-        for key, value in data.items():
-            serialized = json.dumps(value) if not isinstance(value, str) else value
-            pipeline.set(f"job:{job_id}:{key}", serialized, ex=settings.VALKEY_TTL)
-        pipeline.execute()
+        if data:
+            await self._set_fields(job_id, {key: encode_value(value) for key, value in data.items()})
     
-    def get_multiple(self, job_id: str, keys: list[str]) -> dict:
+    async def get_multiple(self, job_id: str, keys: list[str]) -> dict:
         """Get multiple job data fields at once."""
-        pipeline = self.client.pipeline()
-        for key in keys:
-            pipeline.get(f"job:{job_id}:{key}")
-        
-        results = pipeline.execute()
-        output = {}
-        
-        for key, data in zip(keys, results):
-            if data is None:
-                output[key] = None
-            else:
-                try:
-                    output[key] = json.loads(data)
-                except (json.JSONDecodeError, TypeError):
-                    output[key] = data
-        
-        return output
+        results = await self._get_fields(job_id, keys)
+        return {key: decode_value(data) for key, data in zip(keys, results)}
     
     # ========================================================================
     # Job Initialization
     # ========================================================================
     
-    def initialize_job(self, job_id: str, input_type: str, raw_input: str) -> None:
-        """Initialize a new job with metadata."""
+    async def initialize_job(self, job_id: str, input_type: str, raw_input: str,
+                             upload_path: Optional[str] = None) -> None:
+        """Initialize a new job with metadata and register it for the sweeper."""
         data = {
             "type": input_type,
             "raw": raw_input,
             "created_at": datetime.utcnow().isoformat()
         }
-        self.set_multiple(job_id, data)
-        self.set_job_status(job_id, "INGESTED", "Job created successfully")
+        await self.set_multiple(job_id, data)
+        await self.set_job_status(job_id, "INGESTED", "Job created successfully")
+        
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.zadd(JOB_INDEX_KEY, {job_id: time.time()})
+        if upload_path:
+            pipeline.hset(JOB_UPLOADS_KEY, job_id, upload_path)
+            pipeline.sadd(f"{UPLOAD_REFS_PREFIX}{upload_path}", job_id)
+        await pipeline.execute()
+    
+    # ========================================================================
+    # Job Index (used by the sweeper to find expired jobs)
+    # ========================================================================
+    
+    async def get_stale_jobs(self, older_than: float, limit: int) -> list[str]:
+        """Job IDs registered (or last re-checked) before `older_than`."""
+        return await self.client.zrangebyscore(JOB_INDEX_KEY, "-inf", older_than, start=0, num=limit)
+    
+    async def track_job(self, job_id: str) -> None:
+        """Re-register a job that is still alive so it is checked again later."""
+        await self.client.zadd(JOB_INDEX_KEY, {job_id: time.time()})
+    
+    async def get_job_upload(self, job_id: str) -> Optional[str]:
+        """Path of the file uploaded for a job, if any."""
+        return await self.client.hget(JOB_UPLOADS_KEY, job_id)
+    
+    async def register_upload(self, job_id: str, upload_path: str) -> None:
+        """
+        Reference a stored upload for a job ahead of initialize_job().
+        
+        Taken before the file is published, so the sweeper never deletes a file
+        a new job is about to use; the job is indexed so the sweeper also drops
+        the reference if the job is never initialized.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.zadd(JOB_INDEX_KEY, {job_id: time.time()})
+        pipeline.hset(JOB_UPLOADS_KEY, job_id, upload_path)
+        pipeline.sadd(f"{UPLOAD_REFS_PREFIX}{upload_path}", job_id)
+        await pipeline.execute()
+    
+    async def release_upload(self, job_id: str, upload_path: str) -> int:
+        """
+        Drop a job's reference to a stored upload and return the references left.
+        
+        References are the set of job IDs using the file, so releasing twice
+        (e.g. a sweep retried after a crash) is harmless.
+        """
+        key = f"{UPLOAD_REFS_PREFIX}{upload_path}"
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.srem(key, job_id)
+        pipeline.scard(key)
+        _, remaining = await pipeline.execute()
+        return remaining
+    
+    async def count_upload_refs(self, upload_path: str) -> int:
+        """Number of jobs still using a stored upload."""
+        return await self.client.scard(f"{UPLOAD_REFS_PREFIX}{upload_path}")
+    
+    # ========================================================================
+    # Shared Entries (cross-job caches, indexes and counters)
+    # ========================================================================
+    
+    async def get_shared(self, key: str) -> Optional[Any]:
+        """Get a JSON value stored outside any job namespace."""
+        return decode_value(await self.client.get(key))
+    
+    async def get_many_shared(self, keys: list[str]) -> dict:
+        """Get several shared JSON values in one MGET (missing keys are left out)."""
+        values = await self.client.mget(keys) if keys else []
+        return {key: decode_value(value) for key, value in zip(keys, values) if value is not None}
+    
+    async def set_shared(self, key: str, value: Any, ttl: int) -> None:
+        """Store a JSON value outside any job namespace with its own TTL."""
+        await self.client.set(key, encode_value(value), ex=ttl)
+    
+    async def add_to_index(self, key: str, member: str, ttl: int, max_members: int) -> None:
+        """
+        Add a member that expires after `ttl` to an index.
+        
+        The index is a sorted set scored by expiry time: expired members are
+        dropped and only the `max_members` longest-lived ones are kept, so an
+        index written to forever still stays bounded.
+        """
+        now = time.time()
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.zadd(key, {member: now + ttl})
+        pipeline.zremrangebyscore(key, "-inf", now)
+        pipeline.zremrangebyrank(key, 0, -max_members - 1)
+        # The key lives as long as its longest-lived member
+        pipeline.expire(key, ttl, nx=True)
+        pipeline.expire(key, ttl, gt=True)
+        await pipeline.execute()
+    
+    async def get_index(self, key: str) -> set:
+        """Get the unexpired members of an index."""
+        return set(await self.client.zrangebyscore(key, time.time(), "+inf"))
+    
+    async def incr_counter(self, key: str, amount: int = 1) -> None:
+        """Increment a persistent counter."""
+        await self.client.incrby(key, amount)
+    
+    async def get_counters(self, keys: list[str]) -> dict:
+        """Read several counters at once (missing counters read as 0)."""
+        values = await self.client.mget(keys) if keys else []
+        return {key: int(value or 0) for key, value in zip(keys, values)}
+    
+    # ========================================================================
+    # Locks and Events (coordination between processes and nodes)
+    # ========================================================================
+    
+    async def acquire_lock(self, name: str, ttl: int) -> Optional[str]:
+        """
+        Take the named lock for at most `ttl` seconds without waiting.
+        
+        Returns a token for release_lock(), or None if another holder has it.
+        The TTL frees the lock if its holder dies.
+        """
+        token = uuid.uuid4().hex
+        acquired = await self.client.set(f"{LOCK_PREFIX}{name}", token, nx=True, ex=ttl)
+        return token if acquired else None
+    
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock if `token` still holds it (it may have expired and been re-taken)."""
+        key = f"{LOCK_PREFIX}{name}"
+        async with self.client.pipeline(transaction=True) as pipeline:
+            try:
+                await pipeline.watch(key)
+                if await pipeline.get(key) != token:
+                    return False
+                pipeline.multi()
+                pipeline.delete(key)
+                await pipeline.execute()
+                return True
+            except redis.WatchError:
+                return False
+    
+    async def publish_event(self, channel: str, event: Any) -> None:
+        """Deliver an event to subscribers of `channel` in every process."""
+        await self.client.publish(f"{EVENT_PREFIX}{channel}", encode_value(event))
+    
+    def subscribe_events(self, channel: str):
+        """
+        Async context manager yielding a queue of events published on `channel`.
+        
+        Like subscribe_status(), one pattern subscription per process is shared
+        by all local subscribers.
+        """
+        if self.event_listener is None or self.event_listener.done():
+            self.event_listener = asyncio.get_running_loop().create_task(self._listen_channel_events())
+        return self.channel_events.subscribe(channel)
+    
+    async def _listen_channel_events(self) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{EVENT_PREFIX}*")
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        channel = message["channel"][len(EVENT_PREFIX):]
+                        self.channel_events.publish(channel, decode_value(message["data"]))
+            except redis.RedisError as e:
+                print(f"⚠️  Event listener disconnected: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
+    
+    # ========================================================================
+    # Result Cache (cross-job, keyed by input content hash)
+    # ========================================================================
+    
+    async def get_cached_result(self, content_hash: str) -> Optional[dict]:
+        """Fetch a stored final_result by content hash and mark it recently used."""
+        key = f"result:{content_hash}"
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.get(key)
+        pipeline.expire(key, settings.RESULT_CACHE_TTL)
+        data, _ = await pipeline.execute()
+        if data is None:
+            return None
+        
+        await self.client.zadd(RESULT_INDEX_KEY, {content_hash: time.time()})
+        return decode_value(data)
+    
+    async def set_cached_result(self, content_hash: str, result: dict) -> None:
+        """Store a final_result under its content hash, then apply the eviction policy."""
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.set(f"result:{content_hash}", encode_value(result), ex=settings.RESULT_CACHE_TTL)
+        pipeline.zadd(RESULT_INDEX_KEY, {content_hash: time.time()})
+        await pipeline.execute()
+        await self._evict_cached_results()
+    
+    async def _evict_cached_results(self) -> None:
+        """Forget expired entries and drop least recently used ones beyond the size cap."""
+        await self.client.zremrangebyscore(RESULT_INDEX_KEY, "-inf", time.time() - settings.RESULT_CACHE_TTL)
+        excess = await self.client.zcard(RESULT_INDEX_KEY) - settings.RESULT_CACHE_MAX_ENTRIES
+        if excess > 0:
+            evicted = await self.client.zpopmin(RESULT_INDEX_KEY, excess)
+            await self.client.delete(*[f"result:{content_hash}" for content_hash, _ in evicted])
+    
+    # ========================================================================
+    # Job Queue
+    # ========================================================================
+    
+    async def enqueue_job(self, job_id: str) -> None:
+        """Push a job onto the pipeline work queue."""
+        await self.client.lpush(JOB_QUEUE_KEY, job_id)
+    
+    async def dequeue_job(self, timeout: int = 5) -> Optional[str]:
+        """
+        Block up to `timeout` seconds for the next queued job.
+        
+        The job is moved atomically to the processing list and stays there
+        until ack_job(), so a crashed worker does not lose it. It is leased
+        for WORKER_LEASE_TTL seconds; renew_job_lease() keeps it leased.
+        """
+        job_id = await self.client.blmove(JOB_QUEUE_KEY, JOB_PROCESSING_KEY, timeout, "RIGHT", "LEFT")
+        if job_id:
+            await self.client.zadd(JOB_LEASES_KEY, {job_id: time.time() + settings.WORKER_LEASE_TTL})
+        return job_id
+    
+    async def renew_job_lease(self, job_id: str) -> None:
+        """Extend the lease of a running job (not if it has already been requeued)."""
+        await self.client.zadd(JOB_LEASES_KEY, {job_id: time.time() + settings.WORKER_LEASE_TTL}, xx=True)
+    
+    async def ack_job(self, job_id: str) -> None:
+        """Remove a finished job from the processing list."""
+        async with self.client.pipeline(transaction=True) as pipeline:
+            pipeline.lrem(JOB_PROCESSING_KEY, 1, job_id)
+            pipeline.zrem(JOB_LEASES_KEY, job_id)
+            await pipeline.execute()
+    
+    async def requeue_processing_jobs(self) -> int:
+        """
+        Move jobs whose lease has expired back onto the queue.
+        
+        Jobs live workers keep leased stay in the processing list. An entry
+        without a lease (its worker stopped between dequeue and lease) is
+        leased now and requeued by a later call once that lease expires.
+        """
+        now = time.time()
+        moved = 0
+        for job_id in await self.client.lrange(JOB_PROCESSING_KEY, 0, -1):
+            deadline = await self.client.zscore(JOB_LEASES_KEY, job_id)
+            if deadline is None:
+                await self.client.zadd(JOB_LEASES_KEY, {job_id: now + settings.WORKER_LEASE_TTL}, nx=True)
+            elif deadline <= now and await self._requeue_expired(job_id, now):
+                moved += 1
+        return moved
+    
+    async def _requeue_expired(self, job_id: str, now: float) -> bool:
+        async with self.client.pipeline(transaction=True) as pipeline:
+            try:
+                # A heartbeat renewing the lease meanwhile aborts the move
+                await pipeline.watch(JOB_LEASES_KEY)
+                deadline = await pipeline.zscore(JOB_LEASES_KEY, job_id)
+                if deadline is None or deadline > now:
+                    return False
+                pipeline.multi()
+                pipeline.zrem(JOB_LEASES_KEY, job_id)
+                pipeline.lrem(JOB_PROCESSING_KEY, 1, job_id)
+                pipeline.rpush(JOB_QUEUE_KEY, job_id)
+                await pipeline.execute()
+                return True
+            except redis.WatchError:
+                return False
+    
+    async def queue_length(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return await self.client.llen(JOB_QUEUE_KEY)
+    
+    # ========================================================================
+    # In-Process Cache (LOCAL_CACHE_ENABLED)
+    # ========================================================================
+    #
+    # Job reads served from process memory. Local writes invalidate their own
+    # entries; writes, deletes and expiries from other processes arrive as
+    # keyspace notifications. Status entries also carry a short TTL, which
+    # bounds staleness if notifications are unavailable.
+    
+    def get_local(self, job_id: str, name: str) -> Optional[Any]:
+        """Value stored with set_local(), or None."""
+        return self.local.get(job_id, name) if self.local else None
+    
+    def set_local(self, job_id: str, name: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Keep a value for a job in process memory (no TTL: until evicted or invalidated)."""
+        if self.local:
+            self.local.set(job_id, name, value, ttl)
+    
+    async def _enable_keyspace_events(self) -> None:
+        """Best-effort: turn on the keyspace notifications invalidation relies on."""
+        try:
+            current = (await self.client.config_get("notify-keyspace-events")).get("notify-keyspace-events", "")
+            needed = "K" + ("" if "A" in current else "g$hx")
+            missing = "".join(flag for flag in needed if flag not in current)
+            if missing:
+                await self.client.config_set("notify-keyspace-events", current + missing)
+        except redis.RedisError as e:
+            print(f"⚠️  Could not enable keyspace notifications ({e}); "
+                  f"local status entries expire after {settings.LOCAL_CACHE_STATUS_TTL}s")
+    
+    async def watch_invalidations(self) -> None:
+        """Drop local entries of jobs changed by other processes. Runs until cancelled."""
+        if not self.local:
+            return
+        await self._enable_keyspace_events()
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.psubscribe("__keyspace@*__:job:*")
+                # Anything could have changed while we were not subscribed
+                self.local.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        # __keyspace@0__:job:{id}[:{field}]
+                        self.local.invalidate(message["channel"].split(":", 3)[2])
+            except redis.RedisError as e:
+                print(f"⚠️  Invalidation listener disconnected: {e}")
+                self.local.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.reset()
     
     # ========================================================================
     # Cleanup
     # ========================================================================
     
-    def delete_job(self, job_id: str) -> None:
-        """Delete all keys associated with a job."""
-        keys = self.client.keys(f"job:{job_id}:*")
+    async def delete_job(self, job_id: str) -> None:
+        """Delete all keys associated with a job and drop it from the job index."""
+        if self.local:
+            self.local.invalidate(job_id)
+        registry = f"jobkeys:{job_id}"
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.delete(f"job:{job_id}")
+        pipeline.smembers(registry)
+        pipeline.exists(f"job:{job_id}:type")
+        pipeline.zrem(JOB_INDEX_KEY, job_id)
+        pipeline.hdel(JOB_UPLOADS_KEY, job_id)
+        _, fields, has_field_keys, _, _ = await pipeline.execute()
+        
+        keys = [f"job:{job_id}:{field}" for field in fields]
+        if has_field_keys and not keys:
+            # Written before the key registry existed: walk the keyspace incrementally
+            keys = [key async for key in self.client.scan_iter(match=f"job:{job_id}:*", count=1000)]
         if keys:
-            self.client.delete(*keys)
+            await self.client.delete(registry, *keys)
+    
+    async def flush(self) -> None:
+        """Writes go straight to Valkey; nothing is buffered."""
+    
+    async def storage_stats(self) -> dict:
+        """Key count and memory used by the Valkey server."""
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.dbsize()
+        pipeline.info("memory")
+        entries, memory = await pipeline.execute(raise_on_error=False)
+        # INFO can be disabled on managed instances
+        used_memory = memory.get("used_memory") if isinstance(memory, dict) else None
+        return {"backend": "valkey", "entries": entries, "bytes": used_memory}
     
-    def health_check(self) -> bool:
+    async def health_check(self) -> bool:
         """Check if Valkey connection is healthy."""
         try:
-            self.client.ping()
+            await self.client.ping()
             return True
         except redis.ConnectionError:
             return False
@@ -145,10 +596,10 @@ class ValkeyCache:
     # User Settings
     # ========================================================================
     
-    def get_settings(self, client_id: str) -> dict:
+    async def get_settings(self, client_id: str) -> dict:
         """Get user settings by client_id."""
         key = f"settings:{client_id}"
-        data = self.client.get(key)
+        data = await self.client.get(key)
         if data is None:
             # Return defaults
             return {
@@ -163,12 +614,24 @@ class ValkeyCache:
                 "demo_mode": "cached"
             }
     
-    def set_settings(self, client_id: str, settings: dict) -> None:
+    async def set_settings(self, client_id: str, user_settings: dict) -> None:
         """Set user settings by client_id."""
         key = f"settings:{client_id}"
-        self.client.set(key, json.dumps(settings))
-        self.client.expire(key, self.ttl * 24)  # Settings last longer (24 hours)
+        # Settings last longer than job data (24x VALKEY_TTL)
+        await self.client.set(key, json.dumps(user_settings), ex=settings.VALKEY_TTL * 24)
+
+
+def create_cache():
+    """Instantiate the backend selected by CACHE_BACKEND ("valkey", "sqlite" or "memory")."""
+    if settings.CACHE_BACKEND == "sqlite":
+        from cache_sqlite import SQLiteCache
+        return SQLiteCache(settings.SQLITE_CACHE_PATH)
+    if settings.CACHE_BACKEND == "memory":
+        from cache_mock import MockCache
+        return MockCache()
+    # Falls back to MockCache when Valkey is unreachable
+    return ValkeyCache()
 
 
 # Global cache instance
-cache = ValkeyCache()
+cache = create_cache()
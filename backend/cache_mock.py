@@ -1,80 +1,357 @@
-"""Mock cache for local development without Redis/Valkey."""
+"""In-memory cache used without Redis/Valkey (async API matching ValkeyCache)."""
 import json
+import asyncio
+import threading
+import time
+import uuid
+from collections import deque, OrderedDict
 from typing import Any, Optional
 from datetime import datetime
+from config import settings
+from status_events import StatusBroadcaster
+from tracing import trace_methods
 
 
+def _encode(value: Any) -> str:
+    return json.dumps(value) if not isinstance(value, str) else value
+
+
+def _decode(data: Optional[str]) -> Optional[Any]:
+    if data is None:
+        return None
+    try:
+        return json.loads(data)
+    except (json.JSONDecodeError, TypeError):
+        return data
+
+
+def _sizeof(key: str, value: Any) -> int:
+    """Approximate footprint of an entry (strings, or member -> expiry dicts for indexes)."""
+    if isinstance(value, str):
+        return len(key) + len(value)
+    return len(key) + sum(len(member) + 8 for member in value)
+
+
+@trace_methods("cache")
 class MockCache:
-    """In-memory cache for development without Redis."""
+    """
+    In-memory cache for running without Redis.
+    
+    Entries expire like their Valkey counterparts: lazily on read, plus a full
+    sweep at most every MOCK_CACHE_SWEEP_INTERVAL seconds on write. Beyond
+    MOCK_CACHE_MAX_ENTRIES or MOCK_CACHE_MAX_BYTES the least recently used
+    entries are evicted.
+    """
+    
+    # Private to this process: its job queue cannot feed worker.py
+    shared = False
     
     def __init__(self):
-        self.store = {}
+        self.store = OrderedDict()  # key -> (expires_at, value, size), LRU order
+        self.store_bytes = 0
+        self.lock = threading.RLock()
+        self.next_sweep = time.time() + settings.MOCK_CACHE_SWEEP_INTERVAL
+        self.queue = deque()
+        self.processing = {}  # job_id -> lease expiry
+        self.queue_ready = asyncio.Condition()
+        self.counters = {}
+        self.results = OrderedDict()  # content_hash -> (expires_at, serialized result), LRU order
+        self.job_index = {}  # job_id -> registration time
+        self.uploads = {}  # job_id -> uploaded file path
+        self.upload_refs = {}  # uploaded file path -> job IDs using it
+        self.locks = {}  # lock name -> (expires_at, token)
+        self.status_events = StatusBroadcaster()
+        self.channel_events = StatusBroadcaster()
+    
+    # ========================================================================
+    # Bounded Store
+    # ========================================================================
+    
+    def _get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            entry = self.store.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._delete(key)
+                return None
+            self.store.move_to_end(key)
+            return entry[1]
+    
+    def _set(self, key: str, value: Any, ttl: int) -> None:
+        size = _sizeof(key, value)
+        with self.lock:
+            self._delete(key)
+            self.store[key] = (time.time() + ttl, value, size)
+            self.store_bytes += size
+            self._evict()
+    
+    def _delete(self, key: str) -> None:
+        entry = self.store.pop(key, None)
+        if entry is not None:
+            self.store_bytes -= entry[2]
+    
+    def _evict(self) -> None:
+        now = time.time()
+        if now >= self.next_sweep:
+            for key in [key for key, entry in self.store.items() if entry[0] <= now]:
+                self._delete(key)
+            self.next_sweep = now + settings.MOCK_CACHE_SWEEP_INTERVAL
+        while self.store and (len(self.store) > settings.MOCK_CACHE_MAX_ENTRIES
+                              or self.store_bytes > settings.MOCK_CACHE_MAX_BYTES):
+            _, (_, _, size) = self.store.popitem(last=False)
+            self.store_bytes -= size
+    
+    async def flush(self) -> None:
+        pass
+    
+    async def storage_stats(self) -> dict:
+        """Current size of the in-memory store."""
+        with self.lock:
+            return {
+                "backend": "memory",
+                "entries": len(self.store),
+                "bytes": self.store_bytes,
+                "max_entries": settings.MOCK_CACHE_MAX_ENTRIES,
+                "max_bytes": settings.MOCK_CACHE_MAX_BYTES,
+            }
     
-    def set_job_status(self, job_id: str, status: str, message: str = "") -> None:
-        self.store[f"job:{job_id}:status"] = status
+    # ========================================================================
+    # Job Data
+    # ========================================================================
+    
+    async def set_job_status(self, job_id: str, status: str, message: str = "",
+                             progress: Optional[dict] = None) -> None:
+        event = {"status": status, "message": message}
+        self._set(f"job:{job_id}:status", status, settings.VALKEY_TTL)
         if message:
-            self.store[f"job:{job_id}:message"] = message
+            self._set(f"job:{job_id}:message", message, settings.VALKEY_TTL)
+        if progress is not None:
+            self._set(f"job:{job_id}:progress", _encode(progress), settings.VALKEY_TTL)
+            event["progress"] = progress
+        self.status_events.publish(job_id, event)
     
-    def get_job_status(self, job_id: str) -> dict:
-        status = self.store.get(f"job:{job_id}:status")
-        message = self.store.get(f"job:{job_id}:message", "")
-        return {"status": status, "message": message}
+    def subscribe_status(self, job_id: str):
+        return self.status_events.subscribe(job_id)
     
-    def set_job_data(self, job_id: str, key: str, value: Any) -> None:
-        data = json.dumps(value) if not isinstance(value, str) else value
-        self.store[f"job:{job_id}:{key}"] = data
+    async def get_job_status(self, job_id: str) -> dict:
+        status = self._get(f"job:{job_id}:status")
+        message = self._get(f"job:{job_id}:message") or ""
+        progress = _decode(self._get(f"job:{job_id}:progress"))
+        return {"status": status, "message": message, "progress": progress}
     
-    def get_job_data(self, job_id: str, key: str) -> Optional[Any]:
-        data = self.store.get(f"job:{job_id}:{key}")
-        if data is None:
-            return None
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return data
+    async def set_job_data(self, job_id: str, key: str, value: Any) -> None:
+        self._set(f"job:{job_id}:{key}", _encode(value), settings.VALKEY_TTL)
+    
+    async def get_job_data(self, job_id: str, key: str) -> Optional[Any]:
+        return _decode(self._get(f"job:{job_id}:{key}"))
     
-    def cache_exists(self, job_id: str, key: str) -> bool:
-        return f"job:{job_id}:{key}" in self.store
+    async def cache_exists(self, job_id: str, key: str) -> bool:
+        return self._get(f"job:{job_id}:{key}") is not None
     
-    def set_multiple(self, job_id: str, data: dict) -> None:
+    async def set_multiple(self, job_id: str, data: dict) -> None:
         for key, value in data.items():
-            serialized = json.dumps(value) if not isinstance(value, str) else value
-            self.store[f"job:{job_id}:{key}"] = serialized
-    
-    def get_multiple(self, job_id: str, keys: list[str]) -> dict:
-        output = {}
-        for key in keys:
-            data = self.store.get(f"job:{job_id}:{key}")
-            if data is None:
-                output[key] = None
-            else:
-                try:
-                    output[key] = json.loads(data)
-                except (json.JSONDecodeError, TypeError):
-                    output[key] = data
-        return output
-    
-    def initialize_job(self, job_id: str, input_type: str, raw_input: str) -> None:
+            self._set(f"job:{job_id}:{key}", _encode(value), settings.VALKEY_TTL)
+    
+    async def get_multiple(self, job_id: str, keys: list[str]) -> dict:
+        return {key: _decode(self._get(f"job:{job_id}:{key}")) for key in keys}
+    
+    async def initialize_job(self, job_id: str, input_type: str, raw_input: str,
+                             upload_path: Optional[str] = None) -> None:
         data = {
             "type": input_type,
             "raw": raw_input,
             "created_at": datetime.utcnow().isoformat()
         }
-        self.set_multiple(job_id, data)
-        self.set_job_status(job_id, "INGESTED", "Job created successfully")
+        await self.set_multiple(job_id, data)
+        await self.set_job_status(job_id, "INGESTED", "Job created successfully")
+        self.job_index[job_id] = time.time()
+        if upload_path:
+            self.uploads[job_id] = upload_path
+            self.upload_refs.setdefault(upload_path, set()).add(job_id)
+    
+    async def get_stale_jobs(self, older_than: float, limit: int) -> list[str]:
+        stale = sorted((ts, job_id) for job_id, ts in self.job_index.items() if ts <= older_than)
+        return [job_id for _, job_id in stale[:limit]]
+    
+    async def track_job(self, job_id: str) -> None:
+        self.job_index[job_id] = time.time()
+    
+    async def get_job_upload(self, job_id: str) -> Optional[str]:
+        return self.uploads.get(job_id)
+    
+    async def register_upload(self, job_id: str, upload_path: str) -> None:
+        self.job_index[job_id] = time.time()
+        self.uploads[job_id] = upload_path
+        self.upload_refs.setdefault(upload_path, set()).add(job_id)
+    
+    async def release_upload(self, job_id: str, upload_path: str) -> int:
+        refs = self.upload_refs.get(upload_path, set())
+        refs.discard(job_id)
+        if not refs:
+            self.upload_refs.pop(upload_path, None)
+        return len(refs)
     
-    def delete_job(self, job_id: str) -> None:
-        keys_to_delete = [k for k in self.store.keys() if k.startswith(f"job:{job_id}:")]
-        for key in keys_to_delete:
-            del self.store[key]
+    async def count_upload_refs(self, upload_path: str) -> int:
+        return len(self.upload_refs.get(upload_path, ()))
     
-    def health_check(self) -> bool:
+    # ========================================================================
+    # Shared Entries
+    # ========================================================================
+    
+    async def get_shared(self, key: str) -> Optional[Any]:
+        data = self._get(key)
+        return json.loads(data) if data is not None else None
+    
+    async def get_many_shared(self, keys: list[str]) -> dict:
+        found = {key: self._get(key) for key in keys}
+        return {key: json.loads(data) for key, data in found.items() if data is not None}
+    
+    async def set_shared(self, key: str, value: Any, ttl: int) -> None:
+        self._set(key, json.dumps(value), ttl)
+    
+    async def add_to_index(self, key: str, member: str, ttl: int, max_members: int) -> None:
+        with self.lock:
+            now = time.time()
+            members = {m: expires_at for m, expires_at in (self._get(key) or {}).items() if expires_at > now}
+            members[member] = now + ttl
+            members = dict(sorted(members.items(), key=lambda item: item[1])[-max_members:])
+            self._set(key, members, max(members.values()) - now)
+    
+    async def get_index(self, key: str) -> set:
+        now = time.time()
+        return {member for member, expires_at in (self._get(key) or {}).items() if expires_at > now}
+    
+    async def incr_counter(self, key: str, amount: int = 1) -> None:
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+    
+    async def get_counters(self, keys: list[str]) -> dict:
+        return {key: self.counters.get(key, 0) for key in keys}
+    
+    # ========================================================================
+    # Locks and Events
+    # ========================================================================
+    
+    async def acquire_lock(self, name: str, ttl: int) -> Optional[str]:
+        with self.lock:
+            held = self.locks.get(name)
+            if held is not None and held[0] > time.time():
+                return None
+            token = uuid.uuid4().hex
+            self.locks[name] = (time.time() + ttl, token)
+            return token
+    
+    async def release_lock(self, name: str, token: str) -> bool:
+        with self.lock:
+            held = self.locks.get(name)
+            if held is None or held[1] != token:
+                return False
+            del self.locks[name]
+            return True
+    
+    async def publish_event(self, channel: str, event: Any) -> None:
+        self.channel_events.publish(channel, event)
+    
+    def subscribe_events(self, channel: str):
+        return self.channel_events.subscribe(channel)
+    
+    # ========================================================================
+    # Result Cache
+    # ========================================================================
+    
+    async def get_cached_result(self, content_hash: str) -> Optional[dict]:
+        with self.lock:
+            entry = self.results.get(content_hash)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.time():
+                del self.results[content_hash]
+                return None
+            self.results[content_hash] = (time.time() + settings.RESULT_CACHE_TTL, data)
+            self.results.move_to_end(content_hash)
+        return json.loads(data)
+    
+    async def set_cached_result(self, content_hash: str, result: dict) -> None:
+        data = json.dumps(result)
+        with self.lock:
+            self.results[content_hash] = (time.time() + settings.RESULT_CACHE_TTL, data)
+            self.results.move_to_end(content_hash)
+            while len(self.results) > settings.RESULT_CACHE_MAX_ENTRIES:
+                self.results.popitem(last=False)
+    
+    # ========================================================================
+    # Job Queue
+    # ========================================================================
+    
+    async def enqueue_job(self, job_id: str) -> None:
+        async with self.queue_ready:
+            self.queue.appendleft(job_id)
+            self.queue_ready.notify()
+    
+    async def dequeue_job(self, timeout: int = 5) -> Optional[str]:
+        async with self.queue_ready:
+            try:
+                await asyncio.wait_for(self.queue_ready.wait_for(lambda: self.queue), timeout)
+            except asyncio.TimeoutError:
+                return None
+            job_id = self.queue.pop()
+            self.processing[job_id] = time.time() + settings.WORKER_LEASE_TTL
+            return job_id
+    
+    async def renew_job_lease(self, job_id: str) -> None:
+        if job_id in self.processing:
+            self.processing[job_id] = time.time() + settings.WORKER_LEASE_TTL
+    
+    async def ack_job(self, job_id: str) -> None:
+        self.processing.pop(job_id, None)
+    
+    async def requeue_processing_jobs(self) -> int:
+        async with self.queue_ready:
+            now = time.time()
+            expired = [job_id for job_id, expires_at in self.processing.items() if expires_at <= now]
+            for job_id in expired:
+                del self.processing[job_id]
+            self.queue.extend(expired)
+            self.queue_ready.notify_all()
+            return len(expired)
+    
+    async def queue_length(self) -> int:
+        return len(self.queue)
+    
+    # ========================================================================
+    # In-Process Cache / Cleanup
+    # ========================================================================
+    
+    def get_local(self, job_id: str, name: str) -> Optional[Any]:
+        return None  # everything is already in process memory
+    
+    def set_local(self, job_id: str, name: str, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+    
+    async def watch_invalidations(self) -> None:
+        pass
+    
+    async def delete_job(self, job_id: str) -> None:
+        prefix = f"job:{job_id}:"
+        with self.lock:
+            for key in [key for key in self.store if key.startswith(prefix)]:
+                self._delete(key)
+        self.job_index.pop(job_id, None)
+        self.uploads.pop(job_id, None)
+    
+    async def health_check(self) -> bool:
         return True
     
-    def get_settings(self, client_id: str) -> dict:
+    # ========================================================================
+    # User Settings
+    # ========================================================================
+    
+    async def get_settings(self, client_id: str) -> dict:
         """Get user settings by client_id."""
         key = f"settings:{client_id}"
-        data = self.store.get(key)
+        data = self._get(key)
         if data is None:
             # Return defaults
             return {
@@ -89,10 +366,11 @@ class MockCache:
                 "demo_mode": "cached"
             }
     
-    def set_settings(self, client_id: str, settings: dict) -> None:
+    async def set_settings(self, client_id: str, user_settings: dict) -> None:
         """Set user settings by client_id."""
         key = f"settings:{client_id}"
-        self.store[key] = json.dumps(settings)
+        # Settings last longer than job data (24x VALKEY_TTL)
+        self._set(key, json.dumps(user_settings), settings.VALKEY_TTL * 24)
 
 
 # Global mock cache instance
@@ -0,0 +1,599 @@
+"""Embedded SQLite cache backend (CACHE_BACKEND=sqlite) with the ValkeyCache interface.
+
+For single-box deployments without Valkey: job data, shared claim-cache
+entries, cached results and the job queue live in one SQLite file in WAL mode,
+so they survive restarts and are shared by the API and worker processes.
+
+All SQLite calls run on one dedicated thread per process: a forked process
+(worker.py --processes) opens its own connection and thread on first use
+instead of sharing the parent's, which SQLite does not allow across a fork. Job fields, shared entries and
+counters are buffered and committed in a single transaction every
+SQLITE_FLUSH_INTERVAL seconds (or once SQLITE_BATCH_SIZE writes are pending).
+Reads in the same process see buffered values immediately; other processes
+see them after the flush.
+"""
+import asyncio
+import atexit
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Optional
+
+from config import settings
+from codec import encode_value, decode_value
+from status_events import StatusBroadcaster
+from tracing import trace_methods
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS kv_expires_at ON kv (expires_at);
+
+CREATE TABLE IF NOT EXISTS sets (
+    key TEXT NOT NULL,
+    member TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (key, member)
+);
+
+CREATE TABLE IF NOT EXISTS counters (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    hash TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    registered_at REAL NOT NULL,
+    upload_path TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_registered_at ON jobs (registered_at);
+CREATE INDEX IF NOT EXISTS jobs_upload_path ON jobs (upload_path);
+
+CREATE TABLE IF NOT EXISTS queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    processing INTEGER NOT NULL DEFAULT 0,
+    lease_expires REAL
+);
+
+CREATE TABLE IF NOT EXISTS locks (
+    name TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+UPSERT_KV = (
+    "INSERT INTO kv (key, value, expires_at) VALUES (?, ?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at"
+)
+UPSERT_COUNTER = (
+    "INSERT INTO counters (key, value) VALUES (?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value"
+)
+QUEUE_POLL_INTERVAL = 0.2
+
+# Connections inherited across a fork: never closed (or garbage collected) in
+# the child, since closing may write to the parent's WAL
+_inherited_connections = []
+
+
+@trace_methods("cache")
+class SQLiteCache:
+    """Persistent single-file cache for running without Valkey."""
+    
+    # Processes using the same SQLITE_CACHE_PATH share jobs and the job queue
+    shared = True
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.SQLITE_CACHE_PATH
+        self._connect()
+        self.pending = {}  # key -> (encoded value, expires_at) not yet committed
+        self.pending_counters = {}
+        self.flush_handle = None
+        self.flush_loop = None
+        self.flush_task = None
+        self.next_purge = time.time() + settings.SQLITE_PURGE_INTERVAL
+        self.status_events = StatusBroadcaster()
+        self.channel_events = StatusBroadcaster()
+        self.status_poller = None
+        atexit.register(self._flush_now)
+    
+    # ========================================================================
+    # SQLite Access (runs on the cache thread)
+    # ========================================================================
+    
+    def _connect(self) -> None:
+        """Open this process's connection and cache thread."""
+        self.pid = os.getpid()
+        # Autocommit mode; multi-statement writes use explicit BEGIN IMMEDIATE
+        self.db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=5)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        if "lease_expires" not in {column[1] for column in self.db.execute("PRAGMA table_info(queue)")}:
+            # Files created before job leases
+            self.db.execute("ALTER TABLE queue ADD COLUMN lease_expires REAL")
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-cache")
+    
+    def _check_process(self) -> None:
+        """Reconnect in a forked child; the parent's writes and tasks are not the child's."""
+        if self.pid == os.getpid():
+            return
+        _inherited_connections.append(self.db)
+        self.pending, self.pending_counters = {}, {}
+        self.flush_handle = self.flush_loop = self.flush_task = None
+        self.status_poller = None
+        self._connect()
+    
+    async def _run(self, fn, *args) -> Any:
+        self._check_process()
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+    
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self.lock:
+            return self.db.execute(sql, params).fetchall()
+    
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        with self.lock:
+            return self.db.execute(sql, params).rowcount
+    
+    def _transaction(self, fn) -> Any:
+        """Run fn(db) inside one write transaction."""
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self.db)
+                self.db.execute("COMMIT")
+                return result
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+    
+    def _write_batch(self, kv: dict, counters: dict) -> None:
+        def write(db):
+            db.executemany(UPSERT_KV, [(key, value, expires_at) for key, (value, expires_at) in kv.items()])
+            db.executemany(UPSERT_COUNTER, list(counters.items()))
+            now = time.time()
+            if now >= self.next_purge:
+                for table in ("kv", "sets", "results", "locks"):
+                    db.execute(f"DELETE FROM {table} WHERE expires_at <= ?", (now,))
+                self.next_purge = now + settings.SQLITE_PURGE_INTERVAL
+        self._transaction(write)
+    
+    def _flush_now(self) -> None:
+        """Synchronous flush for interpreter exit."""
+        self._check_process()
+        kv, counters = self.pending, self.pending_counters
+        self.pending, self.pending_counters = {}, {}
+        if kv or counters:
+            try:
+                self._write_batch(kv, counters)
+            except Exception as e:
+                print(f"⚠️  SQLite cache lost {len(kv) + len(counters)} buffered writes at exit: {e}")
+    
+    # ========================================================================
+    # Write Buffer
+    # ========================================================================
+    
+    def _schedule_flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.flush_handle is not None and self.flush_loop is loop:
+            return
+        self.flush_loop = loop
+        self.flush_handle = loop.call_later(settings.SQLITE_FLUSH_INTERVAL, self._start_flush)
+    
+    def _start_flush(self) -> None:
+        self.flush_handle = None
+        self.flush_task = asyncio.ensure_future(self._flush_or_retry())
+    
+    async def _flush_or_retry(self) -> None:
+        """Flush buffered writes; if that fails, log it and try again next interval."""
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"⚠️  SQLite cache flush failed, retrying in {settings.SQLITE_FLUSH_INTERVAL}s: {e}")
+            self._schedule_flush()
+    
+    async def _buffer(self, values: dict, ttl: int) -> None:
+        expires_at = time.time() + ttl
+        for key, value in values.items():
+            self.pending[key] = (value, expires_at)
+        if len(self.pending) >= settings.SQLITE_BATCH_SIZE:
+            await self._flush_or_retry()
+        else:
+            self._schedule_flush()
+    
+    async def flush(self) -> None:
+        """
+        Commit all buffered writes in one transaction.
+        
+        If the commit fails (e.g. the database stayed locked past the busy
+        timeout), the batch goes back into the buffer, behind any writes made
+        meanwhile, and the error is raised.
+        """
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        kv, counters = self.pending, self.pending_counters
+        self.pending, self.pending_counters = {}, {}
+        if not (kv or counters):
+            return
+        try:
+            await self._run(self._write_batch, kv, counters)
+        except BaseException:
+            self.pending = {**kv, **self.pending}
+            for key, amount in counters.items():
+                self.pending_counters[key] = self.pending_counters.get(key, 0) + amount
+            raise
+    
+    async def _get_many(self, keys: list[str]) -> dict:
+        """Raw values for the live keys among `keys`, buffered writes first."""
+        found = {key: self.pending[key][0] for key in keys if key in self.pending}
+        missing = [key for key in keys if key not in found]
+        if missing:
+            placeholders = ",".join("?" * len(missing))
+            rows = await self._run(
+                self._query,
+                f"SELECT key, value FROM kv WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*missing, time.time()),
+            )
+            found.update(rows)
+        return found
+    
+    async def storage_stats(self) -> dict:
+        """Row count and file size of the SQLite store."""
+        entries = (await self._run(self._query, "SELECT COUNT(*) FROM kv"))[0][0]
+        pages = (await self._run(self._query, "PRAGMA page_count"))[0][0]
+        page_size = (await self._run(self._query, "PRAGMA page_size"))[0][0]
+        return {
+            "backend": "sqlite",
+            "entries": entries + len(self.pending),
+            "bytes": pages * page_size,
+            "path": self.path,
+        }
+    
+    # ========================================================================
+    # Job Data
+    # ========================================================================
+    
+    async def set_job_status(self, job_id: str, status: str, message: str = "",
+                             progress: Optional[dict] = None) -> None:
+        values = {f"job:{job_id}:status": status}
+        event = {"status": status, "message": message}
+        if message:
+            values[f"job:{job_id}:message"] = message
+        if progress is not None:
+            values[f"job:{job_id}:progress"] = encode_value(progress)
+            event["progress"] = progress
+        await self._buffer(values, settings.VALKEY_TTL)
+        self.status_events.publish(job_id, event)
+    
+    def subscribe_status(self, job_id: str):
+        """
+        Async context manager yielding a queue of the job's status events.
+        
+        Transitions written by other processes (workers) are picked up by
+        polling the watched jobs every STATUS_POLL_INTERVAL seconds.
+        """
+        if self.status_poller is None or self.status_poller.done():
+            self.status_poller = asyncio.get_running_loop().create_task(self._poll_status_changes())
+        return self.status_events.subscribe(job_id)
+    
+    async def _poll_status_changes(self) -> None:
+        last_seen = {}
+        while True:
+            await asyncio.sleep(settings.STATUS_POLL_INTERVAL)
+            job_ids = self.status_events.watched_jobs()
+            last_seen = {job_id: event for job_id, event in last_seen.items() if job_id in job_ids}
+            if not job_ids:
+                continue
+            values = await self._get_many([
+                key for job_id in job_ids
+                for key in (f"job:{job_id}:status", f"job:{job_id}:message", f"job:{job_id}:progress")
+            ])
+            for job_id in job_ids:
+                event = {
+                    "status": values.get(f"job:{job_id}:status"),
+                    "message": values.get(f"job:{job_id}:message") or "",
+                    "progress": decode_value(values.get(f"job:{job_id}:progress"))
+                }
+                if event["status"] is not None and last_seen.get(job_id) != event:
+                    last_seen[job_id] = event
+                    self.status_events.publish(job_id, event)
+    
+    async def get_job_status(self, job_id: str) -> dict:
+        values = await self._get_many([f"job:{job_id}:status", f"job:{job_id}:message", f"job:{job_id}:progress"])
+        return {
+            "status": values.get(f"job:{job_id}:status"),
+            "message": values.get(f"job:{job_id}:message") or "",
+            "progress": decode_value(values.get(f"job:{job_id}:progress"))
+        }
+    
+    async def set_job_data(self, job_id: str, key: str, value: Any) -> None:
+        await self._buffer({f"job:{job_id}:{key}": encode_value(value)}, settings.VALKEY_TTL)
+    
+    async def get_job_data(self, job_id: str, key: str) -> Optional[Any]:
+        values = await self._get_many([f"job:{job_id}:{key}"])
+        return decode_value(values.get(f"job:{job_id}:{key}"))
+    
+    async def cache_exists(self, job_id: str, key: str) -> bool:
+        return f"job:{job_id}:{key}" in await self._get_many([f"job:{job_id}:{key}"])
+    
+    async def set_multiple(self, job_id: str, data: dict) -> None:
+        await self._buffer(
+            {f"job:{job_id}:{key}": encode_value(value) for key, value in data.items()},
+            settings.VALKEY_TTL,
+        )
+    
+    async def get_multiple(self, job_id: str, keys: list[str]) -> dict:
+        values = await self._get_many([f"job:{job_id}:{key}" for key in keys])
+        return {key: decode_value(values.get(f"job:{job_id}:{key}")) for key in keys}
+    
+    async def initialize_job(self, job_id: str, input_type: str, raw_input: str,
+                             upload_path: Optional[str] = None) -> None:
+        data = {
+            "type": input_type,
+            "raw": raw_input,
+            "created_at": datetime.utcnow().isoformat()
+        }
+        await self.set_multiple(job_id, data)
+        await self.set_job_status(job_id, "INGESTED", "Job created successfully")
+        await self._run(
+            self._execute,
+            "INSERT OR REPLACE INTO jobs (job_id, registered_at, upload_path) VALUES (?, ?, ?)",
+            (job_id, time.time(), upload_path),
+        )
+    
+    async def get_stale_jobs(self, older_than: float, limit: int) -> list[str]:
+        rows = await self._run(
+            self._query,
+            "SELECT job_id FROM jobs WHERE registered_at <= ? ORDER BY registered_at LIMIT ?",
+            (older_than, limit),
+        )
+        return [job_id for job_id, in rows]
+    
+    async def track_job(self, job_id: str) -> None:
+        await self._run(self._execute, "UPDATE jobs SET registered_at = ? WHERE job_id = ?", (time.time(), job_id))
+    
+    async def get_job_upload(self, job_id: str) -> Optional[str]:
+        rows = await self._run(self._query, "SELECT upload_path FROM jobs WHERE job_id = ?", (job_id,))
+        return rows[0][0] if rows else None
+    
+    async def register_upload(self, job_id: str, upload_path: str) -> None:
+        # Not buffered: the sweeper of another process must see the reference
+        await self._run(
+            self._execute,
+            "INSERT OR REPLACE INTO jobs (job_id, registered_at, upload_path) VALUES (?, ?, ?)",
+            (job_id, time.time(), upload_path),
+        )
+    
+    async def release_upload(self, job_id: str, upload_path: str) -> int:
+        """Drop a job's reference to a stored upload; the jobs rows are the references."""
+        def release(db):
+            db.execute("UPDATE jobs SET upload_path = NULL WHERE job_id = ? AND upload_path = ?", (job_id, upload_path))
+            return db.execute("SELECT COUNT(*) FROM jobs WHERE upload_path = ?", (upload_path,)).fetchone()[0]
+        return await self._run(self._transaction, release)
+    
+    async def count_upload_refs(self, upload_path: str) -> int:
+        rows = await self._run(self._query, "SELECT COUNT(*) FROM jobs WHERE upload_path = ?", (upload_path,))
+        return rows[0][0]
+    
+    # ========================================================================
+    # Shared Entries
+    # ========================================================================
+    
+    async def get_shared(self, key: str) -> Optional[Any]:
+        return decode_value((await self._get_many([key])).get(key))
+    
+    async def get_many_shared(self, keys: list[str]) -> dict:
+        return {key: decode_value(value) for key, value in (await self._get_many(keys)).items()}
+    
+    async def set_shared(self, key: str, value: Any, ttl: int) -> None:
+        await self._buffer({key: encode_value(value)}, ttl)
+    
+    async def add_to_index(self, key: str, member: str, ttl: int, max_members: int) -> None:
+        now = time.time()
+    
+        def add(db):
+            db.execute("INSERT OR REPLACE INTO sets (key, member, expires_at) VALUES (?, ?, ?)", (key, member, now + ttl))
+            db.execute(
+                "DELETE FROM sets WHERE key = ? AND (expires_at <= ? OR member NOT IN "
+                "(SELECT member FROM sets WHERE key = ? ORDER BY expires_at DESC LIMIT ?))",
+                (key, now, key, max_members),
+            )
+        await self._run(self._transaction, add)
+    
+    async def get_index(self, key: str) -> set:
+        rows = await self._run(self._query, "SELECT member FROM sets WHERE key = ? AND expires_at > ?", (key, time.time()))
+        return {member for member, in rows}
+    
+    async def incr_counter(self, key: str, amount: int = 1) -> None:
+        self.pending_counters[key] = self.pending_counters.get(key, 0) + amount
+        self._schedule_flush()
+    
+    async def get_counters(self, keys: list[str]) -> dict:
+        stored = {}
+        if keys:
+            placeholders = ",".join("?" * len(keys))
+            stored = dict(await self._run(self._query, f"SELECT key, value FROM counters WHERE key IN ({placeholders})", tuple(keys)))
+        return {key: stored.get(key, 0) + self.pending_counters.get(key, 0) for key in keys}
+    
+    # ========================================================================
+    # Locks and Events
+    # ========================================================================
+    
+    async def acquire_lock(self, name: str, ttl: int) -> Optional[str]:
+        token = uuid.uuid4().hex
+        now = time.time()
+    
+        def take(db):
+            db.execute("DELETE FROM locks WHERE name = ? AND expires_at <= ?", (name, now))
+            return db.execute(
+                "INSERT OR IGNORE INTO locks (name, token, expires_at) VALUES (?, ?, ?)", (name, token, now + ttl)
+            ).rowcount
+        return token if await self._run(self._transaction, take) else None
+    
+    async def release_lock(self, name: str, token: str) -> bool:
+        # Commit buffered writes first so the next holder sees what this one stored
+        await self.flush()
+        return bool(await self._run(self._execute, "DELETE FROM locks WHERE name = ? AND token = ?", (name, token)))
+    
+    async def publish_event(self, channel: str, event: Any) -> None:
+        # In-process only: other processes poll for whatever the event announces
+        self.channel_events.publish(channel, event)
+    
+    def subscribe_events(self, channel: str):
+        return self.channel_events.subscribe(channel)
+    
+    # ========================================================================
+    # Result Cache
+    # ========================================================================
+    
+    async def get_cached_result(self, content_hash: str) -> Optional[dict]:
+        now = time.time()
+    
+        def touch(db):
+            row = db.execute("SELECT value FROM results WHERE hash = ? AND expires_at > ?", (content_hash, now)).fetchone()
+            if row is not None:
+                db.execute("UPDATE results SET last_used = ?, expires_at = ? WHERE hash = ?",
+                           (now, now + settings.RESULT_CACHE_TTL, content_hash))
+            return row
+        row = await self._run(self._transaction, touch)
+        return decode_value(row[0]) if row else None
+    
+    async def set_cached_result(self, content_hash: str, result: dict) -> None:
+        now = time.time()
+        data = encode_value(result)
+    
+        def store(db):
+            db.execute(
+                "INSERT OR REPLACE INTO results (hash, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (content_hash, data, now + settings.RESULT_CACHE_TTL, now),
+            )
+            db.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+            excess = db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - settings.RESULT_CACHE_MAX_ENTRIES
+            if excess > 0:
+                db.execute("DELETE FROM results WHERE hash IN (SELECT hash FROM results ORDER BY last_used LIMIT ?)", (excess,))
+        await self._run(self._transaction, store)
+    
+    # ========================================================================
+    # Job Queue
+    # ========================================================================
+    
+    async def enqueue_job(self, job_id: str) -> None:
+        # Queue writes are not buffered: workers in other processes must see them
+        await self.flush()
+        await self._run(self._execute, "INSERT INTO queue (job_id) VALUES (?)", (job_id,))
+    
+    def _claim_next_job(self, db) -> Optional[str]:
+        row = db.execute("SELECT id, job_id FROM queue WHERE processing = 0 ORDER BY id LIMIT 1").fetchone()
+        if row is None:
+            return None
+        db.execute(
+            "UPDATE queue SET processing = 1, lease_expires = ? WHERE id = ?",
+            (time.time() + settings.WORKER_LEASE_TTL, row[0]),
+        )
+        return row[1]
+    
+    async def dequeue_job(self, timeout: int = 5) -> Optional[str]:
+        """Poll for the next queued job for up to `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            job_id = await self._run(self._transaction, self._claim_next_job)
+            if job_id or time.monotonic() >= deadline:
+                return job_id
+            await asyncio.sleep(QUEUE_POLL_INTERVAL)
+    
+    async def renew_job_lease(self, job_id: str) -> None:
+        await self._run(
+            self._execute,
+            "UPDATE queue SET lease_expires = ? WHERE job_id = ? AND processing = 1",
+            (time.time() + settings.WORKER_LEASE_TTL, job_id),
+        )
+    
+    async def ack_job(self, job_id: str) -> None:
+        await self.flush()
+        await self._run(
+            self._execute,
+            "DELETE FROM queue WHERE id = (SELECT id FROM queue WHERE job_id = ? AND processing = 1 LIMIT 1)",
+            (job_id,),
+        )
+    
+    async def requeue_processing_jobs(self) -> int:
+        # Entries without a lease predate leases; treat them as expired
+        return await self._run(
+            self._execute,
+            "UPDATE queue SET processing = 0, lease_expires = NULL "
+            "WHERE processing = 1 AND (lease_expires IS NULL OR lease_expires <= ?)",
+            (time.time(),),
+        )
+    
+    async def queue_length(self) -> int:
+        return (await self._run(self._query, "SELECT COUNT(*) FROM queue WHERE processing = 0"))[0][0]
+    
+    # ========================================================================
+    # In-Process Cache / Cleanup
+    # ========================================================================
+    
+    def get_local(self, job_id: str, name: str) -> Optional[Any]:
+        return None
+    
+    def set_local(self, job_id: str, name: str, value: Any, ttl: Optional[float] = None) -> None:
+        pass
+    
+    async def watch_invalidations(self) -> None:
+        pass
+    
+    async def delete_job(self, job_id: str) -> None:
+        await self.flush()
+    
+        def delete(db):
+            # Range scan on the primary key: ';' sorts right after ':'
+            db.execute("DELETE FROM kv WHERE key >= ? AND key < ?", (f"job:{job_id}:", f"job:{job_id};"))
+            db.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        await self._run(self._transaction, delete)
+    
+    async def health_check(self) -> bool:
+        try:
+            await self._run(self._query, "SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+    
+    # ========================================================================
+    # User Settings
+    # ========================================================================
+    
+    async def get_settings(self, client_id: str) -> dict:
+        """Get user settings by client_id."""
+        data = await self.get_shared(f"settings:{client_id}")
+        if not isinstance(data, dict):
+            # Return defaults
+            return {
+                "gemini_enabled": False,
+                "demo_mode": "cached"
+            }
+        return data
+    
+    async def set_settings(self, client_id: str, user_settings: dict) -> None:
+        """Set user settings by client_id."""
+        # Settings last longer than job data (24x VALKEY_TTL)
+        await self.set_shared(f"settings:{client_id}", user_settings, settings.VALKEY_TTL * 24)
@@ -0,0 +1,194 @@
+"""Shared claim-verification cache with near-duplicate matching.
+
+Claims are canonicalized (case, punctuation, whitespace) and stored under a
+hash of their canonical text, so the same claim verified by any job is reused.
+A 64-bit SimHash of the claim's content words is indexed in four 16-bit bands; a
+paraphrase within CLAIM_CACHE_SIMHASH_DISTANCE bits shares at least one band
+and is found without scanning. Near-duplicates must also mention exactly the
+same numbers, so "86%" never matches "68%", carry exactly the same negation and
+polarity words, so "reached 86%" never matches "never reached 86%", and share
+at least CLAIM_CACHE_MIN_JACCARD of their content words. Anything else is only
+reused on an exact canonical match.
+
+Freshness depends on claim_type (CLAIM_CACHE_TTLS): statistics go stale
+quickly, historical facts do not.
+"""
+import hashlib
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Optional
+
+from config import settings
+# Use mock cache for local development without Redis
+try:
+    from cache import cache
+except Exception:
+    from cache_mock import cache
+
+
+SIMHASH_BITS = 64
+BAND_BITS = 16
+STATS_KINDS = ("evidence", "rubric")
+STATS_OUTCOMES = ("hit", "near_hit", "miss", "store")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*%?")
+_NUMBER_RE = re.compile(r"[0-9]+(?:[.,][0-9]+)*%?")
+# Words that flip or qualify a claim's truth; a near-duplicate must use exactly the same ones
+_POLARITY_RE = re.compile(
+    r"n['\u2019]t\b|\b(?:not|no|never|none|nobody|nothing|nowhere|neither|nor|without|cannot|"
+    r"false|falsely|untrue|denied|denies|deny|refuted|refutes|debunked|myth|hoax|fake|"
+    r"fewer|less|lower|decreased|declined|fell|dropped)\b"
+)
+_STOP_WORDS = frozenset(
+    "a an the this that these those of to in on at by for from with and or as "
+    "is are was were be been has have had it its according reports report reported "
+    "says said claims claimed states stated".split()
+)
+
+
+def canonicalize(claim_text: str) -> str:
+    """Lowercase, fold unicode and keep only word/number tokens."""
+    folded = unicodedata.normalize("NFKC", claim_text).lower()
+    return " ".join(_TOKEN_RE.findall(folded))
+
+
+def claim_key(canonical: str) -> str:
+    """Stable key for a canonical claim."""
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def simhash(canonical: str) -> int:
+    """64-bit SimHash over content words (stop words and attribution verbs dropped)."""
+    features = [token for token in canonical.split() if token not in _STOP_WORDS]
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+
+
+def _bands(fingerprint: int) -> list[str]:
+    """Index keys for each 16-bit band of a fingerprint."""
+    mask = (1 << BAND_BITS) - 1
+    # "bandz": band indexes became expiring sorted sets; old plain "band" sets just age out
+    return [
+        f"claimcache:bandz:{i}:{(fingerprint >> (i * BAND_BITS)) & mask:04x}"
+        for i in range(SIMHASH_BITS // BAND_BITS)
+    ]
+
+
+def _numbers(canonical: str) -> list[str]:
+    return sorted(_NUMBER_RE.findall(canonical))
+
+
+def _polarity(claim_text: str) -> list[str]:
+    """Negation and polarity words of a claim (contractions counted as "n't")."""
+    folded = unicodedata.normalize("NFKC", claim_text).lower()
+    return sorted(match.replace("\u2019", "'") for match in _POLARITY_RE.findall(folded))
+
+
+def _content_words(canonical: str) -> set[str]:
+    return {token for token in canonical.split() if token not in _STOP_WORDS}
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def _ttl(claim_type: Optional[str]) -> int:
+    return settings.CLAIM_CACHE_TTLS.get(claim_type or "", settings.CLAIM_CACHE_DEFAULT_TTL)
+
+
+def _entry_key(kind: str, key: str, variant: str) -> str:
+    return f"claimcache:{kind}:{variant}:{key}" if variant else f"claimcache:{kind}:{key}"
+
+
+async def _count(kind: str, outcome: str) -> None:
+    await cache.incr_counter(f"stats:claim_cache:{kind}:{outcome}")
+
+
+async def lookup(claim_text: str, claim_type: Optional[str], kind: str, variant: str = "") -> Optional[Any]:
+    """
+    Return the cached `kind` ("evidence" or "rubric") for a claim or a near-duplicate.
+
+    `variant` narrows the entry further (rubrics are stored per evidence verdict).
+    The returned value is exactly what store() was given.
+    """
+    if not settings.CLAIM_CACHE_ENABLED:
+        return None
+
+    canonical = canonicalize(claim_text)
+    key = claim_key(canonical)
+    entry = await cache.get_shared(_entry_key(kind, key, variant))
+    if entry is not None:
+        await _count(kind, "hit")
+        return entry["value"]
+
+    fingerprint = simhash(canonical)
+    numbers = _numbers(canonical)
+    polarity = _polarity(claim_text)
+    words = _content_words(canonical)
+    shared_bands = Counter()
+    for band_key in _bands(fingerprint):
+        shared_bands.update(await cache.get_index(band_key))
+    shared_bands.pop(key, None)
+    # Claims sharing more bands are likelier to be within distance; check those first
+    candidates = [candidate for candidate, _ in shared_bands.most_common(settings.CLAIM_CACHE_MAX_CANDIDATES)]
+    entries = await cache.get_many_shared([_entry_key(kind, candidate, variant) for candidate in candidates])
+
+    best = None
+    for entry in entries.values():
+        if entry.get("claim_type") != claim_type or entry.get("numbers") != numbers:
+            continue
+        # Entries stored before polarity was recorded are only reused on exact matches
+        if entry.get("polarity") != polarity:
+            continue
+        if _jaccard(words, _content_words(canonicalize(entry["claim_text"]))) < settings.CLAIM_CACHE_MIN_JACCARD:
+            continue
+        distance = bin(entry["simhash"] ^ fingerprint).count("1")
+        if distance <= settings.CLAIM_CACHE_SIMHASH_DISTANCE and (best is None or distance < best[0]):
+            best = (distance, entry)
+
+    if best is None:
+        await _count(kind, "miss")
+        return None
+    await _count(kind, "near_hit")
+    return best[1]["value"]
+
+
+async def store(claim_text: str, claim_type: Optional[str], kind: str, value: Any, variant: str = "") -> None:
+    """Cache a verification artifact for a claim with its claim_type freshness TTL."""
+    if not settings.CLAIM_CACHE_ENABLED:
+        return
+
+    canonical = canonicalize(claim_text)
+    key = claim_key(canonical)
+    fingerprint = simhash(canonical)
+    ttl = _ttl(claim_type)
+    await cache.set_shared(_entry_key(kind, key, variant), {
+        "claim_text": claim_text,
+        "claim_type": claim_type,
+        "simhash": fingerprint,
+        "numbers": _numbers(canonical),
+        "polarity": _polarity(claim_text),
+        "value": value,
+    }, ttl)
+    for band_key in _bands(fingerprint):
+        # Band members expire with the entry, so bands stop pointing at long-gone claims
+        await cache.add_to_index(band_key, key, ttl, settings.CLAIM_CACHE_MAX_BAND_MEMBERS)
+    await _count(kind, "store")
+
+
+async def stats() -> dict:
+    """Hit/miss counters per artifact kind."""
+    names = [
+        f"stats:claim_cache:{kind}:{outcome}"
+        for kind in STATS_KINDS for outcome in STATS_OUTCOMES
+    ]
+    counters = await cache.get_counters(names)
+    return {
+        kind: {outcome: counters[f"stats:claim_cache:{kind}:{outcome}"] for outcome in STATS_OUTCOMES}
+        for kind in STATS_KINDS
+    }
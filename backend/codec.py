@@ -0,0 +1,58 @@
+"""Value codec shared by the cache backends (orjson when available, zlib for large values)."""
+import base64
+import json
+import zlib
+from typing import Any, Optional
+
+from config import settings
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib codec produces the same JSON
+    orjson = None
+
+
+# Format tag for compressed values. Untagged values are plain JSON or raw
+# strings, which is everything written before the codec existed.
+ZLIB_TAG = "\x00z:"
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_value(value: Any) -> str:
+    """
+    Serialize a value for storage.
+    
+    Short strings are stored as-is and other values as compact JSON. Anything
+    whose serialized form reaches CACHE_COMPRESS_MIN_BYTES is zlib-compressed
+    and stored base64-encoded behind ZLIB_TAG.
+    """
+    if isinstance(value, str) and len(value) < settings.CACHE_COMPRESS_MIN_BYTES:
+        return value
+    payload = _dumps(value)
+    if len(payload) < settings.CACHE_COMPRESS_MIN_BYTES:
+        return payload.decode("utf-8")
+    compressed = zlib.compress(payload, settings.CACHE_COMPRESS_LEVEL)
+    return ZLIB_TAG + base64.b64encode(compressed).decode("ascii")
+
+
+def decode_value(data: Optional[str]) -> Optional[Any]:
+    """Inverse of encode_value(); also reads untagged legacy values."""
+    if data is None:
+        return None
+    if data.startswith(ZLIB_TAG):
+        return _loads(zlib.decompress(base64.b64decode(data[len(ZLIB_TAG):])))
+    try:
+        return _loads(data)
+    except (TypeError, ValueError):
+        return data
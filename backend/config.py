@@ -19,17 +19,108 @@ class Settings(BaseSettings):
     # Debug Settings
     DEBUG_JOB_ID: str = ""
     
+    # Cache backend: "valkey" (falls back to in-memory if unreachable),
+    # "sqlite" (persistent single-file store) or "memory"
+    CACHE_BACKEND: str = "valkey"
+    SQLITE_CACHE_PATH: str = "proofpulse_cache.db"
+    SQLITE_FLUSH_INTERVAL: float = 0.05  # seconds buffered writes wait before one batched commit
+    SQLITE_BATCH_SIZE: int = 500  # pending writes that force an immediate flush
+    SQLITE_PURGE_INTERVAL: int = 60  # seconds between deletes of expired rows
+    
     # Valkey/Redis Configuration
     VALKEY_URL: str = "redis://localhost:6379"
     VALKEY_TTL: int = 3600  # 1 hour TTL for cached data
+    VALKEY_MAX_CONNECTIONS: int = 50  # async connection pool size per process
+    VALKEY_POOL_TIMEOUT: int = 5  # seconds to wait for a free pooled connection
+    VALKEY_CONNECT_TIMEOUT: int = 1
+    # "keys": one string key per job field (job:{id}:{field})
+    # "hash": one hash per job (job:{id}); legacy per-field keys stay readable
+    VALKEY_JOB_LAYOUT: str = "keys"
+    CACHE_COMPRESS_MIN_BYTES: int = 4096  # larger serialized values are zlib-compressed
+    CACHE_COMPRESS_LEVEL: int = 6
+    
+    # In-process LRU in front of Valkey (invalidated via keyspace notifications)
+    LOCAL_CACHE_ENABLED: bool = False
+    LOCAL_CACHE_MAX_JOBS: int = 1000
+    LOCAL_CACHE_STATUS_TTL: float = 2.0  # upper bound on status staleness
+    
+    # In-memory fallback cache (used when Valkey is unreachable)
+    MOCK_CACHE_MAX_ENTRIES: int = 100000
+    MOCK_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # approximate; LRU entries evicted beyond this
+    MOCK_CACHE_SWEEP_INTERVAL: int = 60  # seconds between full expiry sweeps
+    
+    # Cross-job result cache (identical inputs reuse a stored final_result)
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_TTL: int = 7 * 24 * 3600  # 7 days, independent of VALKEY_TTL
+    RESULT_CACHE_MAX_ENTRIES: int = 10000  # least recently used results are evicted beyond this
+    RESULT_HTTP_CACHE_MAX_ENTRIES: int = 256  # serialized /result bodies (ETag, gzip/br) kept per API process
+    
+    # Shared claim-verification cache (evidence + rubric reused across jobs)
+    CLAIM_CACHE_ENABLED: bool = True
+    CLAIM_CACHE_TTLS: dict[str, int] = {
+        "statistical": 6 * 3600,
+        "policy": 24 * 3600,
+        "scientific": 7 * 24 * 3600,
+        "historical": 30 * 24 * 3600,
+    }
+    CLAIM_CACHE_DEFAULT_TTL: int = 24 * 3600  # unknown claim types
+    CLAIM_CACHE_SIMHASH_DISTANCE: int = 3  # max differing SimHash bits for a near-duplicate hit
+    CLAIM_CACHE_MIN_JACCARD: float = 0.8  # min content-word overlap for a near-duplicate hit
+    CLAIM_CACHE_MAX_CANDIDATES: int = 64  # near-duplicate candidates fetched per lookup (one batched read)
+    CLAIM_CACHE_MAX_BAND_MEMBERS: int = 1024  # claims kept per SimHash band; the shortest-lived are dropped first
     
     # Application Settings
     MAX_VIDEO_DURATION: int = 120  # seconds
     MAX_CLAIMS: int = 5
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
     
+    # Pipeline Concurrency
+    CLAIM_CONCURRENCY_PER_JOB: int = 5  # parallel claim verifications per job (1 = sequential)
+    CLAIM_CONCURRENCY_GLOBAL: int = 20  # cap on claim verifications across all jobs in this process
+    CLAIM_DAG_ENABLED: bool = True  # run stages 3+4 as independent per-claim chains
+    CLAIM_STREAMING_ENABLED: bool = True  # start claim chains while stage 2 is still streaming
+    CLAIM_BATCH_VERIFY_ENABLED: bool = False  # verify a job's claims in batched messages (disables streaming)
+    CLAIM_BATCH_SIZE: int = 5  # claims per batched verification message
+    
+    # Backboard assistant (created once, ID shared through the cache by all processes)
+    BACKBOARD_ASSISTANT_TTL: int = 365 * 24 * 3600
+    BACKBOARD_BOOTSTRAP_LOCK_TTL: int = 30  # seconds one process may hold the creation lock
+    
+    # Backboard thread pool (threads created ahead of time, shared by all jobs)
+    BACKBOARD_THREAD_POOL_SIZE: int = 10  # idle threads kept ready; 0 creates one per message
+    BACKBOARD_THREAD_MAX_USES: int = 1  # messages per thread; >1 reuses threads, whose history carries over
+    
+    # Coalescing of identical in-flight LLM calls (shared across jobs, processes and nodes)
+    COALESCE_ENABLED: bool = True
+    COALESCE_LOCK_TTL: int = 120  # upper bound on one call; waiting callers take over after it
+    COALESCE_RESULT_TTL: int = 30  # seconds a finished result stays available to late waiters
+    COALESCE_POLL_INTERVAL: float = 0.5  # waiters re-check for the result (backends without pub/sub)
+    
+    # Job Queue / Workers
+    JOB_QUEUE_ENABLED: bool = False  # API enqueues jobs for worker.py instead of running them in-process
+    WORKER_CONCURRENCY: int = 4  # concurrent jobs per worker process
+    WORKER_PROCESSES: int = 1
+    WORKER_POLL_TIMEOUT: int = 5  # seconds a consumer blocks on the queue before re-checking shutdown
+    WORKER_METRICS_PORT: int = 0  # serve worker metrics on this port (+i per process); 0 disables
+    WORKER_LEASE_TTL: int = 60  # seconds a running job stays leased without a heartbeat; workers requeue expired ones
+    
+    # Tracing (GET /trace)
+    TRACE_MAX_SPANS: int = 5000  # spans kept per job; later ones are counted as dropped
+    
     # Storage
     UPLOAD_DIR: str = "uploads"
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # bytes copied per read when storing uploads
+    UPLOAD_ARTIFACT_TTL: int = 30 * 24 * 3600  # extracted text reused for identical uploads
+    
+    # Push-based status (/status/stream, /status/ws, /status?wait=)
+    STATUS_STREAM_KEEPALIVE: int = 15  # seconds between keepalives / status re-checks
+    STATUS_POLL_INTERVAL: float = 0.5  # SQLite backend: how often other processes' transitions are picked up
+    STATUS_LONG_POLL_MAX: int = 60  # upper bound for /status?wait=
+    
+    # Background sweeper (removes expired jobs' leftovers and upload files)
+    SWEEPER_ENABLED: bool = True
+    SWEEPER_INTERVAL: int = 300  # seconds between sweeps
+    SWEEPER_BATCH_SIZE: int = 500  # expired jobs handled per sweep
     
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://localhost:3001", "http://localhost:3002", "http://localhost:5173"]
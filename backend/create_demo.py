@@ -144,11 +144,11 @@ A new archaeological discovery in Egypt claims to have found a 4,500-year-old py
     }
     
     # Store in cache
-    cache.set_job_status(demo_job_id, "READY", "Demo result (cached)")
-    cache.set_job_data(demo_job_id, "type", "text")
-    cache.set_job_data(demo_job_id, "raw", demo_text)
-    cache.set_job_data(demo_job_id, "final_result", final_result)
-    cache.set_job_data(demo_job_id, "created_at", datetime.utcnow().isoformat())
+    await cache.set_job_status(demo_job_id, "READY", "Demo result (cached)")
+    await cache.set_job_data(demo_job_id, "type", "text")
+    await cache.set_job_data(demo_job_id, "raw", demo_text)
+    await cache.set_job_data(demo_job_id, "final_result", final_result)
+    await cache.set_job_data(demo_job_id, "created_at", datetime.utcnow().isoformat())
     
     print(f"✅ Demo created successfully!")
     print(f"   Job ID: {demo_job_id}")
@@ -0,0 +1,26 @@
+"""Content fingerprints for reusing pipeline results across jobs."""
+import hashlib
+
+from config import settings
+
+
+# Bump whenever prompts, models or scoring change so stale results stop matching
+PIPELINE_VERSION = "2024.2"
+
+
+def normalize_for_hash(text: str) -> str:
+    """Collapse whitespace so formatting-only differences hash identically."""
+    return " ".join(text.split())
+
+
+def content_hash(normalized_text: str) -> str:
+    """
+    Hash extracted text together with everything else that shapes the result.
+    
+    Two jobs with the same hash would produce the same final_result, so one can
+    be served from the other's output.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{PIPELINE_VERSION}|max_claims={settings.MAX_CLAIMS}|".encode("utf-8"))
+    digest.update(normalize_for_hash(normalized_text).encode("utf-8"))
+    return digest.hexdigest()
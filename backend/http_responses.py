@@ -0,0 +1,156 @@
+"""Ranged, conditional and compressed HTTP responses for /video and /result."""
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+try:
+    import brotli
+except ImportError:  # optional; gzip is offered without it
+    brotli = None
+
+
+FILE_CHUNK_SIZE = 256 * 1024
+COMPRESS_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """
+    Resolve a single-range `Range` header to inclusive (start, end) offsets.
+
+    Returns None when the header should be ignored (absent, malformed or
+    multi-range: the full file is served instead). Raises ValueError when the
+    range cannot be satisfied.
+    """
+    match = _RANGE_RE.fullmatch(header.strip()) if header else None
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range outside the file")
+    return start, end
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def _read_file_range(path: str, start: int, end: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(f.read, min(FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_response(request: Request, path: str, media_type: str, etag: str,
+                  filename: Optional[str] = None) -> Response:
+    """
+    Serve a file with byte-range (206) and If-None-Match (304) support.
+
+    `etag` must identify the file's content; uploads are content-addressed, so
+    their hash is used. A Range with a stale If-Range gets the full file.
+    """
+    size = os.path.getsize(path)
+    headers = {"Accept-Ranges": "bytes", "ETag": etag}
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+    if_range = request.headers.get("if-range")
+    if byte_range is None or (if_range and if_range != etag):
+        return FileResponse(path, media_type=media_type, filename=filename, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _read_file_range(path, start, end), status_code=206, media_type=media_type, headers=headers
+    )
+
+
+def json_representation(value: Any) -> dict:
+    """
+    Serialize a JSON body once, with a strong ETag over its bytes.
+
+    The returned dict also memoizes compressed variants built by
+    json_response(), so keeping it around avoids repeating either step.
+    """
+    body = json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return {"etag": hashlib.sha256(body).hexdigest()[:32], "identity": body}
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header (q=0 means refused)."""
+    accepted = set()
+    for token in accept_encoding.lower().split(","):
+        coding, _, params = token.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def json_response(request: Request, representation: dict) -> Response:
+    """
+    Send a json_representation(), answering 304 for a matching If-None-Match.
+
+    Bodies of at least COMPRESS_MIN_BYTES are sent brotli- or gzip-compressed
+    when the client accepts it; each encoding carries its own ETag.
+    """
+    body = representation["identity"]
+    encoding = None
+    if len(body) >= COMPRESS_MIN_BYTES:
+        encoding = _negotiate_encoding(request.headers.get("accept-encoding", ""))
+
+    etag = f'"{representation["etag"]}-{encoding}"' if encoding else f'"{representation["etag"]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        if encoding not in representation:
+            representation[encoding] = _compress(body, encoding)
+        body = representation[encoding]
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
@@ -1,16 +1,34 @@
 """Backboard SDK integration for claim extraction and evidence retrieval."""
 import json
+import hashlib
 import uuid
 import asyncio
-from typing import Dict, List, Any, Optional
+import contextvars
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, List, Any, Optional, AsyncIterator
 
 from backboard import BackboardClient
+from backboard.exceptions import BackboardNotFoundError
 
 from config import settings
+from metrics import track_call, BACKBOARD_THREAD_LEASES, BACKBOARD_THREADS_IDLE, VERIFY_BATCH_CLAIMS
+from singleflight import coalesce
+# Use mock cache for local development without Redis
+try:
+    from cache import cache
+except Exception:
+    from cache_mock import cache
 
 
 _client: Optional[BackboardClient] = None
 _assistant_id: Optional[str] = None
+_assistant_lock: Optional[asyncio.Lock] = None
+
+ASSISTANT_POLL_INTERVAL = 0.5  # seconds between checks while another process creates the assistant
+# Type of the streamed events carrying generated text; the SDK passes the
+# server's event dicts through and defines no constant for it
+STREAM_CONTENT_EVENT = "content_streaming"
 
 
 def _extract_attr(obj: Any, key: str, default: Any = None) -> Any:
@@ -49,27 +67,233 @@ async def _get_client() -> BackboardClient:
     return _client
 
 
-async def _get_or_create_assistant() -> str:
-    """Create assistant once and reuse its id across requests."""
-    global _assistant_id
-    if _assistant_id:
-        return _assistant_id
+def _assistant_key() -> str:
+    """Cache key of the shared assistant ID (per API key, so accounts never share one)."""
+    account = hashlib.sha256(settings.BACKBOARD_API_KEY.encode("utf-8")).hexdigest()[:16]
+    return f"backboard:assistant:{account}"
+
 
+async def _create_assistant() -> str:
     client = await _get_client()
-    assistant = await client.create_assistant(
-        name="ProofPulse Fact Checker",
-        description="Fact-checking assistant for claim extraction and verification",
-    )
-    _assistant_id = _extract_attr(assistant, "assistant_id")
-    if not _assistant_id:
+    with track_call("backboard", "create_assistant"):
+        assistant = await asyncio.wait_for(
+            client.create_assistant(
+                name="ProofPulse Fact Checker",
+                description="Fact-checking assistant for claim extraction and verification",
+            ),
+            timeout=20.0
+        )
+    assistant_id = _extract_attr(assistant, "assistant_id")
+    if not assistant_id:
         raise RuntimeError("Backboard assistant_id missing in SDK response")
+    return str(assistant_id)
+
+
+async def _load_or_create_shared_assistant(stale: Optional[str] = None) -> str:
+    """
+    Read the assistant ID shared by all processes, creating it if there is none.
+    
+    Creation happens under a cache lock, so workers starting together create
+    one assistant between them; the others poll until its ID is stored. A
+    holder that dies frees the lock after BACKBOARD_BOOTSTRAP_LOCK_TTL. A
+    stored ID equal to `stale` (deleted on Backboard) counts as none.
+    """
+    key = _assistant_key()
+    while True:
+        assistant_id = await cache.get_shared(key)
+        if assistant_id and assistant_id != stale:
+            return assistant_id
+        token = await cache.acquire_lock(key, settings.BACKBOARD_BOOTSTRAP_LOCK_TTL)
+        if token is None:
+            await asyncio.sleep(ASSISTANT_POLL_INTERVAL)
+            continue
+        try:
+            # The previous holder may have stored it between our read and the lock
+            assistant_id = await cache.get_shared(key)
+            if not assistant_id or assistant_id == stale:
+                assistant_id = await _create_assistant()
+                await cache.set_shared(key, assistant_id, settings.BACKBOARD_ASSISTANT_TTL)
+                print(f"🤖 Created Backboard assistant {assistant_id}")
+            return assistant_id
+        finally:
+            await cache.release_lock(key, token)
+
+
+async def _get_or_create_assistant(stale: Optional[str] = None) -> str:
+    """
+    Return the assistant ID, bootstrapping it once for all concurrent callers.
+
+    Pass the ID Backboard no longer knows as `stale` to replace it; callers that
+    hit the same deleted assistant together share one replacement.
+    """
+    global _assistant_id, _assistant_lock
+    if _assistant_id and _assistant_id != stale:
+        return _assistant_id
+
+    if _assistant_lock is None:
+        _assistant_lock = asyncio.Lock()
+    async with _assistant_lock:
+        if not _assistant_id or _assistant_id == stale:
+            _assistant_id = await _load_or_create_shared_assistant(stale)
     return _assistant_id
 
 
-async def extract_claims(text: str) -> List[Dict]:
-    """Extract 3-5 verifiable factual claims from text using Backboard SDK."""
+async def bootstrap_assistant() -> Optional[str]:
+    """
+    Resolve the assistant at startup so the first request does not pay for it.
+    
+    Failures are logged, not raised; requests then retry the bootstrap.
+    """
+    if not settings.BACKBOARD_API_KEY:
+        return None
+    try:
+        assistant_id = await _get_or_create_assistant()
+    except Exception as e:
+        print(f"⚠️  Backboard assistant bootstrap failed: {e}")
+        return None
+    print(f"🤖 Using Backboard assistant {assistant_id}")
+    return assistant_id
+
+
+# ============================================================================
+# Thread Pool
+# ============================================================================
+
+class _PooledThread:
+    """A Backboard thread held by the pool, with its use count."""
+
+    __slots__ = ("thread_id", "uses")
+
+    def __init__(self, thread_id: str):
+        self.thread_id = thread_id
+        self.uses = 0
+
+
+class _ThreadPool:
+    """
+    Threads created ahead of time so messages do not wait on create_thread.
+
+    Shared by all jobs in the process. A leased thread is returned after its
+    message and goes back to the idle set only if the message succeeded and
+    it has uses left (BACKBOARD_THREAD_MAX_USES). Threads that do not go back
+    are deleted on Backboard and replaced by a background refill up to
+    BACKBOARD_THREAD_POOL_SIZE, so threads are only created for messages that
+    consumed one. When the pool is empty a thread is created inline, as before.
+    """
+
+    def __init__(self):
+        self.idle: deque[_PooledThread] = deque()
+        self.creating = 0
+        self._filler: Optional[asyncio.Task] = None
+        self._deleting: set[asyncio.Task] = set()
+
+    async def _create(self) -> _PooledThread:
+        client = await _get_client()
+        assistant_id = await _get_or_create_assistant()
+        try:
+            with track_call("backboard", "create_thread"):
+                thread = await asyncio.wait_for(client.create_thread(assistant_id), timeout=20.0)
+        except BackboardNotFoundError:
+            # The shared assistant was deleted on Backboard: bootstrap a new one once
+            print(f"⚠️  Backboard assistant {assistant_id} not found; creating a new one")
+            assistant_id = await _get_or_create_assistant(stale=assistant_id)
+            with track_call("backboard", "create_thread"):
+                thread = await asyncio.wait_for(client.create_thread(assistant_id), timeout=20.0)
+        thread_id = _extract_attr(thread, "thread_id")
+        if not thread_id:
+            raise RuntimeError("Backboard thread_id missing in SDK response")
+        return _PooledThread(str(thread_id))
+
+    async def lease(self) -> _PooledThread:
+        """Take an idle thread, or create one if none is ready."""
+        if self.idle:
+            thread = self.idle.popleft()
+            BACKBOARD_THREADS_IDLE.set(len(self.idle))
+            BACKBOARD_THREAD_LEASES.inc(outcome="pooled")
+            return thread
+        BACKBOARD_THREAD_LEASES.inc(outcome="created")
+        return await self._create()
+
+    def release(self, thread: _PooledThread, healthy: bool) -> None:
+        """Return a leased thread; if unhealthy, used up or not needed it is deleted and replaced."""
+        thread.uses += 1
+        if (
+            healthy
+            and thread.uses < settings.BACKBOARD_THREAD_MAX_USES
+            and len(self.idle) < settings.BACKBOARD_THREAD_POOL_SIZE
+        ):
+            self.idle.append(thread)
+            BACKBOARD_THREADS_IDLE.set(len(self.idle))
+            return
+        # Fresh context: cleanup and refills triggered by a job must not land in its trace
+        task = asyncio.create_task(self._delete(thread), context=contextvars.Context())
+        self._deleting.add(task)
+        task.add_done_callback(self._deleting.discard)
+        self.schedule_fill()
+
+    async def _delete(self, thread: _PooledThread) -> None:
+        try:
+            client = await _get_client()
+            with track_call("backboard", "delete_thread"):
+                await asyncio.wait_for(client.delete_thread(thread.thread_id), timeout=10.0)
+        except Exception as e:
+            print(f"⚠️  Could not delete Backboard thread {thread.thread_id}: {e}")
+
+    def schedule_fill(self) -> None:
+        """Start a background refill unless one is already running in this loop."""
+        if settings.BACKBOARD_THREAD_POOL_SIZE <= 0:
+            return
+        filler = self._filler
+        if filler is not None and not filler.done() and filler.get_loop() is asyncio.get_running_loop():
+            return
+        self._filler = asyncio.create_task(self.fill(), context=contextvars.Context())
+
+    async def fill(self) -> int:
+        """Create threads until BACKBOARD_THREAD_POOL_SIZE are idle or being created."""
+        missing = settings.BACKBOARD_THREAD_POOL_SIZE - len(self.idle) - self.creating
+        if missing <= 0:
+            return 0
+        self.creating += missing
+        try:
+            results = await asyncio.gather(*[self._create() for _ in range(missing)], return_exceptions=True)
+        finally:
+            self.creating -= missing
+        created = [result for result in results if isinstance(result, _PooledThread)]
+        self.idle.extend(created)
+        BACKBOARD_THREADS_IDLE.set(len(self.idle))
+        if len(created) < missing:
+            error = next(result for result in results if isinstance(result, BaseException))
+            print(f"⚠️  Backboard thread pool created {len(created)}/{missing} threads: {error}")
+        return len(created)
+
+
+_thread_pool = _ThreadPool()
+
+
+@asynccontextmanager
+async def _leased_thread() -> AsyncIterator[str]:
+    """Lease a pooled thread ID for one message; it is returned only if the block succeeds."""
+    thread = await _thread_pool.lease()
+    healthy = False
     try:
-        prompt = f"""You are a precise fact-checking analyst. Return valid JSON only.
+        yield thread.thread_id
+        healthy = True
+    finally:
+        _thread_pool.release(thread, healthy)
+
+
+async def run_thread_pool() -> None:
+    """Fill the thread pool at startup; afterwards released threads trigger the refills."""
+    try:
+        created = await _thread_pool.fill()
+        print(f"🧵 Created {created} Backboard threads for the pool")
+    except Exception as e:
+        print(f"⚠️  Backboard thread pool fill failed: {e}")
+
+
+def _claim_extraction_prompt(text: str) -> str:
+    """Build the claim extraction prompt shared by the streaming and non-streaming paths."""
+    return f"""You are a precise fact-checking analyst. Return valid JSON only.
 
 Analyze the text and extract ONLY verifiable factual claims.
 
@@ -94,29 +318,111 @@ Return STRICT JSON only:
   ]
 }}"""
 
-        client = await _get_client()
-        assistant_id = await _get_or_create_assistant()
-        thread = await client.create_thread(assistant_id)
-        thread_id = _extract_attr(thread, "thread_id")
-        if not thread_id:
-            raise RuntimeError("Backboard thread_id missing in SDK response")
 
-        response = await client.add_message(
-            thread_id=thread_id,
-            content=prompt,
-            llm_provider="openai",
-            model_name="gpt-4o",
-            stream=False,
-            memory="off",
-        )
+def _normalize_claim(claim: Dict) -> Dict:
+    """Fill optional claim fields the model may omit."""
+    claim.setdefault("claim_id", str(uuid.uuid4()))
+    claim.setdefault("start_time", None)
+    claim.setdefault("end_time", None)
+    return claim
+
+
+def _claim_key(claim: Dict) -> str:
+    """Claim text with case and whitespace normalized, to spot a claim extracted twice."""
+    return " ".join(str(claim.get("claim_text", "")).lower().split())
+
+
+class _ClaimArrayParser:
+    """Incrementally pull complete objects out of a streamed {"claims": [...]} document."""
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0
+        self.in_array = False
+        self.done = False
+        self.depth = 0
+        self.obj_start: Optional[int] = None
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """Append a chunk and return any claim objects completed by it."""
+        self.buffer += chunk
+        completed = []
+
+        if not self.in_array:
+            key = self.buffer.find('"claims"')
+            if key == -1:
+                return completed
+            bracket = self.buffer.find("[", key)
+            if bracket == -1:
+                return completed
+            self.in_array = True
+            self.pos = bracket + 1
+
+        while self.pos < len(self.buffer) and not self.done:
+            ch = self.buffer[self.pos]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                if self.depth == 0:
+                    self.obj_start = self.pos
+                self.depth += 1
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0 and self.obj_start is not None:
+                    try:
+                        completed.append(json.loads(self.buffer[self.obj_start:self.pos + 1]))
+                    except json.JSONDecodeError:
+                        pass
+                    self.obj_start = None
+            elif ch == "]" and self.depth == 0:
+                self.done = True
+            self.pos += 1
+
+        return completed
+
+
+def _coalesced(operation: str, prompt: str, call, **request):
+    """
+    Share one message among identical concurrent calls; see singleflight.py.
+    
+    Calls are identical when model, prompt and any extra `request` values the
+    result depends on match.
+    """
+    return coalesce(f"backboard.{operation}", {"model": "openai/gpt-4o", "prompt": prompt, **request}, call)
+
+
+async def extract_claims(text: str) -> List[Dict]:
+    """Extract 3-5 verifiable factual claims from text using Backboard SDK."""
+    prompt = _claim_extraction_prompt(text)
+    return await _coalesced("extract_claims", prompt, lambda: _extract_claims(text, prompt))
+
+
+async def _extract_claims(text: str, prompt: str) -> List[Dict]:
+    try:
+        client = await _get_client()
+        async with _leased_thread() as thread_id:
+            with track_call("backboard", "add_message"):
+                response = await client.add_message(
+                    thread_id=thread_id,
+                    content=prompt,
+                    llm_provider="openai",
+                    model_name="gpt-4o",
+                    stream=False,
+                    memory="off",
+                )
 
         claims_data = _extract_json_block(_extract_content(response))
         claims = claims_data.get("claims", [])
-        for claim in claims:
-            claim.setdefault("claim_id", str(uuid.uuid4()))
-            claim.setdefault("start_time", None)
-            claim.setdefault("end_time", None)
-        return claims
+        return [_normalize_claim(claim) for claim in claims]
 
     except Exception as e:
         error_msg = str(e)
@@ -129,14 +435,83 @@ Return STRICT JSON only:
                 "claim_type": "statistical",
                 "start_time": None,
                 "end_time": None,
+                "api_error": True,
             }
         ]
 
 
-async def verify_claim(claim_text: str) -> Dict:
-    """Verify claim using Backboard SDK with web search enabled."""
+async def stream_claims(text: str) -> AsyncIterator[Dict]:
+    """
+    Yield claims one by one as they are parsed from a streamed Backboard response.
+    
+    Falls back to the non-streaming extract_claims() when streaming fails; if
+    claims were already produced, only the claims not yet yielded follow.
+    """
+    yielded = set()
+    parser = _ClaimArrayParser()
     try:
-        prompt = f"""You are a rigorous fact-checking assistant. Return valid JSON only.
+        client = await _get_client()
+        # Timed until the stream ends, so the latency is the full generation time
+        async with _leased_thread() as thread_id:
+            with track_call("backboard", "add_message_stream"):
+                events = await client.add_message(
+                    thread_id=thread_id,
+                    content=_claim_extraction_prompt(text),
+                    llm_provider="openai",
+                    model_name="gpt-4o",
+                    stream=True,
+                    memory="off",
+                )
+
+                async for event in events:
+                    if _extract_attr(event, "type") != STREAM_CONTENT_EVENT:
+                        continue
+                    for claim in parser.feed(_extract_attr(event, "content", "") or ""):
+                        yielded.add(_claim_key(claim))
+                        yield _normalize_claim(claim)
+
+        if not parser.in_array:
+            # No recognizable claims array in the stream; parse the whole document instead
+            claims_data = _extract_json_block(parser.buffer)
+            for claim in claims_data.get("claims", []):
+                yielded.add(_claim_key(claim))
+                yield _normalize_claim(claim)
+
+    except Exception as e:
+        print(f"Claim streaming error: {str(e)}")
+        for claim in await extract_claims(text):
+            if not yielded:
+                yield claim
+            elif not claim.get("api_error") and _claim_key(claim) not in yielded:
+                # Complete a stream cut short instead of ending the job with part of its claims
+                yielded.add(_claim_key(claim))
+                yield claim
+
+
+def _normalize_evidence(evidence_data: Dict, claim_text: str) -> Dict:
+    """Fill the evidence fields the model may omit."""
+    # Ensure sources exist and are properly formatted
+    if "sources" not in evidence_data or not evidence_data["sources"]:
+        evidence_data["sources"] = [
+            {
+                "title": "Backboard Search Result",
+                "publisher": "Web Search",
+                "date": "2024-01-01",
+                "url": "https://www.backboard.io/search",
+                "snippet": f"Analysis for claim: {claim_text[:100]}..."
+            }
+        ]
+    
+    # Ensure verdict and confidence exist
+    evidence_data.setdefault("backboard_verdict", "UNCLEAR")
+    evidence_data.setdefault("backboard_confidence", 50)
+    evidence_data.setdefault("rationale", "Evidence retrieved and analyzed")
+    
+    return evidence_data
+
+
+def _verification_prompt(claim_text: str) -> str:
+    return f"""You are a rigorous fact-checking assistant. Return valid JSON only.
 
 Verify this claim and use web search for evidence.
 
@@ -158,50 +533,34 @@ Return STRICT JSON only:
   "rationale": "brief explanation"
 }}"""
 
+
+async def verify_claim(claim_text: str) -> Dict:
+    """Verify claim using Backboard SDK with web search enabled."""
+    prompt = _verification_prompt(claim_text)
+    return await _coalesced("verify_claim", prompt, lambda: _verify_claim(claim_text, prompt))
+
+
+async def _verify_claim(claim_text: str, prompt: str) -> Dict:
+    try:
         client = await _get_client()
-        assistant_id = await _get_or_create_assistant()
         
-        thread = await asyncio.wait_for(
-            client.create_thread(assistant_id),
-            timeout=20.0
-        )
-        thread_id = _extract_attr(thread, "thread_id")
-        if not thread_id:
-            raise RuntimeError("Backboard thread_id missing in SDK response")
-
         # Note: web_search is enabled by default in Backboard SDK
-        response = await asyncio.wait_for(
-            client.add_message(
-                thread_id=thread_id,
-                content=prompt,
-                llm_provider="openai",
-                model_name="gpt-4o",
-                stream=False,
-                memory="off",
-            ),
-            timeout=30.0
-        )
+        async with _leased_thread() as thread_id:
+            with track_call("backboard", "add_message"):
+                response = await asyncio.wait_for(
+                    client.add_message(
+                        thread_id=thread_id,
+                        content=prompt,
+                        llm_provider="openai",
+                        model_name="gpt-4o",
+                        stream=False,
+                        memory="off",
+                    ),
+                    timeout=30.0
+                )
 
         evidence_data = _extract_json_block(_extract_content(response))
-        
-        # Ensure sources exist and are properly formatted
-        if "sources" not in evidence_data or not evidence_data["sources"]:
-            evidence_data["sources"] = [
-                {
-                    "title": "Backboard Search Result",
-                    "publisher": "Web Search",
-                    "date": "2024-01-01",
-                    "url": "https://www.backboard.io/search",
-                    "snippet": f"Analysis for claim: {claim_text[:100]}..."
-                }
-            ]
-        
-        # Ensure verdict and confidence exist
-        evidence_data.setdefault("backboard_verdict", "UNCLEAR")
-        evidence_data.setdefault("backboard_confidence", 50)
-        evidence_data.setdefault("rationale", "Evidence retrieved and analyzed")
-        
-        return evidence_data
+        return _normalize_evidence(evidence_data, claim_text)
 
     except Exception as e:
         print(f"Claim verification error: {str(e)}")
@@ -218,22 +577,121 @@ Return STRICT JSON only:
                 }
             ],
             "rationale": "Unable to verify due to API error",
+            "api_error": True,
         }
 
 
-async def score_claim_backboard_fallback(
-    claim_text: str,
-    backboard_verdict: str,
-    backboard_confidence: int,
-    sources: List[Dict]
-) -> Dict:
+def _batch_verification_prompt(claims_by_key: Dict[str, str]) -> str:
+    return f"""You are a rigorous fact-checking assistant. Return valid JSON only.
+
+Verify each of these claims independently and use web search for evidence.
+
+Claims by key:
+{json.dumps(claims_by_key, indent=2, ensure_ascii=False)}
+
+Return STRICT JSON only, with exactly one result per claim key:
+{{
+  "results": [
+    {{
+      "key": "c1",
+      "backboard_verdict": "SUPPORTED|CONTRADICTED|UNCLEAR",
+      "backboard_confidence": 0,
+      "sources": [
+        {{
+          "title": "source title",
+          "publisher": "publisher name",
+          "date": "YYYY-MM-DD",
+          "url": "https://...",
+          "snippet": "relevant excerpt"
+        }}
+      ],
+      "rationale": "brief explanation"
+    }}
+  ]
+}}"""
+
+
+def _parse_batch_evidence(text: str, claims_by_key: Dict[str, str]) -> Dict[str, Dict]:
     """
-    Generate rubric scores using Backboard when Gemini is disabled.
+    Pull the evidence objects out of a batch reply, by claim key.
     
-    Uses Backboard's verdict and confidence to produce a complete score breakdown.
+    Entries that are not objects, carry an unknown key or no verdict are left
+    out, so the caller verifies those claims individually.
     """
+    data = _extract_json_block(text)
+    results = data.get("results", []) if isinstance(data, dict) else data
+    evidence_by_key = {}
+    for item in results if isinstance(results, list) else []:
+        if not isinstance(item, dict) or not item.get("backboard_verdict"):
+            continue
+        key = item.pop("key", None)
+        if key in claims_by_key and key not in evidence_by_key:
+            evidence_by_key[key] = _normalize_evidence(item, claims_by_key[key])
+    return evidence_by_key
+
+
+async def verify_claims(claim_texts: List[str]) -> List[Dict]:
+    """
+    Verify several claims with one Backboard message (results in input order).
+    
+    The claims go out under short keys and come back as a keyed array, so the
+    instructions are sent once instead of once per claim. Claims missing from a
+    malformed or partial reply, or all of them if the call fails, are verified
+    individually with verify_claim().
+    """
+    if len(claim_texts) <= 1:
+        return [await verify_claim(claim_text) for claim_text in claim_texts]
+    
+    claims_by_key = {f"c{i}": claim_text for i, claim_text in enumerate(claim_texts, 1)}
+    prompt = _batch_verification_prompt(claims_by_key)
+    evidence_by_key = await _coalesced(
+        "verify_claims", prompt, lambda: _verify_claims_batch(claims_by_key, prompt)
+    )
+    
+    missing = [key for key in claims_by_key if key not in evidence_by_key]
+    VERIFY_BATCH_CLAIMS.inc(len(claims_by_key) - len(missing), outcome="batched")
+    if missing:
+        print(f"Batch verification returned {len(claims_by_key) - len(missing)}/{len(claims_by_key)} claims; "
+              f"verifying {len(missing)} individually")
+        VERIFY_BATCH_CLAIMS.inc(len(missing), outcome="individual")
+        fallbacks = await asyncio.gather(*[verify_claim(claims_by_key[key]) for key in missing])
+        evidence_by_key.update(zip(missing, fallbacks))
+    return [evidence_by_key[key] for key in claims_by_key]
+
+
+async def _verify_claims_batch(claims_by_key: Dict[str, str], prompt: str) -> Dict[str, Dict]:
     try:
-        prompt = f"""You are a precise scoring assistant. Return valid JSON only.
+        client = await _get_client()
+        
+        async with _leased_thread() as thread_id:
+            with track_call("backboard", "add_message_batch"):
+                response = await asyncio.wait_for(
+                    client.add_message(
+                        thread_id=thread_id,
+                        content=prompt,
+                        llm_provider="openai",
+                        model_name="gpt-4o",
+                        stream=False,
+                        memory="off",
+                    ),
+                    # Searches for every claim happen in this one call
+                    timeout=30.0 + 15.0 * (len(claims_by_key) - 1)
+                )
+        
+        return _parse_batch_evidence(_extract_content(response), claims_by_key)
+    
+    except Exception as e:
+        print(f"Batch claim verification error: {str(e)}")
+        return {}
+
+
+def _fallback_scoring_prompt(
+    claim_text: str,
+    backboard_verdict: str,
+    backboard_confidence: int,
+    sources: List[Dict]
+) -> str:
+    return f"""You are a precise scoring assistant. Return valid JSON only.
 
 Based on the claim verification, produce rubric scores.
 
@@ -287,28 +745,50 @@ Return STRICT JSON only:
   "context_notes": "any contextual notes about the claim verification"
 }}"""
 
+
+async def score_claim_backboard_fallback(
+    claim_text: str,
+    backboard_verdict: str,
+    backboard_confidence: int,
+    sources: List[Dict]
+) -> Dict:
+    """
+    Generate rubric scores using Backboard when Gemini is disabled.
+    
+    Uses Backboard's verdict and confidence to produce a complete score breakdown.
+    """
+    prompt = _fallback_scoring_prompt(claim_text, backboard_verdict, backboard_confidence, sources)
+    return await _coalesced(
+        "score_claim",
+        prompt,
+        lambda: _score_claim_backboard_fallback(claim_text, backboard_verdict, backboard_confidence, sources, prompt),
+        sources=sources,  # only counted in the prompt, but quoted in the result
+    )
+
+
+async def _score_claim_backboard_fallback(
+    claim_text: str,
+    backboard_verdict: str,
+    backboard_confidence: int,
+    sources: List[Dict],
+    prompt: str
+) -> Dict:
+    try:
         client = await _get_client()
-        assistant_id = await _get_or_create_assistant()
         
-        thread = await asyncio.wait_for(
-            client.create_thread(assistant_id),
-            timeout=20.0
-        )
-        thread_id = _extract_attr(thread, "thread_id")
-        if not thread_id:
-            raise RuntimeError("Backboard thread_id missing in SDK response")
-
-        response = await asyncio.wait_for(
-            client.add_message(
-                thread_id=thread_id,
-                content=prompt,
-                llm_provider="openai",
-                model_name="gpt-4o",
-                stream=False,
-                memory="off",
-            ),
-            timeout=30.0
-        )
+        async with _leased_thread() as thread_id:
+            with track_call("backboard", "add_message"):
+                response = await asyncio.wait_for(
+                    client.add_message(
+                        thread_id=thread_id,
+                        content=prompt,
+                        llm_provider="openai",
+                        model_name="gpt-4o",
+                        stream=False,
+                        memory="off",
+                    ),
+                    timeout=30.0
+                )
 
         score_data = _extract_json_block(_extract_content(response))
         
@@ -345,5 +825,6 @@ Return STRICT JSON only:
             },
             "short_explanation": f"Claim is {backboard_verdict.lower()} based on {len(sources)} source(s). Evidence shows moderate support.",
             "sources_used": [{"url": s.get("url", ""), "why": "Primary evidence"} for s in sources[:3]],
-            "context_notes": "Fallback scoring applied"
+            "context_notes": "Fallback scoring applied",
+            "api_error": True,
         }
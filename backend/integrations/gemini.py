@@ -2,6 +2,8 @@
 import httpx
 import json
 from config import settings
+from metrics import track_call
+from singleflight import coalesce
 from typing import Dict, List
 
 
@@ -12,37 +14,50 @@ async def review_and_score_claim(
     backboard_confidence: int,
     sources: List[Dict]
 ) -> Dict:
-    """Call Gemini API with structured scoring prompt using REST API."""
+    """
+    Call Gemini API with structured scoring prompt using REST API.
+    
+    Identical concurrent calls (same model and prompt) share one request; see
+    singleflight.py.
+    """
+    # Build the scoring prompt
+    prompt = build_scoring_prompt(
+        claim_text,
+        context_text,
+        backboard_verdict,
+        backboard_confidence,
+        sources
+    )
+    return await coalesce(
+        "gemini.review_and_score_claim",
+        {"model": settings.GEMINI_MODEL, "prompt": prompt},
+        lambda: _review_and_score_claim(prompt, sources),
+    )
+
+
+async def _review_and_score_claim(prompt: str, sources: List[Dict]) -> Dict:
     try:
-        # Build the scoring prompt
-        prompt = build_scoring_prompt(
-            claim_text,
-            context_text,
-            backboard_verdict,
-            backboard_confidence,
-            sources
-        )
-        
         endpoint = (
             f"https://generativelanguage.googleapis.com/v1beta/models/"
             f"{settings.GEMINI_MODEL}:generateContent?key={settings.GEMINI_API_KEY}"
         )
 
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            response = await client.post(
-                endpoint,
-                headers={"Content-Type": "application/json"},
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.3,
-                        "maxOutputTokens": 2048
+        with track_call("gemini", "generate_content"):
+            async with httpx.AsyncClient(timeout=20.0) as client:
+                response = await client.post(
+                    endpoint,
+                    headers={"Content-Type": "application/json"},
+                    json={
+                        "contents": [{"parts": [{"text": prompt}]}],
+                        "generationConfig": {
+                            "temperature": 0.3,
+                            "maxOutputTokens": 2048
+                        }
                     }
-                }
-            )
+                )
 
-        if response.status_code != 200:
-            raise Exception(f"Gemini REST {response.status_code}: {response.text[:200]}")
+            if response.status_code != 200:
+                raise Exception(f"Gemini REST {response.status_code}: {response.text[:200]}")
 
         data = response.json()
         response_text = data["candidates"][0]["content"]["parts"][0]["text"].strip()
@@ -73,7 +88,8 @@ async def review_and_score_claim(
             "sources_used": [
                 {"url": sources[0]["url"], "why": "Primary source"}
             ] if sources else [],
-            "context_notes": "API error occurred"
+            "context_notes": "API error occurred",
+            "api_error": True,
         }
 
 
@@ -6,6 +6,7 @@ Uses client.indexes, client.tasks, and client.indexes.videos (SDK 1.x).
 import asyncio
 from twelvelabs import TwelveLabs
 from config import settings
+from metrics import track_call
 from typing import Optional
 import time
 
@@ -52,7 +53,8 @@ async def upload_and_transcribe(video_path: str) -> dict:
                 return list(raw.items) if raw.items else []
             return list(raw) if raw else []
 
-        indexes = await asyncio.get_event_loop().run_in_executor(None, list_indexes)
+        with track_call("twelvelabs", "list_indexes"):
+            indexes = await asyncio.get_event_loop().run_in_executor(None, list_indexes)
         for idx in indexes:
             name = getattr(idx, "name", None) or getattr(idx, "index_name", None)
             if name == index_name:
@@ -78,7 +80,8 @@ async def upload_and_transcribe(video_path: str) -> dict:
                     "Install/upgrade: pip install twelvelabs>=1.0"
                 )
 
-            index = await asyncio.get_event_loop().run_in_executor(None, create_index)
+            with track_call("twelvelabs", "create_index"):
+                index = await asyncio.get_event_loop().run_in_executor(None, create_index)
             print(f"[TwelveLabs] Index created with ID: {index.id}")
         else:
             print(f"[TwelveLabs] Using existing index: {index.id}")
@@ -90,7 +93,8 @@ async def upload_and_transcribe(video_path: str) -> dict:
             with open(video_path, "rb") as f:
                 return client.tasks.create(index_id=index.id, video_file=f)
 
-        task = await asyncio.get_event_loop().run_in_executor(None, create_task)
+        with track_call("twelvelabs", "upload"):
+            task = await asyncio.get_event_loop().run_in_executor(None, create_task)
         print(f"[TwelveLabs] Upload task created: {task.id}")
 
         # Step 3: Wait for indexing (use SDK wait_for_done if available, else poll)
@@ -107,7 +111,8 @@ async def upload_and_transcribe(video_path: str) -> dict:
                 time.sleep(5)
             raise TimeoutError("Video indexing timed out")
 
-        task_status = await asyncio.get_event_loop().run_in_executor(None, wait_task)
+        with track_call("twelvelabs", "task_wait"):
+            task_status = await asyncio.get_event_loop().run_in_executor(None, wait_task)
         video_id = task_status.video_id
         print(f"[TwelveLabs] Video indexed successfully: {video_id}")
 
@@ -121,7 +126,8 @@ async def upload_and_transcribe(video_path: str) -> dict:
                 transcription=True,
             )
 
-        video = await asyncio.get_event_loop().run_in_executor(None, get_video)
+        with track_call("twelvelabs", "retrieve_video"):
+            video = await asyncio.get_event_loop().run_in_executor(None, get_video)
 
         # Step 5: Format transcript (SDK segments use .start, .end, .value)
         normalized_text = ""
@@ -166,7 +172,8 @@ async def upload_and_transcribe(video_path: str) -> dict:
                 {
                     "start": 0.0,
                     "end": 1.0,
-                    "text": f"[ERROR] Video transcription unavailable: {error_msg}"
+                    "text": f"[ERROR] Video transcription unavailable: {error_msg}",
+                    "api_error": True,
                 }
             ]
         }
@@ -0,0 +1,42 @@
+"""In-process LRU in front of Valkey for hot job reads (status polls, finished results)."""
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class LocalCache:
+    """
+    LRU of recently read jobs, bounded by job count.
+    
+    Each job holds a few named values, each with an optional TTL. Values set
+    without a TTL (finished results) live until the job is evicted or
+    invalidated.
+    """
+    
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self.jobs = OrderedDict()  # job_id -> {name: (expires_at or None, value)}
+    
+    def get(self, job_id: str, name: str) -> Optional[Any]:
+        entries = self.jobs.get(job_id)
+        if not entries or name not in entries:
+            return None
+        expires_at, value = entries[name]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del entries[name]
+            return None
+        self.jobs.move_to_end(job_id)
+        return value
+    
+    def set(self, job_id: str, name: str, value: Any, ttl: Optional[float] = None) -> None:
+        entries = self.jobs.setdefault(job_id, {})
+        self.jobs.move_to_end(job_id)
+        entries[name] = (time.monotonic() + ttl if ttl else None, value)
+        while len(self.jobs) > self.max_jobs:
+            self.jobs.popitem(last=False)
+    
+    def invalidate(self, job_id: str) -> None:
+        self.jobs.pop(job_id, None)
+    
+    def clear(self) -> None:
+        self.jobs.clear()
@@ -5,10 +5,13 @@ warnings.filterwarnings("ignore", message=".*Field.*conflict with protected name
 
 import uuid
 import os
+import asyncio
+import json
+from collections import OrderedDict
 from datetime import datetime
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks, Header, Request
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, BackgroundTasks, Header, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from typing import Optional
 
 from config import settings
@@ -18,7 +21,14 @@ try:
 except Exception:
     from cache_mock import cache
 from models import IngestResponse, StatusResponse, ResultResponse, UserSettings, SettingsResponse
-from pipeline import process_pipeline
+from pipeline import process_pipeline, load_final_result, load_partial_result
+import claim_cache
+import metrics
+import tracing
+from sweeper import run_sweeper
+from integrations.backboard import bootstrap_assistant, run_thread_pool
+from uploads import UploadLimitMiddleware, store_upload
+from http_responses import file_response, json_representation, json_response
 
 
 # ============================================================================
@@ -31,6 +41,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Reject oversize uploads while they arrive (inside CORS, so 413s carry CORS headers)
+app.add_middleware(UploadLimitMiddleware)
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
@@ -41,6 +54,35 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def start_background_tasks():
+    """
+    Start the expired-job sweeper and the local cache invalidation listener.
+    
+    When pipelines run in this process (no worker queue), the Backboard
+    assistant is also resolved now and the thread pool started, so the first
+    request does not wait for either.
+    """
+    app.state.background_tasks = []
+    if settings.SWEEPER_ENABLED:
+        app.state.background_tasks.append(asyncio.create_task(run_sweeper()))
+    if settings.LOCAL_CACHE_ENABLED:
+        app.state.background_tasks.append(asyncio.create_task(cache.watch_invalidations()))
+    if settings.JOB_QUEUE_ENABLED and not cache.shared:
+        print("⚠️  JOB_QUEUE_ENABLED but the cache is not shared with workers; running pipelines in this process")
+    if not _queue_enabled():
+        await bootstrap_assistant()
+        if settings.BACKBOARD_API_KEY and settings.BACKBOARD_THREAD_POOL_SIZE > 0:
+            app.state.background_tasks.append(asyncio.create_task(run_thread_pool()))
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in getattr(app.state, "background_tasks", []):
+        task.cancel()
+    await cache.flush()
+
+
 # ============================================================================
 # Health Check
 # ============================================================================
@@ -48,7 +90,7 @@ app.add_middleware(
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    valkey_healthy = cache.health_check()
+    valkey_healthy = await cache.health_check()
     
     return {
         "status": "healthy" if valkey_healthy else "degraded",
@@ -56,6 +98,47 @@ async def health_check():
     }
 
 
+# ============================================================================
+# GET /cache/stats
+# ============================================================================
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters for the result, claim and upload caches, plus cache storage size."""
+    result_counters = await cache.get_counters(["stats:result_cache:hit", "stats:result_cache:miss"])
+    upload_counters = await cache.get_counters(["stats:upload_cache:hit", "stats:upload_cache:miss"])
+    return {
+        "result_cache": {
+            "hit": result_counters["stats:result_cache:hit"],
+            "miss": result_counters["stats:result_cache:miss"],
+        },
+        "claim_cache": await claim_cache.stats(),
+        "upload_cache": {
+            "hit": upload_counters["stats:upload_cache:hit"],
+            "miss": upload_counters["stats:upload_cache:miss"],
+        },
+        "storage": await cache.storage_stats(),
+    }
+
+
+# ============================================================================
+# GET /metrics
+# ============================================================================
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text exposition of this process's metrics plus shared cache state."""
+    stats = await cache_stats()
+    for name in ("result_cache", "upload_cache"):
+        for outcome, value in stats[name].items():
+            metrics.CACHE_EVENTS.set_total(value, cache=name.removesuffix("_cache"), outcome=outcome)
+    for kind, outcomes in stats["claim_cache"].items():
+        for outcome, value in outcomes.items():
+            metrics.CACHE_EVENTS.set_total(value, cache=f"claim_{kind}", outcome=outcome)
+    metrics.QUEUE_DEPTH.set(await cache.queue_length())
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
 # ============================================================================
 # POST /ingest
 # ============================================================================
@@ -90,6 +173,7 @@ async def ingest(
         os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
         
         # Handle different input types
+        upload_path = None
         if type in ["video", "pdf"]:
             # File upload required
             if not file:
@@ -99,14 +183,14 @@ async def ingest(
             if file.size and file.size > settings.MAX_FILE_SIZE:
                 raise HTTPException(413, "File too large")
             
-            # Save file (use absolute path so pipeline finds it regardless of cwd)
-            file_ext = os.path.splitext(file.filename or "")[1] or ".bin"
-            file_path = os.path.join(settings.UPLOAD_DIR, f"{job_id}{file_ext}")
-            abs_path = os.path.abspath(file_path)
-            with open(abs_path, "wb") as f:
-                content_bytes = await file.read()
-                f.write(content_bytes)
-            raw_input = abs_path
+            # Save file content-addressed (absolute path so pipeline finds it regardless of cwd)
+            file_ext = os.path.splitext(file.filename or "")[1].lower() or ".bin"
+            upload_path, file_size, upload_hash = await store_upload(file.file, file_ext, job_id)
+            print(f"[{job_id}] Stored upload: {file_size} bytes, sha256 {upload_hash[:12]}")
+            metrics.UPLOADS.inc(type=type)
+            metrics.UPLOAD_BYTES.inc(file_size, type=type)
+            await cache.set_job_data(job_id, "upload_hash", upload_hash)
+            raw_input = upload_path
         
         elif type in ["text", "url", "txt"]:
             # Content string required
@@ -122,7 +206,7 @@ async def ingest(
             raise HTTPException(400, f"Unsupported type: {type}")
         
         # Initialize job in Valkey
-        cache.initialize_job(job_id, type, raw_input)
+        await cache.initialize_job(job_id, type, raw_input, upload_path)
         
         return IngestResponse(
             job_id=job_id,
@@ -157,7 +241,7 @@ async def process(
     """
     try:
         # Validate job exists
-        status_data = cache.get_job_status(job_id)
+        status_data = await cache.get_job_status(job_id)
         if not status_data["status"]:
             raise HTTPException(404, "Job not found")
         
@@ -170,15 +254,13 @@ async def process(
                 "message": "Job already processing or complete"
             })
         
-        # Start background pipeline
-        background_tasks.add_task(process_pipeline, job_id)
-        
-        cache.set_job_status(job_id, "PROCESSING", "Pipeline started")
+        # Hand the job to a worker (or run it in-process)
+        status, message = await _start_pipeline(job_id, background_tasks)
         
         return JSONResponse({
             "job_id": job_id,
-            "status": "PROCESSING",
-            "message": "Pipeline started"
+            "status": status,
+            "message": message
         }, status_code=202)
     
     except HTTPException:
@@ -187,31 +269,65 @@ async def process(
         raise HTTPException(500, f"Process start failed: {str(e)}")
 
 
+def _queue_enabled() -> bool:
+    """
+    Whether pipelines are handed to worker.py.
+    
+    Only with a cache shared between processes: after a fallback to the
+    in-memory cache, queued jobs would never reach a worker.
+    """
+    return settings.JOB_QUEUE_ENABLED and cache.shared
+
+
+async def _start_pipeline(job_id: str, background_tasks: BackgroundTasks) -> tuple[str, str]:
+    """
+    Enqueue the job for worker.py when the job queue is enabled, otherwise run it
+    as a FastAPI background task in this process. Returns the new (status, message).
+    """
+    if _queue_enabled():
+        await cache.set_job_status(job_id, "QUEUED", "Waiting for a pipeline worker")
+        await cache.enqueue_job(job_id)
+        return "QUEUED", "Waiting for a pipeline worker"
+    
+    background_tasks.add_task(process_pipeline, job_id)
+    await cache.set_job_status(job_id, "PROCESSING", "Pipeline started")
+    return "PROCESSING", "Pipeline started"
+
+
 # ============================================================================
 # GET /status
 # ============================================================================
 
 @app.get("/status", response_model=StatusResponse)
-async def get_status(job_id: str):
+async def get_status(job_id: str, wait: float = 0, since: Optional[str] = None):
     """
     Get current status of a job.
     
     Args:
         job_id: Job ID
+        wait: Long-poll: seconds to hold the request while the status equals `since`
+              (capped at STATUS_LONG_POLL_MAX)
+        since: Status the client already has
     
     Returns:
         StatusResponse with current status and message
     """
     try:
-        status_data = cache.get_job_status(job_id)
+        status_data = await cache.get_job_status(job_id)
         
         if not status_data["status"]:
             raise HTTPException(404, "Job not found")
         
+        if since and wait > 0 and status_data["status"] == since:
+            status_data = await _wait_for_status_change(
+                job_id, since, min(wait, settings.STATUS_LONG_POLL_MAX)
+            )
+        
         return StatusResponse(
             job_id=job_id,
             status=status_data["status"],
-            message=status_data.get("message", "")
+            message=status_data.get("message", ""),
+            progress=status_data.get("progress")
         )
     
     except HTTPException:
@@ -220,36 +336,178 @@ async def get_status(job_id: str):
         raise HTTPException(500, f"Status check failed: {str(e)}")
 
 
+async def _wait_for_status_change(job_id: str, since: str, timeout: float) -> dict:
+    """
+    Block until the job's status differs from `since` or `timeout` expires.
+    
+    Woken by the job's status events (the same feed as /status/stream) rather
+    than by re-reading the status in a loop.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    # Subscribe before re-reading so a transition in between is not missed
+    async with cache.subscribe_status(job_id) as updates:
+        status_data = await cache.get_job_status(job_id)
+        while status_data["status"] == since:
+            try:
+                status_data = await asyncio.wait_for(updates.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                # Also covers a lost event: report whatever the status is now
+                return await cache.get_job_status(job_id)
+    return status_data
+
+
+# ============================================================================
+# GET /status/stream (Server-Sent Events) and WS /status/ws
+# ============================================================================
+
+TERMINAL_STATUSES = {"READY", "FAILED"}
+
+
+async def _status_snapshot(job_id: str) -> Optional[dict]:
+    """Current status in /status response shape, or None if the job is gone."""
+    status_data = await cache.get_job_status(job_id)
+    if not status_data["status"]:
+        return None
+    return {
+        "job_id": job_id,
+        "status": status_data["status"],
+        "message": status_data.get("message", ""),
+        "progress": status_data.get("progress"),
+    }
+
+
+async def _status_events(job_id: str):
+    """
+    Yield the job's current status, then each transition until it finishes.
+    
+    Yields None as a keepalive when nothing changed for STATUS_STREAM_KEEPALIVE
+    seconds. The status is re-read at that point, so a lost event cannot stall
+    a stream.
+    """
+    # Subscribe before reading the snapshot so no transition falls in between
+    async with cache.subscribe_status(job_id) as updates:
+        event = await _status_snapshot(job_id)
+        last = None
+        while event is not None:
+            current = (event["status"], event["message"])
+            yield event if current != last else None
+            last = current
+            if event["status"] in TERMINAL_STATUSES:
+                return
+            try:
+                update = await asyncio.wait_for(updates.get(), settings.STATUS_STREAM_KEEPALIVE)
+                # Transitions without counters (e.g. READY) keep the last known progress
+                event = {"job_id": job_id, "progress": event.get("progress"), **update}
+            except asyncio.TimeoutError:
+                event = await _status_snapshot(job_id)
+
+
+@app.get("/status/stream")
+async def stream_status(job_id: str):
+    """
+    Push status transitions as Server-Sent Events instead of polling /status.
+    
+    The first event is the current status; the stream ends after READY or FAILED.
+    """
+    if not (await cache.get_job_status(job_id))["status"]:
+        raise HTTPException(404, "Job not found")
+    
+    async def sse():
+        async for event in _status_events(job_id):
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: status\ndata: {json.dumps(event)}\n\n"
+    
+    return StreamingResponse(sse(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # keep reverse proxies from buffering the stream
+    })
+
+
+@app.websocket("/status/ws")
+async def status_websocket(websocket: WebSocket, job_id: str):
+    """WebSocket alternative to /status/stream: one JSON message per transition."""
+    if not (await cache.get_job_status(job_id))["status"]:
+        await websocket.close(code=4404)
+        return
+    
+    await websocket.accept()
+    try:
+        async for event in _status_events(job_id):
+            if event is not None:
+                await websocket.send_json(event)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+
 # ============================================================================
 # GET /result
 # ============================================================================
 
+# READY results never change: their serialized body, ETag and compressed
+# variants by job_id, least recently used evicted beyond RESULT_HTTP_CACHE_MAX_ENTRIES
+_result_representations: OrderedDict = OrderedDict()
+
+
+def _cached_representation(job_id: str) -> Optional[dict]:
+    representation = _result_representations.get(job_id)
+    if representation is not None:
+        _result_representations.move_to_end(job_id)
+    return representation
+
+
+def _remember_representation(job_id: str, representation: dict) -> None:
+    _result_representations[job_id] = representation
+    _result_representations.move_to_end(job_id)
+    while len(_result_representations) > settings.RESULT_HTTP_CACHE_MAX_ENTRIES:
+        _result_representations.popitem(last=False)
+
+
 @app.get("/result")
-async def get_result(job_id: str):
+async def get_result(request: Request, job_id: str, partial: bool = False, cursor: int = 0):
     """
     Get final result for a completed job.
     
     Args:
         job_id: Job ID
+        partial: Return the claims finalized so far instead of 400 while processing
+        cursor: With partial=true, skip claims already returned (the previous `cursor`)
     
     Returns:
-        ResultResponse with all claims, scores, and sources
+        ResultResponse with all claims, scores, and sources (strong ETag,
+        304 on If-None-Match, gzip/brotli when accepted)
     """
     try:
         # Check status
-        status_data = cache.get_job_status(job_id)
+        status_data = await cache.get_job_status(job_id)
         if not status_data["status"]:
             raise HTTPException(404, "Job not found")
         
+        if partial and status_data["status"] != "READY":
+            result = await load_partial_result(job_id, cursor)
+            return JSONResponse({
+                **result,
+                "status": status_data["status"],
+                "message": status_data["message"],
+                "partial": True,
+            })
+        
         if status_data["status"] != "READY":
             raise HTTPException(400, f"Job not ready. Current status: {status_data['status']}")
         
-        # Get final result
-        result = cache.get_job_data(job_id, "final_result")
-        if not result:
-            raise HTTPException(500, "Result not found despite READY status")
+        # Serialize once, then answer by ETag
+        representation = _cached_representation(job_id)
+        if representation is None:
+            result = await load_final_result(job_id)
+            if not result:
+                raise HTTPException(500, "Result not found despite READY status")
+            representation = json_representation(result)
+            _remember_representation(job_id, representation)
         
-        return JSONResponse(result)
+        return json_response(request, representation)
     
     except HTTPException:
         raise
@@ -257,21 +515,52 @@ async def get_result(job_id: str):
         raise HTTPException(500, f"Result fetch failed: {str(e)}")
 
 
+# ============================================================================
+# GET /trace
+# ============================================================================
+
+@app.get("/trace")
+async def get_trace(job_id: str):
+    """
+    Span timeline of a job's pipeline run (stages, external calls, cache operations).
+    
+    Spans carry start/duration in milliseconds from the start of the run and the
+    id of their enclosing span, ready to draw as a waterfall. A run still in
+    progress in this process is returned as far as it got.
+    """
+    active = tracing.ACTIVE_TRACES.get(job_id)
+    if active is not None:
+        return tracing.expand(active.compact(), job_id)
+    
+    if not (await cache.get_job_status(job_id))["status"]:
+        raise HTTPException(404, "Job not found")
+    trace = tracing.expand(await cache.get_job_data(job_id, "trace"), job_id)
+    if trace is None:
+        raise HTTPException(404, "No trace recorded for this job yet")
+    return trace
+
+
 # ============================================================================
 # GET /video (serve uploaded video for preview)
 # ============================================================================
 
 @app.get("/video")
-async def get_video(job_id: str):
-    """Serve the uploaded video file for a job (for preview when input_type is video)."""
+async def get_video(request: Request, job_id: str):
+    """
+    Serve the uploaded video file for a job (for preview when input_type is video).
+    
+    Supports byte ranges so the player can seek without downloading the file.
+    """
     try:
-        input_type = cache.get_job_data(job_id, "type")
+        input_type = await cache.get_job_data(job_id, "type")
         if input_type != "video":
             raise HTTPException(400, "No video for this job")
-        raw = cache.get_job_data(job_id, "raw")
+        raw = await cache.get_job_data(job_id, "raw")
         if not raw or not isinstance(raw, str) or not os.path.isfile(raw):
             raise HTTPException(404, "Video file not found")
-        return FileResponse(raw, media_type="video/mp4", filename=os.path.basename(raw))
+        # Uploads are named by their content hash, which makes a strong ETag
+        etag = f'"{os.path.splitext(os.path.basename(raw))[0]}"'
+        return file_response(request, raw, "video/mp4", etag, filename=os.path.basename(raw))
     except HTTPException:
         raise
     except Exception as e:
@@ -293,12 +582,16 @@ async def root():
             "POST /ingest": "Upload input (video/text/url/pdf/txt)",
             "POST /process": "Start processing pipeline",
             "GET /status": "Check job status",
+            "GET /status/stream": "Status transitions as Server-Sent Events (WS /status/ws)",
             "GET /result": "Get final results",
             "GET /demo": "Load cached demo (instant)",
             "POST /demo/live": "Run live demo (real pipeline)",
             "GET /settings": "Get user settings (requires x-client-id)",
             "POST /settings": "Update user settings (requires x-client-id)",
-            "GET /health": "Health check"
+            "GET /health": "Health check",
+            "GET /cache/stats": "Result and claim cache hit/miss counters, cache size",
+            "GET /metrics": "Prometheus metrics (stage/provider latency, cache, queue, uploads)",
+            "GET /trace": "Span timeline of a job's pipeline run"
         },
         "features": {
             "runtime_settings": "Per-user Gemini toggle and demo mode",
@@ -324,7 +617,7 @@ async def get_demo():
     
     try:
         # Check if demo exists
-        status_data = cache.get_job_status(demo_job_id)
+        status_data = await cache.get_job_status(demo_job_id)
         if not status_data["status"]:
             # Demo doesn't exist, create it automatically
             await create_demo_cache()
@@ -355,7 +648,7 @@ async def get_settings(x_client_id: Optional[str] = Header(None)):
         raise HTTPException(400, "x-client-id header required")
     
     try:
-        settings_data = cache.get_settings(x_client_id)
+        settings_data = await cache.get_settings(x_client_id)
         return SettingsResponse(
             gemini_enabled=settings_data.get("gemini_enabled", False),
             demo_mode=settings_data.get("demo_mode", "cached"),
@@ -389,7 +682,7 @@ async def update_settings(
             "gemini_enabled": user_settings.gemini_enabled,
             "demo_mode": user_settings.demo_mode
         }
-        cache.set_settings(x_client_id, settings_data)
+        await cache.set_settings(x_client_id, settings_data)
         
         return SettingsResponse(
             gemini_enabled=user_settings.gemini_enabled,
@@ -419,12 +712,12 @@ async def run_live_demo(
     
     try:
         # Ensure demo cache exists
-        status_data = cache.get_job_status("demo")
+        status_data = await cache.get_job_status("demo")
         if not status_data["status"]:
             await create_demo_cache()
         
         # Simulate processing by setting status to PROCESSING
-        cache.set_job_status("demo", "PROCESSING", "Live demo simulating pipeline...")
+        await cache.set_job_status("demo", "PROCESSING", "Live demo simulating pipeline...")
         
         # Use asyncio to simulate pipeline delay
         import asyncio
@@ -432,7 +725,7 @@ async def run_live_demo(
         async def simulate_pipeline():
             await asyncio.sleep(2)  # Simulate processing
             # Reset to READY
-            cache.set_job_status("demo", "READY", "Processing complete")
+            await cache.set_job_status("demo", "READY", "Processing complete")
         
         # Don't await - let it run in background
         asyncio.create_task(simulate_pipeline())
@@ -464,7 +757,7 @@ async def run_live_pipeline(
     - Real Backboard SDK calls
     - Real Gemini API calls (if enabled)
     - Real evidence retrieval
-    - No caching (except per-stage within the job)
+    - No caching (except per-stage within the job; the cross-job result cache is bypassed)
     
     Use this to prove all systems work with real APIs.
     
@@ -482,15 +775,16 @@ async def run_live_pipeline(
         job_id = f"live_{timestamp}"
         
         # Initialize job
-        cache.initialize_job(job_id, "text", text)
-        cache.set_job_data(job_id, "client_id", x_client_id)
+        await cache.initialize_job(job_id, "text", text)
+        await cache.set_job_data(job_id, "client_id", x_client_id)
+        await cache.set_job_data(job_id, "bypass_result_cache", True)
         
-        # Start REAL pipeline in background
-        background_tasks.add_task(process_pipeline, job_id)
+        # Start REAL pipeline via the job queue or in background
+        status, _ = await _start_pipeline(job_id, background_tasks)
         
         return {
             "job_id": job_id,
-            "status": "PROCESSING",
+            "status": status,
             "message": "Real pipeline started with live APIs"
         }
     
@@ -506,6 +800,7 @@ async def create_demo_cache():
     demo_job_id = "demo"
     
     print(f"Creating demo job: {demo_job_id}")
+    _result_representations.pop(demo_job_id, None)
     
     # Demo input text with verifiable claims
     demo_text = """Recent studies show that global carbon emissions increased by 5.2% in 2023. 
@@ -633,10 +928,10 @@ A new archaeological discovery in Egypt claims to have found a 4,500-year-old py
     }
     
     # Store in cache
-    cache.set_job_status(demo_job_id, "READY", "Demo result (cached)")
-    cache.set_job_data(demo_job_id, "type", "text")
-    cache.set_job_data(demo_job_id, "raw", demo_text)
-    cache.set_job_data(demo_job_id, "final_result", final_result)
-    cache.set_job_data(demo_job_id, "created_at", datetime.utcnow().isoformat())
+    await cache.set_job_status(demo_job_id, "READY", "Demo result (cached)")
+    await cache.set_job_data(demo_job_id, "type", "text")
+    await cache.set_job_data(demo_job_id, "raw", demo_text)
+    await cache.set_job_data(demo_job_id, "final_result", final_result)
+    await cache.set_job_data(demo_job_id, "created_at", datetime.utcnow().isoformat())
     
     print(f"✅ Demo created successfully: {demo_job_id}")
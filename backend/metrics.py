@@ -0,0 +1,215 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Collected per process and served by GET /metrics (API) or, for pipeline worker
+processes, by a small standalone listener (worker.py --metrics-port). Values
+that live in the cache and are shared by all processes (cache hit/miss
+counters, queue depth) are read when the API is scraped.
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+
+import tracing
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}  # label values tuple -> value
+        REGISTRY.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}"
+            for key, value in sorted(self.values.items())
+        ]
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        return "\n".join(lines + self.samples())
+
+
+class Counter(_Metric):
+    """Monotonic total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def set_total(self, value: float, **labels) -> None:
+        """Mirror a total maintained elsewhere (e.g. a shared cache counter)."""
+        self.values[self._key(labels)] = value
+
+
+class Gauge(_Metric):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self.values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts plus sum and count of observations."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (),
+                 buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self.values.get(key)
+        if state is None:
+            state = self.values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state["buckets"][i] += 1
+        state["sum"] += value
+        state["count"] += 1
+
+    def samples(self) -> list[str]:
+        lines = []
+        for key, state in sorted(self.values.items()):
+            for bound, count in zip(self.buckets, state["buckets"]):
+                le = f'le="{_format_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {count}")
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {state['count']}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_number(state['sum'])}")
+            lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+
+REGISTRY: list[_Metric] = []
+
+
+# ============================================================================
+# ProofPulse Metrics
+# ============================================================================
+
+STAGE_DURATION = Histogram(
+    "proofpulse_stage_duration_seconds", "Time spent in each pipeline stage.", ("stage",)
+)
+PROVIDER_LATENCY = Histogram(
+    "proofpulse_provider_request_duration_seconds",
+    "Latency of external API calls.", ("provider", "operation")
+)
+PROVIDER_ERRORS = Counter(
+    "proofpulse_provider_errors_total", "External API calls that raised.", ("provider", "operation")
+)
+JOBS_IN_FLIGHT = Gauge("proofpulse_jobs_in_flight", "Pipelines currently running in this process.")
+JOBS_FINISHED = Counter("proofpulse_jobs_finished_total", "Pipelines finished, by outcome.", ("outcome",))
+UPLOAD_BYTES = Counter("proofpulse_upload_bytes_total", "Bytes of uploaded files stored.", ("type",))
+UPLOADS = Counter("proofpulse_uploads_total", "Uploaded files stored.", ("type",))
+CACHE_EVENTS = Counter(
+    "proofpulse_cache_events_total",
+    "Shared cache lookups by outcome (all processes).", ("cache", "outcome")
+)
+QUEUE_DEPTH = Gauge("proofpulse_queue_depth", "Jobs waiting in the job queue.")
+BACKBOARD_THREAD_LEASES = Counter(
+    "proofpulse_backboard_thread_leases_total",
+    "Backboard threads leased for a message, by whether one was pooled or created inline.", ("outcome",)
+)
+BACKBOARD_THREADS_IDLE = Gauge("proofpulse_backboard_threads_idle", "Pre-created Backboard threads ready to lease.")
+VERIFY_BATCH_CLAIMS = Counter(
+    "proofpulse_verify_batch_claims_total",
+    "Claims sent for batched verification, by whether the batch answered them or they were retried alone.",
+    ("outcome",)
+)
+COALESCED_CALLS = Counter(
+    "proofpulse_coalesced_calls_total",
+    "LLM calls answered by an identical request already in flight, by where it ran.", ("operation", "source")
+)
+
+
+@contextmanager
+def time_stage(stage: str):
+    """Observe the duration of a pipeline stage, including failed runs (also a trace span)."""
+    start = time.perf_counter()
+    try:
+        with tracing.span(stage, "stage"):
+            yield
+    finally:
+        STAGE_DURATION.observe(time.perf_counter() - start, stage=stage)
+
+
+@contextmanager
+def track_call(provider: str, operation: str):
+    """Observe the latency of an external call and count it as an error if it raises (also a trace span)."""
+    start = time.perf_counter()
+    try:
+        with tracing.span(f"{provider}.{operation}", "external"):
+            yield
+    except Exception:
+        PROVIDER_ERRORS.inc(provider=provider, operation=operation)
+        raise
+    finally:
+        PROVIDER_LATENCY.observe(time.perf_counter() - start, provider=provider, operation=operation)
+
+
+def render() -> str:
+    """All metrics of this process in the text exposition format."""
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
+
+
+async def serve_metrics(port: int, host: str = "0.0.0.0") -> asyncio.AbstractServer:
+    """
+    Serve render() on every HTTP request to `port` (for processes without the API).
+
+    Minimal on purpose: one response per connection, any path.
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            body = render().encode("utf-8")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                + f"Content-Type: {CONTENT_TYPE}\r\nContent-Length: {len(body)}\r\n".encode("ascii")
+                + b"Connection: close\r\n\r\n" + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
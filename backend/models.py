@@ -36,6 +36,7 @@ class StatusResponse(BaseModel):
     job_id: str
     status: str
     message: Optional[str] = None
+    progress: Optional[dict] = None  # Per-claim counters (total/verified/scored/finalized)
 
 
 # ============================================================================
@@ -5,6 +5,7 @@ import time
 from datetime import datetime
 from typing import Optional
 import uuid
+from contextlib import aclosing
 
 # Use mock cache for local development without Redis
 try:
@@ -16,14 +17,52 @@ from models import (
     FinalClaim, FinalBreakdown, Source, Timestamp
 )
 from scoring import finalize_claim_score, map_score_to_verdict
-from integrations.backboard import extract_claims, verify_claim, score_claim_backboard_fallback
+from integrations.backboard import extract_claims, stream_claims, verify_claim, verify_claims, score_claim_backboard_fallback
 from config import settings
+import fingerprint
+import claim_cache
+import metrics
+import tracing
 from extractors.video import extract_from_video
 from extractors.url import extract_from_url
 from extractors.pdf import extract_from_pdf
 from extractors.text import extract_from_text
 
 
+# Process-wide cap on concurrent claim verifications (created lazily inside the event loop)
+_claim_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_claim_semaphore() -> asyncio.Semaphore:
+    """Return the global claim semaphore shared by all jobs in this process."""
+    global _claim_semaphore
+    if _claim_semaphore is None:
+        _claim_semaphore = asyncio.Semaphore(max(1, settings.CLAIM_CONCURRENCY_GLOBAL))
+    return _claim_semaphore
+
+
+async def _cancel_all(tasks: list) -> None:
+    """Cancel tasks and wait until they have unwound (released their semaphores)."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _gather_or_cancel(aws) -> list:
+    """
+    asyncio.gather() that cancels the rest as soon as one awaitable fails.
+    
+    Plain gather leaves the other claims running (and holding claim
+    semaphore slots) after the first error has already failed the job.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        await _cancel_all(tasks)
+        raise
+
+
 def debug_log(job_id: str, stage: str, message: str, data: dict = None):
     """Log debug messages if DEBUG_JOB_ID matches."""
     if settings.DEBUG_JOB_ID and settings.DEBUG_JOB_ID == job_id:
@@ -47,51 +86,208 @@ async def process_pipeline(job_id: str) -> None:
     2. CLAIM_EXTRACTION - Extract claims from text
     3. EVIDENCE_RETRIEVAL - Verify each claim
     4. GEMINI_REVIEW - Score each claim
+       (with CLAIM_DAG_ENABLED, stages 3 and 4 run as independent per-claim chains,
+       and with CLAIM_STREAMING_ENABLED each chain starts as soon as stage 2 parses its claim;
+       CLAIM_BATCH_VERIFY_ENABLED verifies claims CLAIM_BATCH_SIZE per call instead, without streaming)
     5. SCORING - Finalize scores and build result
     
     Args:
         job_id: Unique job identifier
     """
+    metrics.JOBS_IN_FLIGHT.inc()
+    trace_token = tracing.begin(job_id)
     try:
-        cache.set_job_status(job_id, "PROCESSING", "Pipeline started")
+        await cache.set_job_status(job_id, "PROCESSING", "Pipeline started")
         
         # ====================================================================
         # STAGE 1: EXTRACTING_TEXT
         # ====================================================================
-        await stage_1_extract_text(job_id)
+        with metrics.time_stage("extract_text"):
+            await stage_1_extract_text(job_id)
         
-        # ====================================================================
-        # STAGE 2: CLAIM_EXTRACTION
-        # ====================================================================
-        await stage_2_claim_extraction(job_id)
+        # Identical input already verified by an earlier job: complete by reference
+        if await _reuse_cached_result(job_id):
+            metrics.JOBS_FINISHED.inc(outcome="reused")
+            return
+        
+        # Batched verification needs all claims up front, so it turns streaming off
+        streaming = (settings.CLAIM_DAG_ENABLED and settings.CLAIM_STREAMING_ENABLED
+                     and not settings.CLAIM_BATCH_VERIFY_ENABLED)
+        if streaming:
+            # ================================================================
+            # STAGES 2-4: claims stream straight into per-claim chains
+            # ================================================================
+            with metrics.time_stage("claim_extraction_and_chains"):
+                await stage_2_4_streaming_claim_chains(job_id)
+        else:
+            # ================================================================
+            # STAGE 2: CLAIM_EXTRACTION
+            # ================================================================
+            with metrics.time_stage("claim_extraction"):
+                await stage_2_claim_extraction(job_id)
         
         # Check if stage 2 completed early (no claims found)
-        status_data = cache.get_job_status(job_id)
+        status_data = await cache.get_job_status(job_id)
         if status_data.get("status") == "READY":
             print(f"[{job_id}] Pipeline completed early - no claims to process")
+            metrics.JOBS_FINISHED.inc(outcome="ready")
             return
         
-        # ====================================================================
-        # STAGE 3: EVIDENCE_RETRIEVAL
-        # ====================================================================
-        await stage_3_evidence_retrieval(job_id)
-        
-        # ====================================================================
-        # STAGE 4: GEMINI_REVIEW
-        # ====================================================================
-        await stage_4_gemini_review(job_id)
+        if settings.CLAIM_DAG_ENABLED and not streaming:
+            # ================================================================
+            # STAGES 3+4: per-claim verify -> score -> finalize chains
+            # ================================================================
+            with metrics.time_stage("claim_chains"):
+                await stage_3_4_claim_chains(job_id)
+        elif not settings.CLAIM_DAG_ENABLED:
+            # ================================================================
+            # STAGE 3: EVIDENCE_RETRIEVAL
+            # ================================================================
+            with metrics.time_stage("evidence_retrieval"):
+                await stage_3_evidence_retrieval(job_id)
+            
+            # ================================================================
+            # STAGE 4: GEMINI_REVIEW
+            # ================================================================
+            with metrics.time_stage("scoring"):
+                await stage_4_gemini_review(job_id)
         
         # ====================================================================
         # STAGE 5: SCORING
         # ====================================================================
-        await stage_5_finalize_scoring(job_id)
+        with metrics.time_stage("finalize"):
+            await stage_5_finalize_scoring(job_id)
         
-        cache.set_job_status(job_id, "READY", "Processing complete")
+        # Store the trace first, so a READY job always has one
+        await _store_trace(job_id, trace_token)
+        trace_token = None
+        await cache.set_job_status(job_id, "READY", "Processing complete")
+        metrics.JOBS_FINISHED.inc(outcome="ready")
     
     except Exception as e:
         error_msg = f"Pipeline failed: {str(e)}\n{traceback.format_exc()}"
-        cache.set_job_status(job_id, "FAILED", error_msg)
+        if trace_token is not None:
+            await _store_trace(job_id, trace_token)
+            trace_token = None
+        await cache.set_job_status(job_id, "FAILED", error_msg)
+        metrics.JOBS_FINISHED.inc(outcome="failed")
         print(f"ERROR in job {job_id}: {error_msg}")
+    
+    finally:
+        metrics.JOBS_IN_FLIGHT.dec()
+        # Runs that completed inside a stage (reused result, no claims); until
+        # stored, their trace is still served from ACTIVE_TRACES
+        if trace_token is not None:
+            await _store_trace(job_id, trace_token)
+
+
+async def _store_trace(job_id: str, trace_token) -> None:
+    """Save the run's trace as the job's `trace` field; a failed write is logged, not raised."""
+    try:
+        await cache.set_job_data(job_id, "trace", tracing.finish(trace_token))
+    except Exception as e:
+        print(f"⚠️  [{job_id}] Could not store trace: {e}")
+    finally:
+        tracing.release(job_id)
+
+
+# ============================================================================
+# Cross-Job Result Cache
+# ============================================================================
+
+async def _reuse_cached_result(job_id: str) -> bool:
+    """
+    Fingerprint the extracted text and, on a hit, point the job at the stored result.
+    
+    The job keeps only a result_ref; load_final_result() resolves it on read.
+    """
+    data = await cache.get_multiple(job_id, ["text", "bypass_result_cache"])
+    content_hash = fingerprint.content_hash(data.get("text") or "")
+    await cache.set_job_data(job_id, "content_hash", content_hash)
+    
+    if not settings.RESULT_CACHE_ENABLED or data.get("bypass_result_cache"):
+        return False
+    if await cache.get_cached_result(content_hash) is None:
+        await cache.incr_counter("stats:result_cache:miss")
+        return False
+    
+    await cache.incr_counter("stats:result_cache:hit")
+    await cache.set_job_data(job_id, "result_ref", content_hash)
+    await cache.set_job_status(job_id, "READY", "Processing complete (identical input already verified)")
+    print(f"[{job_id}] Result cache hit for content {content_hash[:12]} - skipping stages 2-5")
+    return True
+
+
+async def _store_cached_result(job_id: str, final_result: dict, claim_artifacts: list) -> None:
+    """Publish a finished result under the job's content hash unless an API call fell back."""
+    if not settings.RESULT_CACHE_ENABLED:
+        return
+    content_hash = await cache.get_job_data(job_id, "content_hash")
+    if not content_hash:
+        return
+    if _transcription_failed(final_result.get("timestamps")):
+        print(f"[{job_id}] Not caching result: text extraction failed")
+        return
+    if any(artifact.get("api_error") for artifact in claim_artifacts):
+        print(f"[{job_id}] Not caching result: produced with API fallbacks")
+        return
+    await cache.set_cached_result(content_hash, final_result)
+
+
+async def load_partial_result(job_id: str, cursor: int = 0) -> dict:
+    """
+    Return the claims finalized so far, starting at `cursor` in completion order.
+    
+    The returned `cursor` is the position to pass on the next call to receive
+    only claims finished since this one.
+    """
+    data = await cache.get_multiple(job_id, ["finalized_claims", "progress", "type", "created_at"])
+    claim_ids = data["finalized_claims"] or []
+    cursor = min(max(cursor, 0), len(claim_ids))
+    
+    finals = await cache.get_multiple(job_id, [f"final:{claim_id}" for claim_id in claim_ids[cursor:]])
+    claims = [claim for claim in finals.values() if claim is not None]
+    
+    return {
+        "job_id": job_id,
+        "input_type": data["type"],
+        "claims": claims,
+        "cursor": len(claim_ids),
+        "progress": data["progress"],
+        "created_at": data["created_at"],
+    }
+
+
+async def load_final_result(job_id: str) -> Optional[dict]:
+    """
+    Return the job's final_result, resolving a result_ref to the shared cached result.
+    
+    The transcript is stored once (as the job's `text`) and added back here.
+    Finished results never change, so they are also kept in process memory.
+    """
+    cached = cache.get_local(job_id, "final_result")
+    if cached is not None:
+        return cached
+    
+    data = await cache.get_multiple(job_id, ["final_result", "result_ref", "type", "created_at", "text"])
+    result = data["final_result"]
+    
+    if not result:
+        if not data["result_ref"]:
+            return None
+        cached = await cache.get_cached_result(data["result_ref"])
+        if cached is None:
+            return None
+        result = {
+            **cached,
+            "job_id": job_id,
+            "input_type": data["type"] or cached.get("input_type"),
+            "created_at": data["created_at"] or cached.get("created_at"),
+        }
+    
+    result.setdefault("transcript_text", data["text"] or "")
+    cache.set_local(job_id, "final_result", result)
+    return result
 
 
 # ============================================================================
@@ -101,23 +297,29 @@ async def process_pipeline(job_id: str) -> None:
 async def stage_1_extract_text(job_id: str) -> None:
     """Extract text from input based on type."""
     start_time = time.time()
-    cache.set_job_status(job_id, "EXTRACTING_TEXT", "Stage 1/5: Parsing text content...")
+    await cache.set_job_status(job_id, "EXTRACTING_TEXT", "Stage 1/5: Parsing text content...")
     debug_log(job_id, "STAGE 1 START", "Beginning text extraction")
     
     # Check cache first
-    if cache.cache_exists(job_id, "text"):
-        cached_text = cache.get_job_data(job_id, "text")
+    if await cache.cache_exists(job_id, "text"):
+        cached_text = await cache.get_job_data(job_id, "text")
         debug_log(job_id, "STAGE 1 CACHE HIT", f"Using cached text", {"text": cached_text, "length": len(cached_text)})
         print(f"[{job_id}] Stage 1: Using cached text")
         return
     
     # Get input type and raw pointer
-    input_type = cache.get_job_data(job_id, "type")
-    raw_input = cache.get_job_data(job_id, "raw")
+    job_input = await cache.get_multiple(job_id, ["type", "raw", "upload_hash"])
+    input_type, raw_input, upload_hash = job_input["type"], job_input["raw"], job_input["upload_hash"]
     debug_log(job_id, "STAGE 1 INPUT", "Read from Valkey", {"type": input_type, "raw": raw_input[:100] if raw_input else None})
     
+    # Identical uploads reuse the transcript / parsed text of an earlier job
+    artifacts = await _load_upload_artifacts(upload_hash)
+    
     # Route to appropriate extractor
-    if input_type == "video":
+    if artifacts is not None:
+        print(f"[{job_id}] Stage 1: Reusing extracted text of upload {upload_hash[:12]}")
+        normalized_text, timestamps = artifacts["text"], artifacts["timestamps"]
+    elif input_type == "video":
         print(f"[{job_id}] Stage 1: Processing VIDEO input: {raw_input}")
         normalized_text, timestamps = await extract_from_video(raw_input)
         print(f"[{job_id}] Stage 1: VIDEO extracted {len(normalized_text)} chars, {len(timestamps)} timestamps")
@@ -137,10 +339,15 @@ async def stage_1_extract_text(job_id: str) -> None:
     else:
         raise ValueError(f"Unsupported input type: {input_type}")
     
+    if upload_hash and artifacts is None and not _transcription_failed(timestamps):
+        await cache.set_shared(f"uploadtext:{upload_hash}", {
+            "text": normalized_text, "timestamps": timestamps
+        }, settings.UPLOAD_ARTIFACT_TTL)
+    
     # Store results
-    cache.set_job_data(job_id, "text", normalized_text)
-    cache.set_job_data(job_id, "timestamps", timestamps)
-    cache.set_job_status(job_id, "TEXT_READY", f"Extracted {len(normalized_text)} characters")
+    await cache.set_job_data(job_id, "text", normalized_text)
+    await cache.set_job_data(job_id, "timestamps", timestamps)
+    await cache.set_job_status(job_id, "TEXT_READY", f"Extracted {len(normalized_text)} characters")
     
     elapsed = time.time() - start_time
     debug_log(job_id, "STAGE 1 END", f"Text extracted in {elapsed:.2f}s", {
@@ -158,6 +365,20 @@ async def stage_1_extract_text(job_id: str) -> None:
         print(f"[{job_id}] Transcript content: '{normalized_text}'")
 
 
+def _transcription_failed(timestamps: Optional[list]) -> bool:
+    """A failed transcription comes back as a placeholder segment marked api_error."""
+    return any(segment.get("api_error") for segment in timestamps or [])
+
+
+async def _load_upload_artifacts(upload_hash: Optional[str]) -> Optional[dict]:
+    """Stage 1 output stored for an uploaded file's content hash, if any."""
+    if not upload_hash:
+        return None
+    artifacts = await cache.get_shared(f"uploadtext:{upload_hash}")
+    await cache.incr_counter(f"stats:upload_cache:{'hit' if artifacts is not None else 'miss'}")
+    return artifacts
+
+
 # ============================================================================
 # STAGE 2: Claim Extraction
 # ============================================================================
@@ -165,18 +386,18 @@ async def stage_1_extract_text(job_id: str) -> None:
 async def stage_2_claim_extraction(job_id: str) -> None:
     """Extract claims from normalized text."""
     start_time = time.time()
-    cache.set_job_status(job_id, "CLAIM_EXTRACTION", "Stage 2/5: Extracting claims...")
+    await cache.set_job_status(job_id, "CLAIM_EXTRACTION", "Stage 2/5: Extracting claims...")
     debug_log(job_id, "STAGE 2 START", "Beginning claim extraction")
     
     # Check cache
-    if cache.cache_exists(job_id, "claims"):
-        cached_claims = cache.get_job_data(job_id, "claims")
+    if await cache.cache_exists(job_id, "claims"):
+        cached_claims = await cache.get_job_data(job_id, "claims")
         debug_log(job_id, "STAGE 2 CACHE HIT", f"Using cached claims", {"claims_count": len(cached_claims)})
         print(f"[{job_id}] Stage 2: Using cached claims")
         return
     
     # Get normalized text
-    normalized_text = cache.get_job_data(job_id, "text")
+    normalized_text = await cache.get_job_data(job_id, "text")
     debug_log(job_id, "STAGE 2 INPUT", "Read text from Valkey", {"text_length": len(normalized_text)})
     
     # Call Backboard to extract claims
@@ -187,31 +408,15 @@ async def stage_2_claim_extraction(job_id: str) -> None:
     # Handle empty claims gracefully
     if not claims_raw or len(claims_raw) == 0:
         debug_log(job_id, "STAGE 2 NO CLAIMS", "⚠️ No claims extracted from text")
-        # Create empty claims list and skip to finalization
-        cache.set_job_data(job_id, "claims", [])
-        cache.set_job_data(job_id, "evidence", {})
-        cache.set_job_data(job_id, "gemini_report", {})
-        
-        # Create empty final result
-        data = cache.get_multiple(job_id, ["type", "created_at", "timestamps"])
-        final_result = {
-            "job_id": job_id,
-            "input_type": data.get("type"),
-            "timestamps": data.get("timestamps", []),
-            "claims": [],
-            "processing_time": None,
-            "created_at": data.get("created_at")
-        }
-        cache.set_job_data(job_id, "final_result", final_result)
-        cache.set_job_status(job_id, "READY", "No factual claims found in input")
+        await _complete_without_claims(job_id)
         print(f"[{job_id}] Stage 2: No claims extracted - job completed with empty result")
         return
     
     # Limit to max claims
     claims_raw = claims_raw[:settings.MAX_CLAIMS]
     
-    cache.set_job_data(job_id, "claims", claims_raw)
-    cache.set_job_status(job_id, "CLAIMS_READY", f"Extracted {len(claims_raw)} claims")
+    await cache.set_job_data(job_id, "claims", claims_raw)
+    await cache.set_job_status(job_id, "CLAIMS_READY", f"Extracted {len(claims_raw)} claims")
     
     elapsed = time.time() - start_time
     debug_log(job_id, "STAGE 2 END", f"Claims extracted in {elapsed:.2f}s", {
@@ -221,6 +426,28 @@ async def stage_2_claim_extraction(job_id: str) -> None:
     print(f"[{job_id}] Stage 2: Extracted {len(claims_raw)} claims")
 
 
+async def _complete_without_claims(job_id: str) -> None:
+    """Store an empty result and mark the job READY when no claims were found."""
+    # Create empty claims list and skip to finalization
+    await cache.set_job_data(job_id, "claims", [])
+    await cache.set_job_data(job_id, "evidence", {})
+    await cache.set_job_data(job_id, "gemini_report", {})
+    
+    # Create empty final result
+    data = await cache.get_multiple(job_id, ["type", "created_at", "timestamps"])
+    final_result = {
+        "job_id": job_id,
+        "input_type": data.get("type"),
+        "timestamps": data.get("timestamps", []),
+        "claims": [],
+        "processing_time": tracing.elapsed(),
+        "created_at": data.get("created_at")
+    }
+    await cache.set_job_data(job_id, "final_result", final_result)
+    await _store_cached_result(job_id, final_result, [])
+    await cache.set_job_status(job_id, "READY", "No factual claims found in input")
+
+
 # ============================================================================
 # STAGE 3: Evidence Retrieval
 # ============================================================================
@@ -228,74 +455,143 @@ async def stage_2_claim_extraction(job_id: str) -> None:
 async def stage_3_evidence_retrieval(job_id: str) -> None:
     """Retrieve evidence for each claim using Backboard web search."""
     start_time = time.time()
-    cache.set_job_status(job_id, "EVIDENCE_RETRIEVAL", "Stage 3/5: Retrieving evidence...")
+    await cache.set_job_status(job_id, "EVIDENCE_RETRIEVAL", "Stage 3/5: Retrieving evidence...")
     debug_log(job_id, "STAGE 3 START", "Beginning evidence retrieval")
     
     # Get claims
-    claims = cache.get_job_data(job_id, "claims")
+    claims = await cache.get_job_data(job_id, "claims")
     debug_log(job_id, "STAGE 3 INPUT", "Read claims from Valkey", {"claims_count": len(claims)})
     
-    evidence_results = {}
-    
-    for idx, claim in enumerate(claims, 1):
-        claim_id = claim["claim_id"]
-        claim_text = claim["claim_text"]
-        
-        # Check if already cached
-        if cache.cache_exists(job_id, f"evidence:{claim_id}"):
-            evidence_results[claim_id] = cache.get_job_data(job_id, f"evidence:{claim_id}")
-            debug_log(job_id, f"STAGE 3.{idx} CACHE HIT", f"Using cached evidence for claim {claim_id}")
-            continue
-        
-        # Call Backboard web search
-        debug_log(job_id, f"STAGE 3.{idx} API CALL", f"Calling Backboard verify_claim()", {"claim_text": claim_text})
-        evidence = await verify_claim(claim_text)
-        debug_log(job_id, f"STAGE 3.{idx} API RESPONSE", "Backboard returned evidence", {
-            "verdict": evidence.get("backboard_verdict"),
-            "confidence": evidence.get("backboard_confidence"),
-            "sources_count": len(evidence.get("sources", [])),
-            "sources": evidence.get("sources", [])
-        })
+    if settings.CLAIM_BATCH_VERIFY_ENABLED:
+        evidence_list = await _retrieve_evidence_batched(job_id, claims)
+    else:
+        # Verify claims concurrently (bounded per job and globally); gather keeps claim order
+        job_semaphore = asyncio.Semaphore(max(1, settings.CLAIM_CONCURRENCY_PER_JOB))
         
-        # Guard: If no sources returned, mark as UNCLEAR with low scores
-        if not evidence.get("sources") or len(evidence.get("sources", [])) == 0:
-            debug_log(job_id, f"STAGE 3.{idx} NO SOURCES", "⚠️ No sources returned, applying fallback")
-            evidence = {
-                "backboard_verdict": "UNCLEAR",
-                "backboard_confidence": 10,
-                "sources": [{
-                    "title": "No sources found",
-                    "publisher": "System",
-                    "date": "2024-01-01",
-                    "url": "https://example.com",
-                    "snippet": "No sources returned by retrieval"
-                }],
-                "rationale": "No sources available for verification"
-            }
+        async def run_claim(idx: int, claim: dict) -> dict:
+            async with job_semaphore, _get_claim_semaphore():
+                return await _retrieve_claim_evidence(job_id, idx, claim)
         
-        # Store per-claim evidence
-        cache.set_job_data(job_id, f"evidence:{claim_id}", evidence)
-        evidence_results[claim_id] = evidence
+        evidence_list = await _gather_or_cancel([
+            run_claim(idx, claim) for idx, claim in enumerate(claims, 1)
+        ])
+    evidence_results = {
+        claim["claim_id"]: evidence for claim, evidence in zip(claims, evidence_list)
+    }
     
-    cache.set_job_data(job_id, "evidence", evidence_results)
-    cache.set_job_status(job_id, "EVIDENCE_READY", f"Retrieved evidence for {len(claims)} claims")
+    await cache.set_job_data(job_id, "evidence", evidence_results)
+    await cache.set_job_status(job_id, "EVIDENCE_READY", f"Retrieved evidence for {len(claims)} claims")
     
     elapsed = time.time() - start_time
     debug_log(job_id, "STAGE 3 END", f"Evidence retrieved in {elapsed:.2f}s", {
         "claims_processed": len(claims),
         "evidence_count": len(evidence_results),
-        "written_to_cache": f"evidence (+ evidence:{claim_id} for each)"
+        "concurrency": settings.CLAIM_CONCURRENCY_PER_JOB,
+        "written_to_cache": "evidence (+ evidence:{claim_id} for each)"
     })
     print(f"[{job_id}] Stage 3: Retrieved evidence for {len(claims)} claims")
 
 
+async def _retrieve_claim_evidence(job_id: str, idx: int, claim: dict) -> dict:
+    """Retrieve (or load cached) evidence for a single claim and checkpoint it."""
+    evidence = await _lookup_claim_evidence(job_id, idx, claim)
+    if evidence is not None:
+        return evidence
+    
+    # Call Backboard web search
+    debug_log(job_id, f"STAGE 3.{idx} API CALL", f"Calling Backboard verify_claim()", {"claim_text": claim["claim_text"]})
+    evidence = await verify_claim(claim["claim_text"])
+    return await _store_claim_evidence(job_id, idx, claim, evidence)
+
+
+async def _retrieve_evidence_batched(job_id: str, claims: list) -> list:
+    """
+    Retrieve evidence for all claims, verifying uncached ones CLAIM_BATCH_SIZE per call.
+    
+    Checkpointed and shared-cache evidence is used as in the per-claim path;
+    every batch is one verify_claims() message instead of one per claim.
+    """
+    evidence_list = list(await _gather_or_cancel([
+        _lookup_claim_evidence(job_id, idx, claim) for idx, claim in enumerate(claims, 1)
+    ]))
+    pending = [(idx, claim) for idx, claim in enumerate(claims, 1) if evidence_list[idx - 1] is None]
+    batch_size = max(1, settings.CLAIM_BATCH_SIZE)
+    
+    async def run_batch(batch: list) -> None:
+        debug_log(job_id, "STAGE 3 BATCH API CALL", f"Calling Backboard verify_claims() for {len(batch)} claims", {
+            "claims": [claim["claim_text"] for _, claim in batch]
+        })
+        async with _get_claim_semaphore():
+            results = await verify_claims([claim["claim_text"] for _, claim in batch])
+        for (idx, claim), evidence in zip(batch, results):
+            evidence_list[idx - 1] = await _store_claim_evidence(job_id, idx, claim, evidence)
+    
+    await _gather_or_cancel([
+        run_batch(pending[start:start + batch_size]) for start in range(0, len(pending), batch_size)
+    ])
+    return evidence_list
+
+
+async def _lookup_claim_evidence(job_id: str, idx: int, claim: dict) -> Optional[dict]:
+    """Evidence for a claim from the job's checkpoint or the shared claim cache, if any."""
+    claim_id = claim["claim_id"]
+    
+    # Check if already cached
+    if await cache.cache_exists(job_id, f"evidence:{claim_id}"):
+        debug_log(job_id, f"STAGE 3.{idx} CACHE HIT", f"Using cached evidence for claim {claim_id}")
+        return await cache.get_job_data(job_id, f"evidence:{claim_id}")
+    
+    # Same (or near-duplicate) claim already verified by another job
+    evidence = await claim_cache.lookup(claim["claim_text"], claim.get("claim_type"), "evidence")
+    if evidence is not None:
+        debug_log(job_id, f"STAGE 3.{idx} CLAIM CACHE HIT", f"Reusing shared evidence for claim {claim_id}")
+        await cache.set_job_data(job_id, f"evidence:{claim_id}", evidence)
+    return evidence
+
+
+async def _store_claim_evidence(job_id: str, idx: int, claim: dict, evidence: dict) -> dict:
+    """Share fresh evidence with other jobs, apply the no-sources guard and checkpoint it."""
+    claim_id = claim["claim_id"]
+    claim_text = claim["claim_text"]
+    debug_log(job_id, f"STAGE 3.{idx} API RESPONSE", "Backboard returned evidence", {
+        "verdict": evidence.get("backboard_verdict"),
+        "confidence": evidence.get("backboard_confidence"),
+        "sources_count": len(evidence.get("sources", [])),
+        "sources": evidence.get("sources", [])
+    })
+    
+    # Share real search results (never API fallbacks) with other jobs
+    if evidence.get("sources") and not evidence.get("api_error"):
+        await claim_cache.store(claim_text, claim.get("claim_type"), "evidence", evidence)
+    
+    # Guard: If no sources returned, mark as UNCLEAR with low scores
+    if not evidence.get("sources") or len(evidence.get("sources", [])) == 0:
+        debug_log(job_id, f"STAGE 3.{idx} NO SOURCES", "⚠️ No sources returned, applying fallback")
+        evidence = {
+            "backboard_verdict": "UNCLEAR",
+            "backboard_confidence": 10,
+            "sources": [{
+                "title": "No sources found",
+                "publisher": "System",
+                "date": "2024-01-01",
+                "url": "https://example.com",
+                "snippet": "No sources returned by retrieval"
+            }],
+            "rationale": "No sources available for verification"
+        }
+    
+    # Store per-claim evidence
+    await cache.set_job_data(job_id, f"evidence:{claim_id}", evidence)
+    return evidence
+
+
 # ============================================================================
 # STAGE 4: Gemini Review and Scoring
 # ============================================================================
 
 async def stage_4_gemini_review(job_id: str) -> None:
     """Score claims using Backboard SDK only (verdict and rubric). Gemini is not used."""
-    cache.set_job_status(job_id, "GEMINI_REVIEW", "Stage 4/5: Scoring claims (Backboard)...")
+    await cache.set_job_status(job_id, "GEMINI_REVIEW", "Stage 4/5: Scoring claims (Backboard)...")
     print(f"[{job_id}] Stage 4: Using Backboard SDK for verdict and scoring")
     await stage_4_backboard_fallback_scoring(job_id)
 
@@ -306,44 +602,27 @@ async def stage_4_backboard_fallback_scoring(job_id: str) -> None:
     debug_log(job_id, "STAGE 4 BACKBOARD START", "Using Backboard fallback scoring")
     
     # Get data
-    claims = cache.get_job_data(job_id, "claims")
-    evidence_results = cache.get_job_data(job_id, "evidence")
+    claims = await cache.get_job_data(job_id, "claims")
+    evidence_results = await cache.get_job_data(job_id, "evidence")
     
     gemini_results = {}
+    # Without per-claim chains, claims are finalized here as they are scored so
+    # /result?partial=true has them before stage 5
+    finalized = await cache.get_job_data(job_id, "finalized_claims") or []
     
     for idx, claim in enumerate(claims, 1):
         claim_id = claim["claim_id"]
-        
-        # Check cache
-        if cache.cache_exists(job_id, f"gemini:{claim_id}"):
-            gemini_results[claim_id] = cache.get_job_data(job_id, f"gemini:{claim_id}")
-            continue
-        
-        # Get evidence for this claim
         evidence = evidence_results.get(claim_id, {})
+        gemini_results[claim_id] = await _score_claim(job_id, idx, claim, evidence)
         
-        # Use Backboard to generate rubric scores
-        debug_log(job_id, f"STAGE 4.{idx} BACKBOARD CALL", "Calling score_claim_backboard_fallback()", {
-            "claim_text": claim["claim_text"],
-            "backboard_verdict": evidence.get("backboard_verdict"),
-            "sources_count": len(evidence.get("sources", []))
-        })
-        
-        backboard_score_response = await score_claim_backboard_fallback(
-            claim_text=claim["claim_text"],
-            backboard_verdict=evidence.get("backboard_verdict", "UNCLEAR"),
-            backboard_confidence=evidence.get("backboard_confidence", 50),
-            sources=evidence.get("sources", [])
-        )
-        
-        debug_log(job_id, f"STAGE 4.{idx} BACKBOARD RESPONSE", "Scores received", backboard_score_response)
-        
-        # Store per-claim result
-        cache.set_job_data(job_id, f"gemini:{claim_id}", backboard_score_response)
-        gemini_results[claim_id] = backboard_score_response
+        if claim_id not in finalized and await _finalize_claim(
+            job_id, idx, claim, evidence, gemini_results[claim_id]
+        ) is not None:
+            finalized.append(claim_id)
+            await cache.set_job_data(job_id, "finalized_claims", finalized)
     
-    cache.set_job_data(job_id, "gemini_report", gemini_results)
-    cache.set_job_status(job_id, "GEMINI_READY", f"Backboard scored {len(claims)} claims (Gemini disabled)")
+    await cache.set_job_data(job_id, "gemini_report", gemini_results)
+    await cache.set_job_status(job_id, "GEMINI_READY", f"Backboard scored {len(claims)} claims (Gemini disabled)")
     
     elapsed = time.time() - start_time
     debug_log(job_id, "STAGE 4 BACKBOARD END", f"Backboard scoring completed in {elapsed:.2f}s", {
@@ -353,6 +632,203 @@ async def stage_4_backboard_fallback_scoring(job_id: str) -> None:
     print(f"[{job_id}] Stage 4: Backboard fallback scored {len(claims)} claims")
 
 
+async def _score_claim(job_id: str, idx: int, claim: dict, evidence: dict) -> dict:
+    """Generate (or load cached) rubric scores for a single claim and checkpoint them."""
+    claim_id = claim["claim_id"]
+    
+    # Check cache
+    if await cache.cache_exists(job_id, f"gemini:{claim_id}"):
+        return await cache.get_job_data(job_id, f"gemini:{claim_id}")
+    
+    # Rubric already produced for this claim (or a near-duplicate) with the same verdict
+    verdict = str(evidence.get("backboard_verdict", "UNCLEAR"))
+    cached_score = await claim_cache.lookup(claim["claim_text"], claim.get("claim_type"), "rubric", verdict)
+    if cached_score is not None:
+        debug_log(job_id, f"STAGE 4.{idx} CLAIM CACHE HIT", f"Reusing shared rubric for claim {claim_id}")
+        await cache.set_job_data(job_id, f"gemini:{claim_id}", cached_score)
+        return cached_score
+    
+    # Use Backboard to generate rubric scores
+    debug_log(job_id, f"STAGE 4.{idx} BACKBOARD CALL", "Calling score_claim_backboard_fallback()", {
+        "claim_text": claim["claim_text"],
+        "backboard_verdict": evidence.get("backboard_verdict"),
+        "sources_count": len(evidence.get("sources", []))
+    })
+    
+    backboard_score_response = await score_claim_backboard_fallback(
+        claim_text=claim["claim_text"],
+        backboard_verdict=evidence.get("backboard_verdict", "UNCLEAR"),
+        backboard_confidence=evidence.get("backboard_confidence", 50),
+        sources=evidence.get("sources", [])
+    )
+    
+    debug_log(job_id, f"STAGE 4.{idx} BACKBOARD RESPONSE", "Scores received", backboard_score_response)
+    
+    if not backboard_score_response.get("api_error") and not evidence.get("api_error"):
+        await claim_cache.store(claim["claim_text"], claim.get("claim_type"), "rubric", backboard_score_response, verdict)
+    
+    # Store per-claim result
+    await cache.set_job_data(job_id, f"gemini:{claim_id}", backboard_score_response)
+    return backboard_score_response
+
+
+# ============================================================================
+# STAGES 3+4: Per-Claim Chains
+# ============================================================================
+
+async def stage_3_4_claim_chains(job_id: str) -> None:
+    """
+    Run each claim as its own verify -> score -> finalize chain.
+    
+    Removes the barrier between stage 3 and stage 4: a claim is scored as soon
+    as its own evidence is in, while other claims are still searching. The
+    per-claim evidence:{id}, gemini:{id} and final:{id} keys are the checkpoints,
+    and job progress is reported as aggregate counters.
+    """
+    start_time = time.time()
+    debug_log(job_id, "STAGE 3+4 START", "Beginning per-claim chains")
+    
+    data = await cache.get_multiple(job_id, ["claims", "finalized_claims"])
+    claims = data["claims"]
+    progress = {"total": len(claims), "verified": 0, "scored": 0, "finalized": 0}
+    await cache.set_job_status(job_id, "EVIDENCE_RETRIEVAL", _progress_message(progress), progress)
+    
+    if settings.CLAIM_BATCH_VERIFY_ENABLED:
+        # Verify up front in batches; each chain then starts from its evidence checkpoint
+        await _retrieve_evidence_batched(job_id, claims)
+    
+    # Keep the completion order of a resumed job so partial-result cursors stay valid
+    run_chain = _claim_chain_runner(job_id, progress, data["finalized_claims"] or [])
+    chain_results = await _gather_or_cancel([
+        run_chain(idx, claim) for idx, claim in enumerate(claims, 1)
+    ])
+    await _store_chain_results(job_id, claims, chain_results)
+    
+    elapsed = time.time() - start_time
+    debug_log(job_id, "STAGE 3+4 END", f"Claim chains completed in {elapsed:.2f}s", {
+        "progress": progress,
+        "written_to_cache": "evidence, gemini_report (+ evidence/gemini/final:{claim_id} for each)"
+    })
+    print(f"[{job_id}] Stages 3+4: Verified and scored {len(claims)} claims")
+
+
+async def stage_2_4_streaming_claim_chains(job_id: str) -> None:
+    """
+    Stream claim extraction and start each claim's chain as soon as it is parsed.
+    
+    Overlaps stage 2 with stages 3+4 to cut time-to-first-verdict. Jobs whose
+    claims are already checkpointed take the regular stage 2 -> chains path.
+    """
+    if await cache.cache_exists(job_id, "claims"):
+        await stage_2_claim_extraction(job_id)
+        if (await cache.get_job_status(job_id)).get("status") != "READY":
+            await stage_3_4_claim_chains(job_id)
+        return
+    
+    start_time = time.time()
+    await cache.set_job_status(job_id, "CLAIM_EXTRACTION", "Stage 2/5: Extracting claims...")
+    debug_log(job_id, "STAGE 2 STREAM START", "Beginning streaming claim extraction")
+    
+    normalized_text = await cache.get_job_data(job_id, "text")
+    
+    claims = []
+    chain_tasks = []
+    progress = {"total": 0, "verified": 0, "scored": 0, "finalized": 0}
+    run_chain = _claim_chain_runner(job_id, progress)
+    
+    try:
+        async with aclosing(stream_claims(normalized_text)) as claim_stream:
+            async for claim in claim_stream:
+                claims.append(claim)
+                progress["total"] = len(claims)
+                debug_log(job_id, f"STAGE 2.{len(claims)} CLAIM PARSED", "Starting claim chain", claim)
+                chain_tasks.append(asyncio.create_task(run_chain(len(claims), claim)))
+                if len(claims) >= settings.MAX_CLAIMS:
+                    break
+        
+        if not claims:
+            debug_log(job_id, "STAGE 2 NO CLAIMS", "⚠️ No claims extracted from text")
+            await _complete_without_claims(job_id)
+            print(f"[{job_id}] Stage 2: No claims extracted - job completed with empty result")
+            return
+        
+        await cache.set_job_data(job_id, "claims", claims)
+        await cache.set_job_data(job_id, "progress", progress)
+        print(f"[{job_id}] Stage 2: Streamed {len(claims)} claims in {time.time() - start_time:.2f}s")
+        
+        chain_results = await asyncio.gather(*chain_tasks)
+    except BaseException:
+        # A failed stream, write or chain fails the job; stop the other chains with it
+        await _cancel_all(chain_tasks)
+        raise
+    await _store_chain_results(job_id, claims, chain_results)
+    
+    elapsed = time.time() - start_time
+    debug_log(job_id, "STAGE 2-4 STREAM END", f"Streamed claims and chains completed in {elapsed:.2f}s", {
+        "progress": progress,
+        "written_to_cache": "claims, evidence, gemini_report (+ evidence/gemini/final:{claim_id} for each)"
+    })
+    print(f"[{job_id}] Stages 2-4: Verified and scored {len(claims)} streamed claims")
+
+
+def _claim_chain_runner(job_id: str, progress: dict, finalized: Optional[list] = None):
+    """
+    Build the verify -> score -> finalize coroutine shared by all claims of a job.
+    
+    Finished claims are appended to the job's `finalized_claims` list (claim IDs in
+    completion order), which /result?partial=true pages through with a cursor.
+    """
+    job_semaphore = asyncio.Semaphore(max(1, settings.CLAIM_CONCURRENCY_PER_JOB))
+    finalized = finalized if finalized is not None else []
+    
+    async def advance(step: str) -> None:
+        progress[step] += 1
+        await cache.set_job_status(job_id, "EVIDENCE_RETRIEVAL", _progress_message(progress), progress)
+    
+    async def run_chain(idx: int, claim: dict) -> tuple[dict, dict]:
+        with tracing.span(f"claim {idx}", "claim"):
+            return await chain(idx, claim)
+    
+    async def chain(idx: int, claim: dict) -> tuple[dict, dict]:
+        async with job_semaphore, _get_claim_semaphore():
+            evidence = await _retrieve_claim_evidence(job_id, idx, claim)
+        await advance("verified")
+        
+        async with job_semaphore, _get_claim_semaphore():
+            gemini = await _score_claim(job_id, idx, claim, evidence)
+        await advance("scored")
+        
+        if await _finalize_claim(job_id, idx, claim, evidence, gemini) is not None:
+            if claim["claim_id"] not in finalized:
+                finalized.append(claim["claim_id"])
+                await cache.set_job_data(job_id, "finalized_claims", finalized)
+        await advance("finalized")
+        return evidence, gemini
+    
+    return run_chain
+
+
+async def _store_chain_results(job_id: str, claims: list, chain_results: list) -> None:
+    """Aggregate per-claim chain outputs into the job-level evidence and gemini_report."""
+    evidence_results = {}
+    gemini_results = {}
+    for claim, (evidence, gemini) in zip(claims, chain_results):
+        evidence_results[claim["claim_id"]] = evidence
+        gemini_results[claim["claim_id"]] = gemini
+    
+    await cache.set_multiple(job_id, {"evidence": evidence_results, "gemini_report": gemini_results})
+    await cache.set_job_status(job_id, "GEMINI_READY", f"Verified and scored {len(claims)} claims")
+
+
+def _progress_message(progress: dict) -> str:
+    """Human-readable aggregate progress for the per-claim chains."""
+    total = progress["total"]
+    return (
+        f"Stage 3-4/5: Retrieving evidence & scoring - "
+        f"{progress['verified']}/{total} verified, {progress['scored']}/{total} scored"
+    )
+
+
 # ============================================================================
 # STAGE 5: Finalize Scoring
 # ============================================================================
@@ -360,12 +836,12 @@ async def stage_4_backboard_fallback_scoring(job_id: str) -> None:
 async def stage_5_finalize_scoring(job_id: str) -> None:
     """Apply backend scoring logic and build final result."""
     start_time = time.time()
-    cache.set_job_status(job_id, "SCORING", "Stage 5/5: Generating report...")
+    await cache.set_job_status(job_id, "SCORING", "Stage 5/5: Generating report...")
     debug_log(job_id, "STAGE 5 START", "Beginning final scoring")
     
-    # Get all data (include transcript text from Stage 1 / TwelveLabs)
-    data = cache.get_multiple(job_id, [
-        "type", "created_at", "timestamps", "text",
+    # Get all data
+    data = await cache.get_multiple(job_id, [
+        "type", "created_at", "timestamps",
         "claims", "evidence", "gemini_report"
     ])
     
@@ -378,91 +854,40 @@ async def stage_5_finalize_scoring(job_id: str) -> None:
     evidence_results = data["evidence"]
     gemini_results = data["gemini_report"]
     
+    # Claims already finalized by their per-claim chain
+    finalized = await cache.get_multiple(job_id, [f"final:{claim['claim_id']}" for claim in claims])
+    
     final_claims = []
     
     for idx, claim in enumerate(claims, 1):
         claim_id = claim["claim_id"]
         
-        # Get evidence and gemini results
-        evidence = evidence_results.get(claim_id, {})
-        gemini = gemini_results.get(claim_id, {})
-        
-        debug_log(job_id, f"STAGE 5.{idx} PROCESSING", f"Finalizing claim {claim_id}", {
-            "claim_text": claim["claim_text"],
-            "backboard_verdict": evidence.get("backboard_verdict"),
-            "gemini_scores": gemini.get("score_breakdown")
-        })
-        
-        # Finalize score using backend logic
-        try:
-            final_breakdown = finalize_claim_score(
-                gemini_response=gemini,
-                backboard_verdict=evidence.get("backboard_verdict", "UNCLEAR")
+        final_claim = finalized.get(f"final:{claim_id}")
+        if final_claim is None:
+            final_claim = await _finalize_claim(
+                job_id, idx, claim,
+                evidence_results.get(claim_id, {}),
+                gemini_results.get(claim_id, {})
             )
-            
-            # Verdict from Backboard SDK only (from verify_claim)
-            backboard_verdict_raw = evidence.get("backboard_verdict")
-            if backboard_verdict_raw and str(backboard_verdict_raw).upper() in ("SUPPORTED", "MOSTLY_SUPPORTED", "UNCLEAR", "MOSTLY_CONTRADICTED", "CONTRADICTED"):
-                final_verdict = str(backboard_verdict_raw).upper()
-            else:
-                final_verdict = map_score_to_verdict(final_breakdown.final_score)
-
-            debug_log(job_id, f"STAGE 5.{idx} SCORING", "Backend scoring complete", {
-                "base_points": final_breakdown.base_points,
-                "multiplier": final_breakdown.agreement_multiplier,
-                "final_score": final_breakdown.final_score,
-                "final_verdict": final_verdict,
-            })
-
-            # Explanation: from Backboard short_explanation or Backboard rationale from verify_claim
-            explanation = (gemini.get("short_explanation") or "").strip()
-            if not explanation and evidence.get("rationale"):
-                explanation = evidence.get("rationale", "").strip()
-            if not explanation:
-                explanation = f"Verdict: {final_verdict}. Score: {final_breakdown.final_score}/100 based on evidence."
-
-            final_claim = FinalClaim(
-                claim_id=claim_id,
-                claim_text=claim["claim_text"],
-                start_time=claim.get("start_time"),
-                end_time=claim.get("end_time"),
-                claim_type=claim["claim_type"],
-                final_verdict=final_verdict,  # From Backboard SDK only
-                fact_score=final_breakdown.final_score,
-                breakdown=final_breakdown,
-                explanation=explanation,
-                sources=[Source(**s) for s in evidence.get("sources", [])],
-                backboard_verdict=evidence.get("backboard_verdict"),
-                backboard_confidence=evidence.get("backboard_confidence"),
-            )
-            
-            debug_log(job_id, f"STAGE 5.{idx} SUCCESS", "Claim finalized", {
-                "claim_text": claim["claim_text"],
-                "final_verdict": final_verdict,
-                "fact_score": final_breakdown.final_score,
-                "sources_count": len(evidence.get("sources", []))
-            })
-            
-            final_claims.append(final_claim.model_dump())
-        
-        except Exception as e:
-            print(f"Error finalizing claim {claim_id}: {str(e)}")
-            continue
+        if final_claim is not None:
+            final_claims.append(final_claim)
     
-    # Build final result (include full transcript so frontend can show TwelveLabs output)
+    # Build final result (load_final_result() adds the transcript back from `text`)
     final_result = {
         "job_id": job_id,
         "input_type": data["type"],
-        "transcript_text": data.get("text") or "",
         "timestamps": data.get("timestamps"),
         "claims": final_claims,
-        "processing_time": None,  # TODO: Calculate if needed
+        "processing_time": tracing.elapsed(),  # seconds since the pipeline started
         "created_at": data.get("created_at", datetime.utcnow().isoformat())
     }
     
-    # Store final result
-    cache.set_job_data(job_id, "final_result", final_result)
-    cache.set_job_status(job_id, "READY", f"Finalized {len(final_claims)} claims")
+    # Store final result (and share it with future jobs on identical input)
+    await cache.set_job_data(job_id, "final_result", final_result)
+    await _store_cached_result(job_id, final_result, [
+        *claims, *evidence_results.values(), *gemini_results.values()
+    ])
+    await cache.set_job_status(job_id, "READY", f"Finalized {len(final_claims)} claims")
     
     elapsed = time.time() - start_time
     debug_log(job_id, "STAGE 5 END", f"Finalization complete in {elapsed:.2f}s", {
@@ -470,3 +895,72 @@ async def stage_5_finalize_scoring(job_id: str) -> None:
         "written_to_cache": "final_result"
     })
     print(f"[{job_id}] Stage 5: Finalized {len(final_claims)} claims")
+
+
+async def _finalize_claim(job_id: str, idx: int, claim: dict, evidence: dict, gemini: dict) -> Optional[dict]:
+    """Apply backend scoring to one claim, checkpoint it as final:{claim_id} and return it."""
+    claim_id = claim["claim_id"]
+    
+    debug_log(job_id, f"STAGE 5.{idx} PROCESSING", f"Finalizing claim {claim_id}", {
+        "claim_text": claim["claim_text"],
+        "backboard_verdict": evidence.get("backboard_verdict"),
+        "gemini_scores": gemini.get("score_breakdown")
+    })
+    
+    # Finalize score using backend logic
+    try:
+        final_breakdown = finalize_claim_score(
+            gemini_response=gemini,
+            backboard_verdict=evidence.get("backboard_verdict", "UNCLEAR")
+        )
+        
+        # Verdict from Backboard SDK only (from verify_claim)
+        backboard_verdict_raw = evidence.get("backboard_verdict")
+        if backboard_verdict_raw and str(backboard_verdict_raw).upper() in ("SUPPORTED", "MOSTLY_SUPPORTED", "UNCLEAR", "MOSTLY_CONTRADICTED", "CONTRADICTED"):
+            final_verdict = str(backboard_verdict_raw).upper()
+        else:
+            final_verdict = map_score_to_verdict(final_breakdown.final_score)
+
+        debug_log(job_id, f"STAGE 5.{idx} SCORING", "Backend scoring complete", {
+            "base_points": final_breakdown.base_points,
+            "multiplier": final_breakdown.agreement_multiplier,
+            "final_score": final_breakdown.final_score,
+            "final_verdict": final_verdict,
+        })
+
+        # Explanation: from Backboard short_explanation or Backboard rationale from verify_claim
+        explanation = (gemini.get("short_explanation") or "").strip()
+        if not explanation and evidence.get("rationale"):
+            explanation = evidence.get("rationale", "").strip()
+        if not explanation:
+            explanation = f"Verdict: {final_verdict}. Score: {final_breakdown.final_score}/100 based on evidence."
+
+        final_claim = FinalClaim(
+            claim_id=claim_id,
+            claim_text=claim["claim_text"],
+            start_time=claim.get("start_time"),
+            end_time=claim.get("end_time"),
+            claim_type=claim["claim_type"],
+            final_verdict=final_verdict,  # From Backboard SDK only
+            fact_score=final_breakdown.final_score,
+            breakdown=final_breakdown,
+            explanation=explanation,
+            sources=[Source(**s) for s in evidence.get("sources", [])],
+            backboard_verdict=evidence.get("backboard_verdict"),
+            backboard_confidence=evidence.get("backboard_confidence"),
+        )
+        
+        debug_log(job_id, f"STAGE 5.{idx} SUCCESS", "Claim finalized", {
+            "claim_text": claim["claim_text"],
+            "final_verdict": final_verdict,
+            "fact_score": final_breakdown.final_score,
+            "sources_count": len(evidence.get("sources", []))
+        })
+    
+    except Exception as e:
+        print(f"Error finalizing claim {claim_id}: {str(e)}")
+        return None
+    
+    final_claim_data = final_claim.model_dump()
+    await cache.set_job_data(job_id, f"final:{claim_id}", final_claim_data)
+    return final_claim_data
@@ -0,0 +1,125 @@
+"""Coalescing of identical in-flight LLM calls (single-flight) across jobs and nodes.
+
+When the same request (same prompt, same model) is already being sent, later
+callers wait for it and share its result instead of sending their own. Within
+a process they await the leader's future. Across processes and nodes the
+leader holds a cache lock named after the request hash, stores the result for
+COALESCE_RESULT_TTL seconds and announces it with a cache event; callers that
+lose the lock race wait for that event (or, on backends without cross-process
+events, re-check the stored result every COALESCE_POLL_INTERVAL seconds).
+
+Fallback results of failed calls (`api_error`) are only shared within the
+process; remote followers then send their own request.
+"""
+import asyncio
+import copy
+import hashlib
+import json
+from typing import Any, Awaitable, Callable
+
+from config import settings
+import metrics
+import tracing
+# Use mock cache for local development without Redis
+try:
+    from cache import cache
+except Exception:
+    from cache_mock import cache
+
+
+# Requests of this process in flight, by key
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def request_key(operation: str, request: Any) -> str:
+    """Key of a request: the operation plus a hash of everything that determines the response."""
+    material = json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return f"inflight:{operation}:{hashlib.sha256(material).hexdigest()}"
+
+
+def _shareable(result: Any) -> bool:
+    return not (isinstance(result, dict) and result.get("api_error"))
+
+
+async def coalesce(operation: str, request: Any, call: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return `call()`, or the result of an identical request already in flight.
+
+    `request` must hold everything the response depends on (prompt, model,
+    generation parameters). Every caller gets its own copy of the result.
+    """
+    if not settings.COALESCE_ENABLED:
+        return await call()
+
+    key = request_key(operation, request)
+    while (pending := _inflight.get(key)) is not None:
+        try:
+            with tracing.span(f"{operation}.coalesced", "coalesce"):
+                result = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if pending.cancelled():
+                continue  # the leader was cancelled, not us: try again
+            raise
+        metrics.COALESCED_CALLS.inc(operation=operation, source="local")
+        return copy.deepcopy(result)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await _call_once_across_nodes(operation, key, call)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # followers re-raise it; no "never retrieved" warning without them
+        raise
+    else:
+        # Followers copy from a snapshot, so the leader's caller may mutate its result
+        future.set_result(copy.deepcopy(result))
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _call_once_across_nodes(operation: str, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+    """Send the request unless another node is sending it; then share that node's result."""
+    async with cache.subscribe_events(key) as events:
+        while True:
+            stored = await cache.get_shared(key)
+            if stored is not None:
+                metrics.COALESCED_CALLS.inc(operation=operation, source="remote")
+                return stored["result"]
+
+            token = await cache.acquire_lock(key, settings.COALESCE_LOCK_TTL)
+            if token is not None:
+                return await _lead(key, token, call)
+
+            try:
+                event = await asyncio.wait_for(events.get(), settings.COALESCE_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                continue
+            if event.get("result") is None:
+                # The remote call failed; send our own instead of queueing behind the lock
+                return await call()
+            metrics.COALESCED_CALLS.inc(operation=operation, source="remote")
+            return event["result"]
+
+
+async def _lead(key: str, token: str, call: Callable[[], Awaitable[Any]]) -> Any:
+    shared = None
+    try:
+        # The previous holder may have stored a result between our read and the lock
+        stored = await cache.get_shared(key)
+        if stored is not None:
+            shared = stored["result"]
+            return shared
+
+        result = await call()
+        if _shareable(result):
+            shared = result
+            await cache.set_shared(key, {"result": shared}, settings.COALESCE_RESULT_TTL)
+        return result
+    finally:
+        await cache.release_lock(key, token)
+        await cache.publish_event(key, {"result": shared})
@@ -0,0 +1,38 @@
+"""In-process fan-out of job status events to /status/stream subscribers."""
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class StatusBroadcaster:
+    """
+    Delivers status events to every local subscriber of a job.
+
+    Each subscriber gets its own small queue. If a slow consumer falls behind,
+    its oldest events are dropped: only the latest status matters.
+    """
+
+    def __init__(self, max_pending: int = 32):
+        self.max_pending = max_pending
+        self.listeners = {}  # job_id -> set of asyncio.Queue
+
+    def publish(self, job_id: str, event: dict) -> None:
+        for queue in self.listeners.get(job_id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def watched_jobs(self) -> list[str]:
+        return list(self.listeners)
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str):
+        queue = asyncio.Queue(self.max_pending)
+        self.listeners.setdefault(job_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self.listeners.get(job_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self.listeners[job_id]
@@ -0,0 +1,110 @@
+"""Background garbage collection for expired jobs.
+
+Valkey expires job keys on its own (VALKEY_TTL). The sweeper cleans up what a
+TTL cannot: uploaded files on disk (once no job references them), job index
+entries and any job keys that outlived the rest of the job. It never scans the
+Valkey keyspace; expired jobs are found through the jobs:index sorted set
+written by initialize_job().
+"""
+import asyncio
+import os
+import time
+from typing import Optional
+
+from config import settings
+# Use mock cache for local development without Redis
+try:
+    from cache import cache
+except Exception:
+    from cache_mock import cache
+from uploads import upload_lock
+
+
+async def _remove_unreferenced_upload(path: str) -> bool:
+    """
+    Delete an uploaded file unless a job references it.
+    
+    The references are re-checked under the upload's lock: a new identical
+    upload registers its reference under the same lock before publishing the
+    file, so it cannot be deleted in between.
+    """
+    async with upload_lock(path):
+        if await cache.count_upload_refs(path):
+            return False
+        return _remove_upload(path)
+
+
+def _remove_upload(path: Optional[str]) -> bool:
+    """Delete an uploaded file if it is still there."""
+    if not path:
+        return False
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        print(f"⚠️  Sweeper could not remove {path}: {e}")
+        return False
+
+
+async def _sweep_orphan_uploads(older_than: float) -> int:
+    """
+    Remove old upload files nobody references (e.g. jobs lost with the mock cache).
+    
+    Covers abandoned partial uploads and files stored per job ID before uploads
+    became content-addressed, which are kept while their job still exists.
+    """
+    if not os.path.isdir(settings.UPLOAD_DIR):
+        return 0
+    removed = 0
+    for entry in os.scandir(settings.UPLOAD_DIR):
+        if not entry.is_file() or entry.stat().st_mtime > older_than:
+            continue
+        path = os.path.abspath(entry.path)
+        if await cache.count_upload_refs(path):
+            continue
+        job_id = os.path.splitext(entry.name)[0]
+        status = await cache.get_job_status(job_id)
+        if status["status"] is None and await _remove_unreferenced_upload(path):
+            removed += 1
+    return removed
+
+
+async def sweep_expired_jobs() -> int:
+    """
+    Run one sweep and return the number of jobs removed.
+    
+    A job becomes a candidate VALKEY_TTL after it was registered. Jobs whose
+    status is still present (the pipeline kept writing, refreshing TTLs) are
+    re-registered and checked again on a later sweep.
+    """
+    older_than = time.time() - settings.VALKEY_TTL
+    removed = 0
+    for job_id in await cache.get_stale_jobs(older_than, settings.SWEEPER_BATCH_SIZE):
+        status = await cache.get_job_status(job_id)
+        if status["status"] is not None:
+            await cache.track_job(job_id)
+            continue
+        # Uploads are shared by identical submissions: delete only the last reference
+        upload_path = await cache.get_job_upload(job_id)
+        remaining_refs = await cache.release_upload(job_id, upload_path) if upload_path else 0
+        await cache.delete_job(job_id)
+        if upload_path and not remaining_refs:
+            await _remove_unreferenced_upload(upload_path)
+        removed += 1
+    
+    orphans = await _sweep_orphan_uploads(older_than)
+    if removed or orphans:
+        print(f"🧹 Sweeper removed {removed} expired jobs and {orphans} orphaned uploads")
+    return removed
+
+
+async def run_sweeper() -> None:
+    """Sweep every SWEEPER_INTERVAL seconds until cancelled."""
+    while True:
+        try:
+            await sweep_expired_jobs()
+        except Exception as e:
+            print(f"⚠️  Sweeper failed: {e}")
+        await asyncio.sleep(settings.SWEEPER_INTERVAL)
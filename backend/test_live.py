@@ -30,14 +30,14 @@ async def main():
     print(f"{'='*80}\n")
     
     # Initialize job
-    cache.initialize_job(job_id, "text", test_text)
-    cache.set_job_data(job_id, "client_id", "test-debug-client")
+    await cache.initialize_job(job_id, "text", test_text)
+    await cache.set_job_data(job_id, "client_id", "test-debug-client")
     
     # Run pipeline
     await process_pipeline(job_id)
     
     # Get result
-    result = cache.get_job_data(job_id, "final_result")
+    result = await cache.get_job_data(job_id, "final_result")
     
     print(f"\n{'='*80}")
     print(f"FINAL RESULT")
@@ -47,7 +47,7 @@ async def test_full_pipeline():
     })
     
     # Initialize job
-    cache.initialize_job(job_id, "text", test_text)
+    await cache.initialize_job(job_id, "text", test_text)
     
     # ========================================================================
     # STAGE 1: Text Extraction (trivial for text input)
@@ -55,7 +55,7 @@ async def test_full_pipeline():
     log("STAGE 1: TEXT EXTRACTION", "Extracting text from input")
     
     try:
-        cache.set_job_data(job_id, "text", test_text)
+        await cache.set_job_data(job_id, "text", test_text)
         log("STAGE 1: SUCCESS", f"Extracted text", {"text": test_text, "length": len(test_text)})
     except Exception as e:
         log("STAGE 1: FAILED", f"Error: {str(e)}")
@@ -68,7 +68,7 @@ async def test_full_pipeline():
     
     try:
         claims = await extract_claims(test_text)
-        cache.set_job_data(job_id, "claims", claims)
+        await cache.set_job_data(job_id, "claims", claims)
         log("STAGE 2: SUCCESS", f"Extracted {len(claims)} claims", {"claims": claims})
     except Exception as e:
         log("STAGE 2: FAILED", f"Error: {str(e)}")
@@ -113,7 +113,7 @@ async def test_full_pipeline():
                 "error": str(e)
             }
     
-    cache.set_job_data(job_id, "evidence", evidence_results)
+    await cache.set_job_data(job_id, "evidence", evidence_results)
     
     # ========================================================================
     # STAGE 4: Gemini Scoring (or Backboard fallback)
@@ -187,7 +187,7 @@ async def test_full_pipeline():
                 import traceback
                 print(traceback.format_exc())
     
-    cache.set_job_data(job_id, "gemini_report", gemini_results)
+    await cache.set_job_data(job_id, "gemini_report", gemini_results)
     
     # ========================================================================
     # STAGE 5: Final Scoring
@@ -244,8 +244,8 @@ async def test_full_pipeline():
         "created_at": datetime.utcnow().isoformat()
     }
     
-    cache.set_job_data(job_id, "final_result", final_result)
-    cache.set_job_status(job_id, "READY", "Test complete")
+    await cache.set_job_data(job_id, "final_result", final_result)
+    await cache.set_job_status(job_id, "READY", "Test complete")
     
     log("FINAL RESULT", "Pipeline completed successfully", final_result)
     
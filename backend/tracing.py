@@ -0,0 +1,161 @@
+"""Per-job execution traces: a span for every stage, external call and cache operation.
+
+A trace is bound to the running pipeline through a context variable, so spans
+opened anywhere below process_pipeline() (including the per-claim chain
+tasks, which inherit the context) land in that job's trace without passing it
+around. Outside a pipeline, span() is a no-op.
+
+Spans are kept compactly as [name, category, start_ms, duration_ms, parent,
+error] rows relative to the trace start (monotonic clock), stored as the
+job's `trace` field when the pipeline ends and expanded by expand() for
+GET /trace.
+"""
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from config import settings
+
+
+class Trace:
+    """Spans recorded for one pipeline run."""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.started = time.monotonic()
+        self.started_at = datetime.utcnow().isoformat()
+        self.finished: Optional[float] = None
+        self.spans = []
+        self.dropped = 0
+
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    def compact(self) -> dict:
+        return {
+            "started_at": self.started_at,
+            "duration_ms": round(self.elapsed() * 1000, 3),
+            "spans": self.spans,
+            "dropped": self.dropped,
+        }
+
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("proofpulse_trace", default=None)
+_parent: ContextVar[Optional[int]] = ContextVar("proofpulse_trace_parent", default=None)
+
+# Traces of pipelines running in this process, for GET /trace on unfinished jobs
+ACTIVE_TRACES: dict[str, Trace] = {}
+
+
+def begin(job_id: str):
+    """Start tracing the current pipeline run; returns the token for finish()."""
+    trace = Trace(job_id)
+    ACTIVE_TRACES[job_id] = trace
+    _parent.set(None)
+    return _trace.set(trace)
+
+
+def finish(token) -> Optional[dict]:
+    """
+    Stop tracing and return the compact trace (spans after this are not recorded).
+
+    The trace stays in ACTIVE_TRACES until release(), so GET /trace keeps
+    finding it while it is being stored.
+    """
+    trace = _trace.get()
+    _trace.reset(token)
+    if trace is None:
+        return None
+    trace.finished = time.monotonic()
+    return trace.compact()
+
+
+def release(job_id: str) -> None:
+    """Forget a finished trace once it has been stored (or could not be)."""
+    ACTIVE_TRACES.pop(job_id, None)
+
+
+def elapsed() -> Optional[float]:
+    """Seconds since the current trace started, or None outside a pipeline."""
+    trace = _trace.get()
+    return round(trace.elapsed(), 3) if trace is not None else None
+
+
+@contextmanager
+def span(name: str, category: str = "internal"):
+    """Record the enclosed block as a span of the current trace, nested under the enclosing span."""
+    trace = _trace.get()
+    if trace is None:
+        yield
+        return
+    if len(trace.spans) >= settings.TRACE_MAX_SPANS:
+        trace.dropped += 1
+        yield
+        return
+
+    start = time.monotonic()
+    record = [name, category, round((start - trace.started) * 1000, 3), None, _parent.get(), 0]
+    trace.spans.append(record)
+    previous = _parent.get()
+    token = _parent.set(len(trace.spans) - 1)
+    try:
+        yield
+    except Exception:
+        record[5] = 1
+        raise
+    finally:
+        record[3] = round((time.monotonic() - start) * 1000, 3)
+        try:
+            _parent.reset(token)
+        except ValueError:
+            # Closed from another context (e.g. an async generator finalized elsewhere)
+            _parent.set(previous)
+
+
+def trace_methods(category: str):
+    """Class decorator: trace every public coroutine method as `{category}.{name}`."""
+    def decorate(cls):
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.iscoroutinefunction(method):
+                continue
+            setattr(cls, name, _traced(method, f"{category}.{name}", category))
+        return cls
+    return decorate
+
+
+def _traced(method, span_name: str, category: str):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        if _trace.get() is None:
+            return await method(*args, **kwargs)
+        with span(span_name, category):
+            return await method(*args, **kwargs)
+    return wrapper
+
+
+def expand(stored: Optional[dict], job_id: str) -> Optional[dict]:
+    """Turn a compact trace into waterfall-ready JSON (one object per span)."""
+    if not stored:
+        return None
+    return {
+        "job_id": job_id,
+        "started_at": stored["started_at"],
+        "duration_ms": stored["duration_ms"],
+        "dropped_spans": stored.get("dropped", 0),
+        "spans": [
+            {
+                "id": index,
+                "parent_id": parent,
+                "name": name,
+                "category": category,
+                "start_ms": start_ms,
+                "duration_ms": duration_ms,
+                "error": bool(error),
+            }
+            for index, (name, category, start_ms, duration_ms, parent, error) in enumerate(stored["spans"])
+        ],
+    }
@@ -0,0 +1,146 @@
+"""Size-limited, chunked, content-addressed storage of uploaded files.
+
+Files are stored under UPLOAD_DIR as {sha256}{ext}, so identical uploads share
+one file. Each job using a file holds a reference in the cache
+(register_upload / release_upload); the sweeper deletes a file once its last
+reference is released. Publishing a file and deleting it both happen under
+upload_lock(), so a new reference cannot slip in between the sweeper's last
+check and its delete.
+"""
+import asyncio
+import hashlib
+import os
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO
+
+from fastapi import HTTPException
+from starlette.responses import PlainTextResponse
+
+from config import settings
+# Use mock cache for local development without Redis
+try:
+    from cache import cache
+except Exception:
+    from cache_mock import cache
+
+
+# Room for the multipart boundaries and the small form fields next to the file
+FORM_OVERHEAD_BYTES = 64 * 1024
+UPLOAD_LOCK_TTL = 30  # seconds; frees the lock of a process that died holding it
+UPLOAD_LOCK_POLL_INTERVAL = 0.05
+
+
+class UploadTooLarge(HTTPException):
+    """Raised while an upload is still arriving once it exceeds MAX_FILE_SIZE."""
+
+    def __init__(self):
+        super().__init__(413, "File too large")
+
+
+class UploadLimitMiddleware:
+    """
+    Enforce MAX_FILE_SIZE on upload request bodies as they arrive.
+
+    Requests announcing a larger Content-Length are rejected before any of the
+    body is read. Bodies sent without one (chunked) are counted while the form is
+    parsed, and parsing aborts as soon as the limit is crossed instead of after
+    the whole file has been spooled to disk.
+    """
+
+    def __init__(self, app, paths: tuple[str, ...] = ("/ingest",)):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.MAX_FILE_SIZE + FORM_OVERHEAD_BYTES
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            response = PlainTextResponse("File too large", status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise UploadTooLarge()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def _copy_upload(source: BinaryIO, dest_path: str) -> tuple[int, str]:
+    """Copy `source` to `dest_path` in chunks, returning (size, sha256 hex digest)."""
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(dest_path, "wb") as dest:
+            while chunk := source.read(settings.UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_FILE_SIZE:
+                    raise UploadTooLarge()
+                digest.update(chunk)
+                dest.write(chunk)
+    except BaseException:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        raise
+    return size, digest.hexdigest()
+
+
+async def save_upload(source: BinaryIO, dest_path: str) -> tuple[int, str]:
+    """
+    Stream an uploaded file to `dest_path` in a worker thread.
+
+    Only one chunk is held in memory at a time; the SHA-256 of the content is
+    computed during the copy. A partially written file is removed on failure.
+    """
+    source.seek(0)
+    return await asyncio.to_thread(_copy_upload, source, dest_path)
+
+
+@asynccontextmanager
+async def upload_lock(path: str) -> AsyncIterator[None]:
+    """Hold the cross-process lock that orders publishing and deleting the stored file `path`."""
+    name = f"upload:{path}"
+    while (token := await cache.acquire_lock(name, UPLOAD_LOCK_TTL)) is None:
+        await asyncio.sleep(UPLOAD_LOCK_POLL_INTERVAL)
+    try:
+        yield
+    finally:
+        await cache.release_lock(name, token)
+
+
+async def store_upload(source: BinaryIO, file_ext: str, job_id: str) -> tuple[str, int, str]:
+    """
+    Store an upload content-addressed for `job_id` and return (absolute path, size, sha256).
+
+    The content is first streamed to a temporary file, since its hash is only
+    known at the end, then renamed onto {sha256}{ext}. The job's reference is
+    registered before the rename, under upload_lock(): a duplicate upload
+    either replaces the file after the sweeper deleted it, or keeps the
+    sweeper from deleting it.
+    """
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    temp_path = os.path.abspath(os.path.join(settings.UPLOAD_DIR, f".{uuid.uuid4().hex}.part"))
+    size, upload_hash = await save_upload(source, temp_path)
+    
+    path = os.path.abspath(os.path.join(settings.UPLOAD_DIR, f"{upload_hash}{file_ext}"))
+    try:
+        async with upload_lock(path):
+            await cache.register_upload(job_id, path)
+            os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return path, size, upload_hash
@@ -0,0 +1,168 @@
+"""Pipeline worker pool consuming the Valkey job queue.
+
+The API only enqueues job IDs (JOB_QUEUE_ENABLED=true); one or more worker
+processes pull them off the queue and run the pipeline, so pipeline load
+never competes with HTTP traffic and API nodes scale independently.
+
+Run: python worker.py --concurrency 4 --processes 2
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+
+from config import settings
+# Use mock cache for local development without Redis
+try:
+    from cache import cache
+except Exception:
+    from cache_mock import cache
+from pipeline import process_pipeline
+from integrations.backboard import bootstrap_assistant, run_thread_pool
+import metrics
+
+
+# Seconds a consumer waits after an error before polling again (doubling up to the max)
+CONSUMER_BACKOFF_MIN = 1.0
+CONSUMER_BACKOFF_MAX = 30.0
+
+
+async def run_worker(concurrency: int, recover: bool = False, metrics_port: int = 0) -> None:
+    """
+    Run `concurrency` queue consumers in this process until SIGINT/SIGTERM.
+
+    Each consumer blocks on the queue, runs one job at a time and acks it once
+    the pipeline has finished (successfully or with FAILED status). Every
+    WORKER_LEASE_TTL / 2 seconds the process also requeues jobs whose lease
+    expired (their worker died); `recover` does that once more right at
+    startup. With a `metrics_port`, this process's pipeline metrics are served
+    there.
+    """
+    loop = asyncio.get_running_loop()
+    stopping = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    metrics_server = None
+    if metrics_port:
+        metrics_server = await metrics.serve_metrics(metrics_port)
+        print(f"[worker {os.getpid()}] Serving metrics on port {metrics_port}")
+
+    if recover:
+        moved = await cache.requeue_processing_jobs()
+        print(f"[worker {os.getpid()}] Re-queued {moved} jobs with expired leases")
+
+    await bootstrap_assistant()
+    thread_pool = None
+    if settings.BACKBOARD_API_KEY and settings.BACKBOARD_THREAD_POOL_SIZE > 0:
+        thread_pool = asyncio.create_task(run_thread_pool())
+
+    async def requeue_expired() -> None:
+        # Every worker keeps checking: a crashed worker's leases only expire after WORKER_LEASE_TTL
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(stopping.wait(), settings.WORKER_LEASE_TTL / 2)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                return
+            try:
+                moved = await cache.requeue_processing_jobs()
+                if moved:
+                    print(f"[worker {os.getpid()}] Re-queued {moved} jobs with expired leases")
+            except Exception as e:
+                print(f"⚠️  [worker {os.getpid()}] Lease recovery failed: {e}")
+
+    async def keep_leased(job_id: str) -> None:
+        # Renew well before expiry so a slow cache round trip does not let recovery take the job
+        while True:
+            await asyncio.sleep(settings.WORKER_LEASE_TTL / 3)
+            try:
+                await cache.renew_job_lease(job_id)
+            except Exception as e:
+                print(f"⚠️  [worker {os.getpid()}] Lease renewal failed for job {job_id}: {e}")
+
+    async def consume(slot: int) -> None:
+        backoff = CONSUMER_BACKOFF_MIN
+        while not stopping.is_set():
+            try:
+                job_id = await cache.dequeue_job(settings.WORKER_POLL_TIMEOUT)
+                if not job_id:
+                    continue
+                print(f"[worker {os.getpid()}:{slot}] Processing job {job_id}")
+                heartbeat = asyncio.create_task(keep_leased(job_id))
+                try:
+                    await process_pipeline(job_id)
+                finally:
+                    heartbeat.cancel()
+                    await cache.ack_job(job_id)
+                backoff = CONSUMER_BACKOFF_MIN
+            except Exception as e:
+                # A cache outage or a failing pipeline write must not stop this consumer
+                print(f"⚠️  [worker {os.getpid()}:{slot}] Consumer error, retrying in {backoff:g}s: {e}")
+                try:
+                    await asyncio.wait_for(stopping.wait(), backoff)
+                except asyncio.TimeoutError:
+                    pass
+                backoff = min(backoff * 2, CONSUMER_BACKOFF_MAX)
+
+    print(f"[worker {os.getpid()}] Started with concurrency={concurrency}")
+    recovery = asyncio.create_task(requeue_expired())
+    await asyncio.gather(*[consume(slot) for slot in range(concurrency)])
+    recovery.cancel()
+    if thread_pool is not None:
+        thread_pool.cancel()
+    await cache.flush()
+    if metrics_server is not None:
+        metrics_server.close()
+    print(f"[worker {os.getpid()}] Stopped")
+
+
+def _run_process(concurrency: int, recover: bool, metrics_port: int = 0) -> None:
+    """Entry point for one worker process."""
+    if not cache.shared:
+        # Fell back to the in-memory cache: the API's queue is unreachable from here
+        raise SystemExit(f"[worker {os.getpid()}] The cache is not shared with the API "
+                         f"(Valkey unreachable?); refusing to start")
+    asyncio.run(run_worker(concurrency, recover, metrics_port))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ProofPulse pipeline worker")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY,
+                        help="concurrent jobs per worker process")
+    parser.add_argument("--processes", type=int, default=settings.WORKER_PROCESSES,
+                        help="number of worker processes")
+    parser.add_argument("--recover", action="store_true",
+                        help="also re-queue expired jobs right at startup (workers check every WORKER_LEASE_TTL/2)")
+    parser.add_argument("--metrics-port", type=int, default=settings.WORKER_METRICS_PORT,
+                        help="serve Prometheus metrics on this port (process i uses port + i); 0 disables")
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        _run_process(args.concurrency, args.recover, args.metrics_port)
+        return
+
+    processes = [
+        multiprocessing.Process(
+            target=_run_process,
+            args=(args.concurrency, args.recover and i == 0, args.metrics_port and args.metrics_port + i),
+            name=f"proofpulse-worker-{i}",
+        )
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    # Forward SIGTERM so every child drains its in-flight jobs before exiting
+    signal.signal(signal.SIGTERM, lambda *_: [process.terminate() for process in processes])
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()